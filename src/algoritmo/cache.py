@@ -0,0 +1,195 @@
+"""
+Cache de resultados de otimização, endereçado pelo conteúdo da entrada.
+
+A chave é um hash SHA-256 de uma representação canônica da chapa, das peças
+(na ordem dada, que influencia o resultado) e das opções do motor. Os
+resultados ficam em memória com descarte LRU e, opcionalmente, também em
+disco, um arquivo JSON por chave, para sobreviver entre execuções.
+"""
+import copy
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+
+from .corte import cortar_chapas
+from .espacos import normalizar_refilo
+from .modelo import Peca, ResultadoCorte
+
+# Valores de 'interrompida' (veja progressivo.cortar_chapas_progressivo) com
+# que o resultado pode ir para o cache: busca completa ou limitada por
+# número de iterações, que é reprodutível
+INTERRUPCOES_DEFINITIVAS = (None, 'iteracoes')
+
+
+def chave_canonica(largura_chapa: float, altura_chapa: float, pecas: list, **opcoes) -> str:
+    """
+    Hash canônico de uma otimização.
+
+    Args:
+        largura_chapa: Largura da chapa
+        altura_chapa: Altura da chapa
+        pecas: Lista de peças (objetos Peca ou dicionários)
+        **opcoes: Opções repassadas a cortar_chapas
+
+    Returns:
+        Hash hexadecimal da entrada
+    """
+    if 'refilo' in opcoes:
+        opcoes['refilo'] = [float(v) for v in normalizar_refilo(opcoes['refilo'])]
+    if 'kerf' in opcoes:
+        opcoes['kerf'] = float(opcoes['kerf'])
+    pecas = [p if isinstance(p, Peca) else Peca.de_dict(p) for p in pecas]
+    entrada = {
+        'chapa': [float(largura_chapa), float(altura_chapa)],
+        'pecas': [[str(p.id), float(p.largura), float(p.altura), p.original_idx,
+                   int(p.quantidade), bool(p.pode_rotacionar)] for p in pecas],
+        'opcoes': opcoes,
+    }
+    texto = json.dumps(entrada, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(texto.encode('utf-8')).hexdigest()
+
+
+class CacheResultados:
+    """
+    Resultados de cortar_chapas por chave, em memória (LRU) e opcionalmente em disco.
+
+    Os resultados são copiados ao entrar e ao sair do cache, pois a interface
+    altera as chapas retornadas (por exemplo, ao redimensionar uma peça). O
+    acesso é protegido por uma trava, já que a otimização roda em uma
+    thread de trabalho.
+    """
+
+    def __init__(self, capacidade: int = 64, pasta: str = None):
+        """
+        Args:
+            capacidade: Número máximo de resultados mantidos em memória
+            pasta: Pasta do cache em disco (None desativa o disco)
+        """
+        self.capacidade = capacidade
+        self.pasta = pasta
+        self.acertos = 0
+        self.faltas = 0
+        self._memoria = OrderedDict()
+        self._trava = threading.Lock()
+        if pasta:
+            os.makedirs(pasta, exist_ok=True)
+
+    def __len__(self):
+        return len(self._memoria)
+
+    def obter(self, chave: str):
+        """
+        Busca um resultado, primeiro em memória e depois em disco.
+
+        Returns:
+            Tupla (dados, origem), com origem 'memoria' ou 'disco', ou None
+        """
+        with self._trava:
+            if chave in self._memoria:
+                self._memoria.move_to_end(chave)
+                self.acertos += 1
+                return copy.deepcopy(self._memoria[chave]), 'memoria'
+
+        dados = self._ler_disco(chave)
+        with self._trava:
+            if dados is None:
+                self.faltas += 1
+                return None
+            self.acertos += 1
+            self._guardar_memoria(chave, dados)
+            return copy.deepcopy(dados), 'disco'
+
+    def guardar(self, chave: str, dados: dict):
+        """Guarda um resultado em memória e, se configurado, em disco."""
+        dados = copy.deepcopy(dados)
+        with self._trava:
+            self._guardar_memoria(chave, dados)
+        if self.pasta:
+            caminho = self._caminho(chave)
+            temporario = f"{caminho}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(temporario, 'w', encoding='utf-8') as f:
+                json.dump(dados, f, ensure_ascii=False)
+            # Troca atômica, para que outro processo nunca leia um arquivo pela metade
+            os.replace(temporario, caminho)
+
+    def limpar(self):
+        """Esvazia o cache em memória (o disco é mantido)."""
+        with self._trava:
+            self._memoria.clear()
+
+    def _guardar_memoria(self, chave: str, dados: dict):
+        self._memoria[chave] = dados
+        self._memoria.move_to_end(chave)
+        while len(self._memoria) > self.capacidade:
+            self._memoria.popitem(last=False)
+
+    def _caminho(self, chave: str) -> str:
+        return os.path.join(self.pasta, f"{chave}.json")
+
+    def _ler_disco(self, chave: str):
+        if not self.pasta:
+            return None
+        try:
+            with open(self._caminho(chave), encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+
+def cortar_chapas_com_cache(largura_chapa_cm: float, altura_chapa_cm: float, pecas: list,
+                            cache: CacheResultados, estatisticas: dict = None,
+                            otimizador=cortar_chapas, ao_progredir=None,
+                            **opcoes) -> tuple:
+    """
+    cortar_chapas com os resultados guardados em um CacheResultados.
+
+    Resultados de buscas canceladas ou interrompidas pelo prazo são
+    retornados, mas não guardados (veja INTERRUPCOES_DEFINITIVAS).
+
+    Args:
+        largura_chapa_cm: Largura da chapa em centímetros
+        altura_chapa_cm: Altura da chapa em centímetros
+        pecas: Lista de peças (veja cortar_chapas)
+        cache: Cache onde buscar e guardar o resultado
+        estatisticas: Dicionário opcional preenchido com as estatísticas da
+            otimização original e com 'cache' (None, 'memoria' ou 'disco')
+        otimizador: Função de otimização com a assinatura de cortar_chapas
+            (por exemplo, progressivo.cortar_chapas_progressivo)
+        ao_progredir: Repassado ao otimizador, se informado. Não faz parte
+            da chave do cache
+        **opcoes: Opções repassadas ao otimizador
+
+    Returns:
+        O mesmo que cortar_chapas. Vindo do cache, os tempos são os da
+        otimização original
+    """
+    if otimizador is cortar_chapas:
+        chave = chave_canonica(largura_chapa_cm, altura_chapa_cm, pecas, **opcoes)
+    else:
+        chave = chave_canonica(largura_chapa_cm, altura_chapa_cm, pecas,
+                               otimizador=otimizador.__name__, **opcoes)
+    encontrado = cache.obter(chave)
+    if encontrado is not None:
+        dados, origem = encontrado
+    else:
+        origem = None
+        relatorio = {}
+        if ao_progredir is not None:
+            opcoes['ao_progredir'] = ao_progredir
+        chapas, nao_alocadas = otimizador(largura_chapa_cm, altura_chapa_cm, pecas,
+                                          estatisticas=relatorio, **opcoes)
+        dados = {'chapas': chapas, 'nao_alocadas': nao_alocadas, 'estatisticas': relatorio}
+        # Uma busca cancelada ou cortada pelo prazo não tem o resultado
+        # definitivo: o do prazo depende da carga da máquina, e guardá-lo
+        # impediria que a mesma entrada fosse otimizada de novo
+        if relatorio.get('interrompida') in INTERRUPCOES_DEFINITIVAS:
+            cache.guardar(chave, dados)
+
+    if estatisticas is not None:
+        estatisticas.update(dados['estatisticas'])
+        estatisticas['cache'] = origem
+    return ResultadoCorte(dados['chapas'], dados['nao_alocadas'], largura_chapa_cm,
+                          altura_chapa_cm, opcoes.get('kerf', 0.0), opcoes.get('refilo', 0.0),
+                          dados['estatisticas'].get('tempos'))
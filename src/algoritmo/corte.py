@@ -1,271 +1,463 @@
-def cortar_chapas(largura_chapa_cm: float, altura_chapa_cm: float, pecas: list) -> tuple:
+import time
+
+from . import instrumentacao
+from .espacos import IndiceEspacos
+from .estoque import EstoqueChapas
+from .heuristicas import HEURISTICA_PADRAO, criar_espacos, validar_heuristica
+from .melhoria import melhorar_layout
+from .modelo import Chapa, Peca, ResultadoCorte, TipoChapa
+
+# Critérios de ordenação das peças antes da alocação (sempre decrescente)
+ORDENACOES = {
+    'area': lambda p: p.area,
+    'maior-lado': lambda p: max(p.largura, p.altura),
+    'perimetro': lambda p: p.largura + p.altura,
+    'largura': lambda p: p.largura,
+    'altura': lambda p: p.altura,
+}
+
+ORDENACAO_PADRAO = 'area'
+
+
+def cortar_chapas(largura_chapa_cm: float, altura_chapa_cm: float, pecas: list,
+                  heuristica: str = HEURISTICA_PADRAO, ordenacao: str = ORDENACAO_PADRAO,
+                  max_iteracoes_melhoria: int = None, tempo_limite_melhoria: float = None,
+                  estatisticas: dict = None, kerf: float = 0.0, refilo=0.0) -> tuple:
     """
     Algoritmo de otimização de corte de chapas.
-    
+
     Args:
         largura_chapa_cm: Largura da chapa em centímetros
         altura_chapa_cm: Altura da chapa em centímetros
-        pecas: Lista de peças a serem cortadas, cada peça é um dicionário com:
+        pecas: Lista de peças a serem cortadas, como objetos Peca ou
+            dicionários com:
             - id: identificador da peça
             - larg: largura em centímetros
             - alt: altura em centímetros
             - original_idx: índice original da peça
-            
+            - quant: quantidade de cópias (opcional, padrão 1)
+            - pode_rotacionar: se a peça pode ser girada 90° (opcional, padrão True)
+        heuristica: Nome da heurística de posicionamento (veja
+            algoritmo.heuristicas.HEURISTICAS)
+        ordenacao: Ordem em que as peças são alocadas (veja ORDENACOES)
+        max_iteracoes_melhoria: Limite de tentativas da etapa de melhoria
+        tempo_limite_melhoria: Limite de tempo (s) da etapa de melhoria
+        estatisticas: Dicionário opcional preenchido com o relatório da
+            etapa de melhoria (veja melhorar_layout)
+        kerf: Espessura do corte da serra, deixada entre peças vizinhas
+        refilo: Faixa descartada nas bordas da chapa. Um valor para todas
+            as bordas ou (esquerda, superior, direita, inferior)
+
     Returns:
-        Tuple contendo:
+        ResultadoCorte, que se desempacota como a tupla:
         - Lista de chapas com suas peças alocadas
-        - Lista de peças não alocadas
+        - Lista de peças não alocadas, com a quantidade que ficou sem chapa
+        e traz também as métricas do plano e os tempos de cada etapa
     """
-    # Ordena as peças por área (maior para menor)
-    pecas_ordenadas = sorted(pecas, key=lambda p: p['larg'] * p['alt'], reverse=True)
-    
-    # Lista para armazenar as chapas cortadas
-    chapas_cortadas = []
-    pecas_nao_alocadas = []
-    
-    # Função para verificar se uma peça cabe em um espaço
-    def peca_cabe_em_espaco(peca, espaco):
-        # Verifica se a peça tem as propriedades originais ou alocadas
-        largura = peca.get('larg', peca.get('largura', 0))
-        altura = peca.get('alt', peca.get('altura', 0))
-        return (largura <= espaco['largura'] and 
-                altura <= espaco['altura'])
-    
-    # Função para criar novos espaços após colocar uma peça
-    def criar_novos_espacos(espaco, peca):
-        novos_espacos = []
-        
-        # Obtém as dimensões da peça
-        largura = peca.get('larg', peca.get('largura', 0))
-        altura = peca.get('alt', peca.get('altura', 0))
-        
-        # Espaço à direita da peça
-        if espaco['largura'] - largura > 0:
-            novos_espacos.append({
-                'x': espaco['x'] + largura,
-                'y': espaco['y'],
-                'largura': espaco['largura'] - largura,
-                'altura': altura
-            })
-            
-        # Espaço abaixo da peça
-        if espaco['altura'] - altura > 0:
-            novos_espacos.append({
-                'x': espaco['x'],
-                'y': espaco['y'] + altura,
-                'largura': espaco['largura'],
-                'altura': espaco['altura'] - altura
-            })
-            
-        return novos_espacos
-    
-    # Função para encontrar o melhor espaço para uma peça
-    def encontrar_melhor_espaco(peca, espacos):
-        melhor_espaco = None
-        melhor_pontuacao = float('inf')
-        
-        for espaco in espacos:
-            if peca_cabe_em_espaco(peca, espaco):
-                # Obtém as dimensões da peça
-                largura = peca.get('larg', peca.get('largura', 0))
-                altura = peca.get('alt', peca.get('altura', 0))
-                # Pontuação baseada na área residual
-                area_residual = (espaco['largura'] * espaco['altura']) - (largura * altura)
-                if area_residual < melhor_pontuacao:
-                    melhor_pontuacao = area_residual
-                    melhor_espaco = espaco
-                    
-        return melhor_espaco
-    
-    # Função para tentar realocar peças entre chapas
-    def tentar_realocar_pecas():
-        for i, chapa in enumerate(chapas_cortadas):
-            for j, outra_chapa in enumerate(chapas_cortadas[i+1:], i+1):
-                for peca in chapa['pecas_alocadas']:
-                    # Verifica se a peça cabe na outra chapa
-                    espacos = [{
-                        'x': 0,
-                        'y': 0,
-                        'largura': largura_chapa_cm,
-                        'altura': altura_chapa_cm
-                    }]
-                    
-                    # Remove os espaços ocupados pelas peças existentes
-                    for p in outra_chapa['pecas_alocadas']:
-                        novos_espacos = []
-                        for espaco in espacos:
-                            if (espaco['x'] < p['x'] + p['largura'] and
-                                espaco['x'] + espaco['largura'] > p['x'] and
-                                espaco['y'] < p['y'] + p['altura'] and
-                                espaco['y'] + espaco['altura'] > p['y']):
-                                
-                                # Divide o espaço em partes não sobrepostas
-                                if espaco['x'] < p['x']:
-                                    novos_espacos.append({
-                                        'x': espaco['x'],
-                                        'y': espaco['y'],
-                                        'largura': p['x'] - espaco['x'],
-                                        'altura': espaco['altura']
-                                    })
-                                if espaco['x'] + espaco['largura'] > p['x'] + p['largura']:
-                                    novos_espacos.append({
-                                        'x': p['x'] + p['largura'],
-                                        'y': espaco['y'],
-                                        'largura': espaco['x'] + espaco['largura'] - (p['x'] + p['largura']),
-                                        'altura': espaco['altura']
-                                    })
-                                if espaco['y'] < p['y']:
-                                    novos_espacos.append({
-                                        'x': espaco['x'],
-                                        'y': espaco['y'],
-                                        'largura': espaco['largura'],
-                                        'altura': p['y'] - espaco['y']
-                                    })
-                                if espaco['y'] + espaco['altura'] > p['y'] + p['altura']:
-                                    novos_espacos.append({
-                                        'x': espaco['x'],
-                                        'y': p['y'] + p['altura'],
-                                        'largura': espaco['largura'],
-                                        'altura': espaco['y'] + espaco['altura'] - (p['y'] + p['altura'])
-                                    })
-                            else:
-                                novos_espacos.append(espaco)
-                        espacos = novos_espacos
-                    
-                    # Tenta colocar a peça em algum espaço, considerando a rotação
-                    melhor_espaco = None
-                    melhor_pontuacao = float('inf')
-                    melhor_rotacao = False
-                    
-                    # Tenta sem rotação
-                    for espaco in espacos:
-                        if peca_cabe_em_espaco(peca, espaco):
-                            area_residual = (espaco['largura'] * espaco['altura']) - (peca['largura'] * peca['altura'])
-                            if area_residual < melhor_pontuacao:
-                                melhor_pontuacao = area_residual
-                                melhor_espaco = espaco
-                                melhor_rotacao = False
-                    
-                    # Tenta com rotação
-                    peca_rotacionada = {
-                        'largura': peca['altura'],
-                        'altura': peca['largura']
-                    }
-                    for espaco in espacos:
-                        if peca_cabe_em_espaco(peca_rotacionada, espaco):
-                            area_residual = (espaco['largura'] * espaco['altura']) - (peca_rotacionada['largura'] * peca_rotacionada['altura'])
-                            if area_residual < melhor_pontuacao:
-                                melhor_pontuacao = area_residual
-                                melhor_espaco = espaco
-                                melhor_rotacao = True
-                    
-                    if melhor_espaco:
-                        # Move a peça para a outra chapa
-                        peca['x'] = melhor_espaco['x']
-                        peca['y'] = melhor_espaco['y']
-                        if melhor_rotacao:
-                            peca['largura'], peca['altura'] = peca['altura'], peca['largura']
-                            peca['rotacionada'] = not peca.get('rotacionada', False)
-                        outra_chapa['pecas_alocadas'].append(peca)
-                        chapa['pecas_alocadas'].remove(peca)
-                        
-                        # Se a chapa original ficou vazia, remove ela
-                        if not chapa['pecas_alocadas']:
-                            chapas_cortadas.remove(chapa)
-                        return True
-        return False
-    
-    # Aloca as peças nas chapas
+    return cortar_chapas_estoque(
+        [TipoChapa(None, largura_chapa_cm, altura_chapa_cm)], pecas,
+        heuristica=heuristica, ordenacao=ordenacao,
+        max_iteracoes_melhoria=max_iteracoes_melhoria,
+        tempo_limite_melhoria=tempo_limite_melhoria,
+        estatisticas=estatisticas, kerf=kerf, refilo=refilo)
+
+
+def cortar_chapas_estoque(estoque: list, pecas: list,
+                          heuristica: str = HEURISTICA_PADRAO,
+                          ordenacao: str = ORDENACAO_PADRAO,
+                          max_iteracoes_melhoria: int = None,
+                          tempo_limite_melhoria: float = None,
+                          estatisticas: dict = None, kerf: float = 0.0,
+                          refilo=0.0) -> tuple:
+    """
+    Otimização de corte a partir de um estoque de chapas de vários tamanhos.
+
+    Cada nova chapa é do tipo disponível de menor custo por área útil em
+    que a peça cabe. Ao final, cada chapa em uso é trocada por um tipo mais
+    barato do estoque quando todas as suas peças couberem nele.
+
+    Args:
+        estoque: Lista de TipoChapa ou dicionários com larg, alt e,
+            opcionalmente, id, quant (padrão: ilimitada) e custo (padrão: área)
+        pecas: Lista de peças a serem cortadas (veja cortar_chapas)
+        heuristica: Nome da heurística de posicionamento
+        ordenacao: Ordem em que as peças são alocadas (veja ORDENACOES)
+        max_iteracoes_melhoria: Limite de tentativas da etapa de melhoria
+        tempo_limite_melhoria: Limite de tempo (s) da etapa de melhoria
+        estatisticas: Dicionário opcional preenchido com o relatório da
+            etapa de melhoria, o custo total, o número de chapas trocadas e
+            os tempos de cada etapa
+        kerf: Espessura do corte da serra
+        refilo: Refilo das bordas de todas as chapas
+
+    Returns:
+        ResultadoCorte, que se desempacota como a tupla:
+        - Lista de chapas com suas peças alocadas, incluindo largura, altura
+          e id_estoque de cada chapa
+        - Lista de peças não alocadas, com a quantidade que ficou sem chapa
+        e traz os tempos (s) das etapas ordenacao, alocacao, melhoria,
+        troca_de_chapa e total
+
+    Raises:
+        ValueError: Se a heurística ou a ordenação não existem, ou se
+            nenhuma chapa do estoque tem área útil depois do refilo
+    """
+    validar_heuristica(heuristica)
+    if ordenacao not in ORDENACOES:
+        raise ValueError(
+            f"Ordenação desconhecida: {ordenacao}. "
+            f"Opções: {', '.join(ORDENACOES)}."
+        )
+    inicio = time.perf_counter()
+    if not estoque:
+        raise ValueError("O estoque não tem nenhum tipo de chapa.")
+    estoque = EstoqueChapas(estoque, refilo)
+    if not estoque.tipos:
+        raise ValueError(
+            f"O refilo {refilo} não deixa área útil em nenhuma chapa do estoque.")
+    pecas = [p if isinstance(p, Peca) else Peca.de_dict(p) for p in pecas]
+
+    tempos = {}
+    chapas, nao_alocadas = _alocar_pecas(
+        estoque, pecas, heuristica, ordenacao, kerf, refilo, tempos)
+
+    # Tenta realocar peças entre chapas para otimizar o espaço
+    relatorio = melhorar_layout(chapas, max_iteracoes_melhoria, tempo_limite_melhoria)
+    tempos['melhoria'] = relatorio['tempo']
+    etapa = time.perf_counter()
+    estoque.recontar(chapas)
+    trocas = _reduzir_custo(chapas, estoque, heuristica, kerf, refilo)
+    tempos['troca_de_chapa'] = time.perf_counter() - etapa
+    if estatisticas is not None:
+        estatisticas.update(relatorio)
+        estatisticas['trocas_de_chapa'] = trocas
+        estatisticas['custo'] = sum(chapa.tipo.custo for chapa in chapas)
+
+    resultado = [chapa.para_dict(i + 1) for i, chapa in enumerate(chapas)]
+    tempos['total'] = time.perf_counter() - inicio
+    instrumentacao.registrar_tempos(tempos)
+    instrumentacao.somar(chapas_usadas=len(resultado))
+    if estatisticas is not None:
+        estatisticas['tempos'] = tempos
+    tipo = estoque.tipos[0]
+    return ResultadoCorte(resultado, [peca.para_dict() for peca in nao_alocadas],
+                          tipo.largura, tipo.altura, kerf, refilo, tempos)
+
+
+def _nova_chapa(tipo: TipoChapa, heuristica: str, kerf: float = 0.0, refilo=0.0) -> Chapa:
+    """Cria uma chapa vazia do tipo dado com a estrutura de espaços da heurística."""
+    return Chapa(tipo.largura, tipo.altura,
+                 criar_espacos(heuristica, tipo.largura, tipo.altura, kerf, refilo), tipo)
+
+
+def _alocar_pecas(estoque: EstoqueChapas, pecas: list,
+                  heuristica: str = HEURISTICA_PADRAO,
+                  ordenacao: str = ORDENACAO_PADRAO, kerf: float = 0.0,
+                  refilo=0.0, tempos: dict = None) -> tuple:
+    """
+    Aloca cada peça na primeira chapa em que ela cabe, no espaço escolhido
+    pela heurística.
+
+    Args:
+        estoque: Estoque de onde saem as novas chapas
+        pecas: Lista de Peca
+        heuristica: Nome da heurística de posicionamento
+        ordenacao: Nome do critério de ordenação das peças, ou None para
+            alocá-las na ordem dada
+        kerf: Espessura do corte da serra
+        refilo: Refilo das bordas (esquerda, superior, direita, inferior)
+        tempos: Dicionário opcional preenchido com a duração (s) das etapas
+            ordenacao e alocacao
+
+    Returns:
+        Tuple com a lista de Chapa usadas e a lista de Peca não alocadas
+    """
+    inicio = time.perf_counter()
+    # Ordena as peças pelo critério escolhido (maior para menor)
+    if ordenacao is None:
+        pecas_ordenadas = pecas
+    else:
+        pecas_ordenadas = sorted(pecas, key=ORDENACOES[ordenacao], reverse=True)
+    ordenadas = time.perf_counter()
+
+    chapas = []
+    nao_alocadas = []
+    # Espaços de todas as chapas, para testar cada peça em lote
+    indice = IndiceEspacos()
+
     for peca in pecas_ordenadas:
-        peca_alocada = False
-        
-        # Tenta alocar a peça em uma chapa existente
-        for chapa in chapas_cortadas:
-            espacos = [{
-                'x': 0,
-                'y': 0,
-                'largura': largura_chapa_cm,
-                'altura': altura_chapa_cm
-            }]
-            
-            # Remove os espaços ocupados pelas peças existentes
-            for p in chapa['pecas_alocadas']:
-                novos_espacos = []
-                for espaco in espacos:
-                    if (espaco['x'] < p['x'] + p['largura'] and
-                        espaco['x'] + espaco['largura'] > p['x'] and
-                        espaco['y'] < p['y'] + p['altura'] and
-                        espaco['y'] + espaco['altura'] > p['y']):
-                        
-                        # Divide o espaço em partes não sobrepostas
-                        if espaco['x'] < p['x']:
-                            novos_espacos.append({
-                                'x': espaco['x'],
-                                'y': espaco['y'],
-                                'largura': p['x'] - espaco['x'],
-                                'altura': espaco['altura']
-                            })
-                        if espaco['x'] + espaco['largura'] > p['x'] + p['largura']:
-                            novos_espacos.append({
-                                'x': p['x'] + p['largura'],
-                                'y': espaco['y'],
-                                'largura': espaco['x'] + espaco['largura'] - (p['x'] + p['largura']),
-                                'altura': espaco['altura']
-                            })
-                        if espaco['y'] < p['y']:
-                            novos_espacos.append({
-                                'x': espaco['x'],
-                                'y': espaco['y'],
-                                'largura': espaco['largura'],
-                                'altura': p['y'] - espaco['y']
-                            })
-                        if espaco['y'] + espaco['altura'] > p['y'] + p['altura']:
-                            novos_espacos.append({
-                                'x': espaco['x'],
-                                'y': p['y'] + p['altura'],
-                                'largura': espaco['largura'],
-                                'altura': espaco['y'] + espaco['altura'] - (p['y'] + p['altura'])
-                            })
-                    else:
-                        novos_espacos.append(espaco)
-                espacos = novos_espacos
-            
-            # Tenta colocar a peça em algum espaço
-            melhor_espaco = encontrar_melhor_espaco(peca, espacos)
-            if melhor_espaco:
-                # Cria uma cópia da peça com todas as propriedades necessárias
-                peca_alocada = {
-                    'id': peca['id'],
-                    'x': melhor_espaco['x'],
-                    'y': melhor_espaco['y'],
-                    'largura': peca['larg'],
-                    'altura': peca['alt'],
-                    'original_idx': peca['original_idx']
-                }
-                chapa['pecas_alocadas'].append(peca_alocada)
-                peca_alocada = True
-                break
-        
-        # Se não conseguiu alocar, cria uma nova chapa
-        if not peca_alocada:
-            if peca['larg'] <= largura_chapa_cm and peca['alt'] <= altura_chapa_cm:
-                nova_chapa = {
-                    'pecas_alocadas': [{
-                        'id': peca['id'],
-                        'x': 0,
-                        'y': 0,
-                        'largura': peca['larg'],
-                        'altura': peca['alt'],
-                        'original_idx': peca['original_idx']
-                    }]
-                }
-                chapas_cortadas.append(nova_chapa)
-                peca_alocada = True
+        # As cópias de uma peça são alocadas em blocos, e não uma a uma
+        alocadas = 0
+        while alocadas < peca.quantidade:
+            # Tenta alocar na primeira chapa existente em que a peça cabe,
+            # avaliando as duas orientações quando a rotação é permitida
+            encaixe = indice.primeiro_encaixe(
+                peca.largura, peca.altura, permite_rotacao=peca.pode_rotacionar)
+            if encaixe:
+                k, x, y, rotacionada = encaixe
             else:
-                pecas_nao_alocadas.append(peca)
-    
-    # Tenta realocar peças entre chapas para otimizar o espaço
-    while tentar_realocar_pecas():
-        pass
-    
-    return chapas_cortadas, pecas_nao_alocadas 
\ No newline at end of file
+                # Se não conseguiu alocar, abre uma nova chapa do estoque
+                tipo = estoque.escolher(peca.largura, peca.altura, peca.pode_rotacionar)
+                if tipo is None:
+                    nao_alocadas.append(peca.com_quantidade(peca.quantidade - alocadas))
+                    break
+                estoque.retirar(tipo)
+                chapas.append(_nova_chapa(tipo, heuristica, kerf, refilo))
+                k = len(chapas) - 1
+                x, y, rotacionada = chapas[k].espacos.melhor_espaco(
+                    peca.largura, peca.altura, permite_rotacao=peca.pode_rotacionar)
+
+            alocadas += chapas[k].alocar_lote(
+                peca, x, y, peca.quantidade - alocadas,
+                primeira_copia=alocadas, rotacionada=rotacionada)
+            indice.atualizar(k, chapas[k].espacos)
+
+    if tempos is not None:
+        tempos['ordenacao'] = ordenadas - inicio
+        tempos['alocacao'] = time.perf_counter() - ordenadas
+    return chapas, nao_alocadas
+
+
+def _reduzir_custo(chapas: list, estoque: EstoqueChapas, heuristica: str,
+                   kerf: float = 0.0, refilo=0.0) -> int:
+    """
+    Troca chapas em uso por tipos mais baratos do estoque que recebam todas
+    as suas peças.
+
+    As chapas são percorridas da última para a primeira, pois as últimas
+    costumam ser as menos ocupadas. As peças de cada chapa são realocadas,
+    da maior para a menor, em uma chapa vazia de cada tipo candidato.
+
+    Args:
+        chapas: Lista de Chapa, alterada no próprio lugar
+        estoque: Estoque com as quantidades restantes já descontadas
+        heuristica: Nome da heurística de posicionamento
+        kerf: Espessura do corte da serra
+        refilo: Refilo das bordas
+
+    Returns:
+        Número de chapas trocadas
+    """
+    trocas = 0
+    for i in range(len(chapas) - 1, -1, -1):
+        chapa = chapas[i]
+        if not chapa.pecas:
+            continue
+        pecas = sorted(chapa.pecas, key=lambda a: a.largura * a.altura, reverse=True)
+        area = sum(a.largura * a.altura for a in pecas)
+        maior = pecas[0]
+        for tipo in estoque.candidatos(area, maior.largura, maior.altura, chapa.tipo.custo):
+            nova = _nova_chapa(tipo, heuristica, kerf, refilo)
+            for alocada in pecas:
+                peca = alocada.peca
+                encaixe = nova.espacos.melhor_espaco(
+                    peca.largura, peca.altura, permite_rotacao=peca.pode_rotacionar)
+                if encaixe is None:
+                    break
+                x, y, rotacionada = encaixe
+                nova.alocar(peca, x, y, rotacionada, alocada.copia)
+            else:
+                estoque.devolver(chapa.tipo)
+                estoque.retirar(tipo)
+                chapas[i] = nova
+                trocas += 1
+                break
+    return trocas
+
+
+def reotimizar_peca(largura_chapa_cm: float, altura_chapa_cm: float, chapas: list,
+                    nao_alocadas: list, pecas: list, original_idx: int,
+                    heuristica: str = HEURISTICA_PADRAO, ordenacao: str = ORDENACAO_PADRAO,
+                    estatisticas: dict = None, kerf: float = 0.0, refilo=0.0) -> tuple:
+    """
+    Reotimização incremental após a alteração de uma única peça.
+
+    As chapas que não contêm nenhuma cópia da peça alterada são mantidas
+    como estão, exceto a última. As peças das demais chapas, a peça
+    alterada e as peças que não tinham sido alocadas são realocadas em
+    chapas novas, que ocupam o lugar das antigas. O que não couber nelas é
+    posicionado nos espaços livres das chapas mantidas (sem mover as peças
+    delas) ou, por fim, em chapas no fim da lista.
+
+    Se o resultado anterior não corresponder às demais peças (outra peça
+    também mudou, foi incluída ou removida), é feita a otimização completa.
+
+    Args:
+        largura_chapa_cm: Largura da chapa em centímetros
+        altura_chapa_cm: Altura da chapa em centímetros
+        chapas: Chapas do resultado anterior de cortar_chapas
+        nao_alocadas: Peças não alocadas do resultado anterior
+        pecas: Lista completa de peças, já com a peça alterada
+        original_idx: original_idx da peça alterada
+        heuristica: Nome da heurística de posicionamento
+        ordenacao: Ordem em que as peças são realocadas
+        estatisticas: Dicionário opcional preenchido com incremental (False
+            se foi feita a otimização completa), chapas_mantidas e chapas_refeitas
+        kerf: Espessura do corte da serra
+        refilo: Refilo das bordas
+
+    Returns:
+        O mesmo que cortar_chapas
+    """
+    inicio = time.perf_counter()
+    validar_heuristica(heuristica)
+    pecas = [p if isinstance(p, Peca) else Peca.de_dict(p) for p in pecas]
+    por_idx = {p.original_idx: p for p in pecas}
+
+    # Cópias de cada peça no resultado anterior, para conferir que só a
+    # peça indicada mudou
+    copias = {}
+    for p in nao_alocadas:
+        copias[p['original_idx']] = copias.get(p['original_idx'], 0) + p.get('quant', 1)
+    afetadas = set()
+    divergentes = False
+    for k, chapa in enumerate(chapas):
+        for p in chapa['pecas_alocadas']:
+            idx = p['original_idx']
+            copias[idx] = copias.get(idx, 0) + 1
+            if idx == original_idx:
+                afetadas.add(k)
+            elif idx in por_idx and not _mesmas_medidas(por_idx[idx], p):
+                divergentes = True
+
+    copias.pop(original_idx, None)
+    esperadas = {p.original_idx: p.quantidade for p in pecas if p.original_idx != original_idx}
+    if original_idx not in por_idx or divergentes or copias != esperadas:
+        if estatisticas is not None:
+            estatisticas['incremental'] = False
+        return cortar_chapas(largura_chapa_cm, altura_chapa_cm, pecas,
+                             heuristica=heuristica, ordenacao=ordenacao,
+                             estatisticas=estatisticas, kerf=kerf, refilo=refilo)
+
+    # A última chapa, em geral a menos ocupada, também é refeita: ela recebe
+    # o que transbordar e evita que edições seguidas acumulem chapas quase vazias
+    if chapas:
+        afetadas.add(len(chapas) - 1)
+
+    # Peças a realocar: todas as cópias das chapas afetadas, guardando os
+    # números de cópia de cada peça, mais as que não tinham sido alocadas
+    numeros = {original_idx: list(range(por_idx[original_idx].quantidade))}
+    for k in sorted(afetadas):
+        for p in chapas[k]['pecas_alocadas']:
+            if p['original_idx'] != original_idx:
+                numeros.setdefault(p['original_idx'], []).append(p['copia'])
+    pendentes = [p for p in nao_alocadas if p['original_idx'] != original_idx]
+    if pendentes:
+        usados = _copias_alocadas(chapas)
+        for p in pendentes:
+            idx = p['original_idx']
+            livres = (c for c in range(por_idx[idx].quantidade)
+                      if c not in usados.get(idx, ()))
+            numeros.setdefault(idx, []).extend(
+                c for c, _ in zip(livres, range(p.get('quant', 1))))
+    for lista in numeros.values():
+        lista.sort()
+    realocar = [por_idx[idx].com_quantidade(len(lista)) for idx, lista in numeros.items()]
+
+    estoque = EstoqueChapas([TipoChapa(None, largura_chapa_cm, altura_chapa_cm)], refilo)
+    tempos = {}
+    novas, nao_alocadas = _alocar_pecas(estoque, realocar, heuristica, ordenacao,
+                                        kerf, refilo, tempos)
+    tempos['melhoria'] = melhorar_layout(novas)['tempo']
+    for chapa in novas:
+        for alocada in chapa.pecas:
+            alocada.copia = numeros[alocada.peca.original_idx][alocada.copia]
+
+    # O que transbordou das chapas afetadas tenta antes os espaços livres das
+    # chapas mantidas. Só nas heurísticas MaxRects, cujos espaços podem ser
+    # reconstruídos a partir de posições quaisquer.
+    mantidas = {k: chapa for k, chapa in enumerate(chapas) if k not in afetadas}
+    if len(novas) > len(afetadas) and heuristica.startswith('maxrects'):
+        _preencher_mantidas(mantidas, novas[len(afetadas):], largura_chapa_cm,
+                            altura_chapa_cm, heuristica, kerf, refilo)
+        novas = [chapa for chapa in novas if chapa.pecas]
+
+    # As chapas novas ocupam as posições das afetadas; as que sobrarem vão para o fim
+    novas = [chapa.para_dict(0) for chapa in novas]
+    resultado = []
+    for k in range(len(chapas)):
+        if k in mantidas:
+            resultado.append(mantidas[k])
+        elif novas:
+            resultado.append(novas.pop(0))
+    resultado.extend(novas)
+    resultado = [dict(chapa, id_chapa=i + 1) for i, chapa in enumerate(resultado)]
+
+    tempos['total'] = time.perf_counter() - inicio
+    instrumentacao.registrar_tempos({'reotimizacao_' + nome: duracao
+                                     for nome, duracao in tempos.items()})
+    if estatisticas is not None:
+        estatisticas.update({
+            'incremental': True,
+            'chapas_mantidas': len(mantidas),
+            'chapas_refeitas': len(resultado) - len(mantidas),
+            'tempos': tempos,
+        })
+    return ResultadoCorte(resultado, [peca.para_dict() for peca in nao_alocadas],
+                          largura_chapa_cm, altura_chapa_cm, kerf, refilo, tempos)
+
+
+def _preencher_mantidas(mantidas: dict, excedentes: list, largura_chapa: float,
+                        altura_chapa: float, heuristica: str, kerf: float = 0.0,
+                        refilo=0.0):
+    """
+    Move peças das chapas excedentes para os espaços livres das chapas mantidas.
+
+    Os espaços de uma chapa mantida só são reconstruídos quando a sua área
+    livre comporta a peça, e as peças já posicionadas nela não mudam.
+
+    Args:
+        mantidas: Dicionário da posição para a chapa (dicionário), em que as
+            chapas que receberem peças são substituídas por cópias
+        excedentes: Lista de Chapa de onde as peças são retiradas
+        largura_chapa: Largura da chapa
+        altura_chapa: Altura da chapa
+        heuristica: Nome da heurística de posicionamento
+        kerf: Espessura do corte da serra
+        refilo: Refilo das bordas
+    """
+    area_chapa = largura_chapa * altura_chapa
+    livre = {k: area_chapa - sum(p['largura'] * p['altura'] for p in chapa['pecas_alocadas'])
+             for k, chapa in mantidas.items()}
+    reconstruidas = {}
+    for extra in excedentes:
+        for alocada in list(extra.pecas):
+            peca = alocada.peca
+            for k, dados in mantidas.items():
+                if livre[k] < peca.area:
+                    continue
+                if k not in reconstruidas:
+                    chapa = _nova_chapa(TipoChapa(None, largura_chapa, altura_chapa),
+                                        heuristica, kerf, refilo)
+                    for p in dados['pecas_alocadas']:
+                        chapa.espacos.ocupar(p['x'], p['y'], p['largura'], p['altura'])
+                    reconstruidas[k] = chapa
+                chapa = reconstruidas[k]
+                encaixe = chapa.espacos.melhor_espaco(
+                    peca.largura, peca.altura, permite_rotacao=peca.pode_rotacionar)
+                if encaixe:
+                    x, y, rotacionada = encaixe
+                    chapa.alocar(peca, x, y, rotacionada, alocada.copia)
+                    extra.pecas.remove(alocada)
+                    livre[k] -= peca.area
+                    break
+
+    for k, chapa in reconstruidas.items():
+        if chapa.pecas:
+            mantidas[k] = dict(mantidas[k], pecas_alocadas=(
+                mantidas[k]['pecas_alocadas'] + [p.para_dict() for p in chapa.pecas]))
+
+
+def _mesmas_medidas(peca: Peca, alocada: dict) -> bool:
+    """Verifica se a peça alocada tem as medidas da peça, em alguma orientação."""
+    medidas = (alocada['largura'], alocada['altura'])
+    return medidas == (peca.largura, peca.altura) or medidas == (peca.altura, peca.largura)
+
+
+def _copias_alocadas(chapas: list) -> dict:
+    """Números das cópias já posicionadas nas chapas, por original_idx."""
+    usados = {}
+    for chapa in chapas:
+        for p in chapa['pecas_alocadas']:
+            usados.setdefault(p['original_idx'], set()).add(p['copia'])
+    return usados
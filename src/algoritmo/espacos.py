@@ -0,0 +1,560 @@
+import numpy as np
+
+from . import instrumentacao
+
+# Tolerância para comparações entre medidas em ponto flutuante
+EPSILON = 1e-9
+
+
+class EspacosLivres:
+    """
+    Conjunto de retângulos livres de uma chapa (estratégia MaxRects).
+
+    A estrutura é mantida de forma incremental: ao ocupar uma região, apenas
+    os retângulos que a interceptam são divididos, e os retângulos que ficam
+    contidos em outros são descartados. Os retângulos ficam em um array
+    NumPy (x, y, largura, altura) para que o encaixe de uma peça seja
+    testado contra todos eles de uma só vez.
+
+    O critério de escolha do espaço é um dos definidos em CRITERIOS:
+    'baf' (menor área residual), 'bssf' (menor sobra no lado curto),
+    'blsf' (menor sobra no lado longo) ou 'bl' (mais abaixo e à esquerda).
+
+    A espessura da serra (kerf) e o refilo das bordas são aplicados na
+    própria divisão dos espaços (veja area_util).
+    """
+    __slots__ = ('largura', 'altura', 'criterio', 'kerf', 'refilo', 'retangulos',
+                 '_maior_largura', '_maior_altura')
+
+    def __init__(self, largura: float, altura: float, criterio: str = 'baf',
+                 kerf: float = 0.0, refilo=0.0):
+        self.largura = largura
+        self.altura = altura
+        self.criterio = criterio
+        self.kerf = kerf
+        self.refilo = normalizar_refilo(refilo)
+        self.retangulos = np.array([area_util(largura, altura, kerf, self.refilo)])
+        # Maiores dimensões livres, usadas para descartar peças sem chamar o NumPy
+        self._maior_largura = float(self.retangulos[0, 2])
+        self._maior_altura = float(self.retangulos[0, 3])
+
+    def melhor_espaco(self, largura: float, altura: float, permite_rotacao: bool = False):
+        """
+        Encontra o melhor espaço livre para a peça segundo o critério da estrutura.
+
+        Args:
+            largura: Largura da peça
+            altura: Altura da peça
+            permite_rotacao: Se True, também testa a peça rotacionada
+
+        Returns:
+            Tupla (x, y, rotacionada) da posição escolhida ou None se a peça não couber
+        """
+        largura += self.kerf
+        altura += self.kerf
+        cabe_normal = (largura <= self._maior_largura + EPSILON and
+                       altura <= self._maior_altura + EPSILON)
+        cabe_rotacionada = (permite_rotacao and
+                            altura <= self._maior_largura + EPSILON and
+                            largura <= self._maior_altura + EPSILON)
+        if not (cabe_normal or cabe_rotacionada):
+            return None
+
+        return avaliar_encaixe(self.retangulos, largura, altura,
+                               cabe_rotacionada, self.criterio)
+
+    def ocupar(self, x: float, y: float, largura: float, altura: float):
+        """
+        Marca uma região como ocupada, dividindo os retângulos afetados.
+
+        Args:
+            x: Posição horizontal da região
+            y: Posição vertical da região
+            largura: Largura da região
+            altura: Altura da região
+        """
+        if instrumentacao.contadores is not None:
+            instrumentacao.contadores['ocupacoes'] += 1
+        ret = self.retangulos
+        # A região ocupada inclui o corte da serra à direita e abaixo
+        x2 = x + largura + self.kerf
+        y2 = y + altura + self.kerf
+        ex = ret[:, 0]
+        ey = ret[:, 1]
+        ex2 = ex + ret[:, 2]
+        ey2 = ey + ret[:, 3]
+
+        intercepta = ((ex < x2 - EPSILON) & (ex2 > x + EPSILON) &
+                      (ey < y2 - EPSILON) & (ey2 > y + EPSILON))
+        if not intercepta.any():
+            return
+
+        mantidos = ret[~intercepta]
+        afetados = ret[intercepta]
+        m = len(afetados)
+        if instrumentacao.contadores is not None:
+            instrumentacao.contadores['divisoes_retangulos'] += m
+
+        # Divide cada espaço afetado em até quatro partes maximais não ocupadas:
+        # à esquerda, à direita, acima e abaixo da região ocupada
+        novos = np.tile(afetados, (4, 1))
+        novos[:m, 2] = x - afetados[:, 0]
+        novos[m:2 * m, 0] = x2
+        novos[m:2 * m, 2] = ex2[intercepta] - x2
+        novos[2 * m:3 * m, 3] = y - afetados[:, 1]
+        novos[3 * m:, 1] = y2
+        novos[3 * m:, 3] = ey2[intercepta] - y2
+        novos = novos[(novos[:, 2] > EPSILON) & (novos[:, 3] > EPSILON)]
+
+        # Só os retângulos recém-criados podem estar contidos em outros:
+        # os mantidos já não continham uns aos outros antes da divisão.
+        k = len(novos)
+        if k:
+            contido = _contidos(novos, np.concatenate((mantidos, novos)))
+            contido_novo = contido[:, len(mantidos):]
+            # Entre retângulos iguais, apenas o primeiro é mantido
+            iguais = contido_novo & contido_novo.T
+            contido_novo &= ~iguais | np.tri(k, k, -1, dtype=bool)
+            np.fill_diagonal(contido_novo, False)
+            novos = novos[~contido.any(axis=1)]
+
+        self.retangulos = ret = np.concatenate((mantidos, novos))
+        if len(ret):
+            self._maior_largura = float(ret[:, 2].max())
+            self._maior_altura = float(ret[:, 3].max())
+        else:
+            self._maior_largura = self._maior_altura = 0.0
+
+    def reconstruir(self, pecas_alocadas: list) -> 'EspacosLivres':
+        """
+        Recalcula os espaços livres depois que peças saíram da chapa.
+
+        Args:
+            pecas_alocadas: Lista de PecaAlocada que continuam na chapa
+
+        Returns:
+            Nova estrutura de espaços com o mesmo critério
+        """
+        espacos = EspacosLivres(self.largura, self.altura, self.criterio,
+                                self.kerf, self.refilo)
+        for p in pecas_alocadas:
+            espacos.ocupar(p.x, p.y, p.largura, p.altura)
+        return espacos
+
+
+def normalizar_refilo(refilo) -> tuple:
+    """
+    Converte o refilo das bordas em uma tupla (esquerda, superior, direita, inferior).
+
+    Args:
+        refilo: Um único valor para todas as bordas ou uma sequência de 4 valores
+
+    Returns:
+        Tupla com o refilo de cada borda
+    """
+    if isinstance(refilo, (int, float)):
+        return (refilo,) * 4
+    refilo = tuple(refilo)
+    if len(refilo) != 4:
+        raise ValueError("O refilo deve ter um valor ou quatro (esquerda, superior, direita, inferior).")
+    return refilo
+
+
+def area_util(largura: float, altura: float, kerf: float = 0.0, refilo=0.0) -> tuple:
+    """
+    Retângulo livre inicial de uma chapa, descontado o refilo das bordas.
+
+    Cada peça ocupa sua largura e altura mais o kerf, que representa o corte
+    feito à direita e abaixo dela. Por isso a área útil também é acrescida
+    de um kerf: a última peça de cada linha ou coluna não precisa de corte
+    além da borda refilada.
+
+    Args:
+        largura: Largura da chapa
+        altura: Altura da chapa
+        kerf: Espessura do corte da serra
+        refilo: Refilo das bordas (veja normalizar_refilo)
+
+    Returns:
+        Tupla (x, y, largura, altura) do retângulo livre inicial
+    """
+    esquerda, superior, direita, inferior = normalizar_refilo(refilo)
+    return (float(esquerda), float(superior),
+            largura - esquerda - direita + kerf,
+            altura - superior - inferior + kerf)
+
+
+def _contidos(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    Matriz booleana em que [i, j] indica se o retângulo a[i] está contido em b[j].
+    """
+    ax = a[:, 0, None]
+    ay = a[:, 1, None]
+    bx = b[None, :, 0]
+    by = b[None, :, 1]
+    return ((ax >= bx - EPSILON) & (ay >= by - EPSILON) &
+            (ax + a[:, 2, None] <= bx + b[None, :, 2] + EPSILON) &
+            (ay + a[:, 3, None] <= by + b[None, :, 3] + EPSILON))
+
+
+CRITERIOS = ('baf', 'bssf', 'blsf', 'bl')
+
+
+def avaliar_encaixe(ret: np.ndarray, largura: float, altura: float,
+                    permite_rotacao: bool, criterio: str = 'baf'):
+    """
+    Kernel de encaixe: testa a peça contra todos os retângulos de uma vez.
+
+    Args:
+        ret: Array (n, 4) de retângulos livres (x, y, largura, altura)
+        largura: Largura da peça
+        altura: Altura da peça
+        permite_rotacao: Se True, também testa a peça rotacionada
+        criterio: Critério de pontuação (veja CRITERIOS)
+
+    Returns:
+        Tupla (x, y, rotacionada) do retângulo de menor pontuação ou None
+    """
+    if instrumentacao.contadores is not None:
+        instrumentacao.contadores['testes_encaixe'] += 1
+        instrumentacao.contadores['retangulos_avaliados'] += len(ret)
+    if permite_rotacao:
+        # As duas orientações são avaliadas juntas: a primeira metade dos
+        # candidatos é a peça na orientação original, a segunda rotacionada.
+        n = len(ret)
+        ret = np.concatenate((ret, ret))
+        w = np.repeat((largura, altura), n)
+        h = np.repeat((altura, largura), n)
+    else:
+        w, h = largura, altura
+
+    el = ret[:, 2]
+    ea = ret[:, 3]
+    cabe = (el >= w - EPSILON) & (ea >= h - EPSILON)
+    if not cabe.any():
+        return None
+
+    sobra_l = el - w
+    sobra_a = ea - h
+    if criterio == 'baf':
+        pontuacao = el * ea - largura * altura
+        desempate = np.minimum(sobra_l, sobra_a)
+    elif criterio == 'bssf':
+        pontuacao = np.minimum(sobra_l, sobra_a)
+        desempate = np.maximum(sobra_l, sobra_a)
+    elif criterio == 'blsf':
+        pontuacao = np.maximum(sobra_l, sobra_a)
+        desempate = np.minimum(sobra_l, sobra_a)
+    elif criterio == 'bl':
+        pontuacao = ret[:, 1] + h
+        desempate = ret[:, 0]
+    else:
+        raise ValueError(f"Critério de encaixe desconhecido: {criterio}")
+
+    pontuacao = np.where(cabe, pontuacao, np.inf)
+    empatados = pontuacao <= pontuacao.min() + EPSILON
+    # Em caso de empate, vence o primeiro candidato (orientação original)
+    idx = int(np.where(empatados, desempate, np.inf).argmin())
+
+    rotacionada = permite_rotacao and idx >= n
+    if rotacionada:
+        idx -= n
+    return float(ret[idx, 0]), float(ret[idx, 1]), rotacionada
+
+
+def grade_no_espaco(ret: np.ndarray, x: float, y: float, largura: float, altura: float) -> tuple:
+    """
+    Maior grade de peças iguais que cabe em um retângulo livre com canto em (x, y).
+
+    Args:
+        ret: Array (n, 4) de retângulos livres (x, y, largura, altura)
+        x: Posição horizontal do canto
+        y: Posição vertical do canto
+        largura: Largura de cada peça
+        altura: Altura de cada peça
+
+    Returns:
+        Tupla (colunas, linhas), com pelo menos uma peça se ela couber em (x, y)
+    """
+    no_canto = ((np.abs(ret[:, 0] - x) <= EPSILON) & (np.abs(ret[:, 1] - y) <= EPSILON) &
+                (ret[:, 2] >= largura - EPSILON) & (ret[:, 3] >= altura - EPSILON))
+    if not no_canto.any():
+        return 1, 1
+    colunas = np.floor((ret[no_canto, 2] + EPSILON) / largura)
+    linhas = np.floor((ret[no_canto, 3] + EPSILON) / altura)
+    idx = int((colunas * linhas).argmax())
+    return int(colunas[idx]), int(linhas[idx])
+
+
+class IndiceEspacos:
+    """
+    Retângulos livres de várias chapas empilhados em um único array.
+
+    Permite encontrar, com uma única avaliação vetorizada, a primeira chapa
+    em que a peça cabe. A escolha do espaço dentro dessa chapa é delegada
+    à estrutura de espaços dela, de acordo com a sua heurística. Cada chapa
+    ocupa um trecho contíguo do array, substituído quando seus espaços mudam.
+    """
+    __slots__ = ('espacos', 'retangulos', 'chapa', 'inicios')
+
+    def __init__(self, lista_espacos: list = ()):
+        self.espacos = list(lista_espacos)
+        arrays = [_descontar_kerf(e) for e in lista_espacos]
+        tamanhos = np.array([len(a) for a in arrays], dtype=np.intp)
+        self.retangulos = np.concatenate(arrays) if arrays else np.empty((0, 4))
+        self.chapa = np.repeat(np.arange(len(arrays), dtype=np.intp), tamanhos)
+        self.inicios = np.cumsum(tamanhos) - tamanhos
+
+    def atualizar(self, indice_chapa: int, espacos):
+        """
+        Substitui (ou acrescenta, se for uma chapa nova) os espaços de uma chapa.
+
+        Args:
+            indice_chapa: Posição da chapa na lista de chapas
+            espacos: Espaços livres atuais da chapa
+        """
+        novos = _descontar_kerf(espacos)
+        ids = np.full(len(novos), indice_chapa, dtype=np.intp)
+        if indice_chapa == len(self.inicios):
+            self.espacos.append(espacos)
+            self.inicios = np.append(self.inicios, len(self.retangulos))
+            self.retangulos = np.concatenate((self.retangulos, novos))
+            self.chapa = np.concatenate((self.chapa, ids))
+            return
+
+        self.espacos[indice_chapa] = espacos
+        ini, fim = self._trecho(indice_chapa)
+        self.retangulos = np.concatenate(
+            (self.retangulos[:ini], novos, self.retangulos[fim:]))
+        self.chapa = np.concatenate((self.chapa[:ini], ids, self.chapa[fim:]))
+        self.inicios[indice_chapa + 1:] += len(novos) - (fim - ini)
+
+    def primeiro_encaixe(self, largura: float, altura: float,
+                         permite_rotacao: bool = False, a_partir_de: int = 0):
+        """
+        Encontra a primeira chapa em que a peça cabe e o melhor espaço nela.
+
+        Args:
+            largura: Largura da peça
+            altura: Altura da peça
+            permite_rotacao: Se True, também testa a peça rotacionada
+            a_partir_de: Índice da primeira chapa a ser considerada
+
+        Returns:
+            Tupla (indice_chapa, x, y, rotacionada) ou None se não couber em nenhuma
+        """
+        if a_partir_de >= len(self.inicios):
+            return None
+        inicio = int(self.inicios[a_partir_de])
+        ret = self.retangulos[inicio:]
+        if instrumentacao.contadores is not None:
+            instrumentacao.contadores['buscas_entre_chapas'] += 1
+            instrumentacao.contadores['retangulos_avaliados_indice'] += len(ret)
+        el = ret[:, 2]
+        ea = ret[:, 3]
+
+        cabe = (el >= largura - EPSILON) & (ea >= altura - EPSILON)
+        if permite_rotacao:
+            cabe |= (el >= altura - EPSILON) & (ea >= largura - EPSILON)
+        primeiro = int(cabe.argmax())
+        if not cabe[primeiro]:
+            return None
+
+        indice_chapa = int(self.chapa[inicio + primeiro])
+        x, y, rotacionada = self.espacos[indice_chapa].melhor_espaco(
+            largura, altura, permite_rotacao)
+        return indice_chapa, x, y, rotacionada
+
+    def _trecho(self, indice_chapa: int) -> tuple:
+        """Retorna o intervalo [ini, fim) dos retângulos da chapa no array."""
+        ini = int(self.inicios[indice_chapa])
+        if indice_chapa + 1 < len(self.inicios):
+            fim = int(self.inicios[indice_chapa + 1])
+        else:
+            fim = len(self.retangulos)
+        return ini, fim
+
+
+def _descontar_kerf(espacos) -> np.ndarray:
+    """
+    Retângulos livres da chapa com o kerf descontado das dimensões.
+
+    Assim o índice compara diretamente as medidas reais das peças.
+    """
+    if not espacos.kerf:
+        return espacos.retangulos
+    ret = espacos.retangulos.copy()
+    ret[:, 2:] -= espacos.kerf
+    return ret
+
+
+def simular_maxrects(pecas: list, largura: float, altura: float, criterio: str = 'baf',
+                     kerf: float = 0.0, refilo=0.0) -> tuple:
+    """
+    Aloca as peças como _alocar_pecas com EspacosLivres, sem criar as chapas.
+
+    Repete em Python puro, com os retângulos em listas de tuplas, as mesmas
+    decisões de EspacosLivres, IndiceEspacos e Chapa.alocar_lote: primeira
+    chapa em que a peça cabe, melhor espaço pelo critério (com os mesmos
+    desempates), cópias em bloco e a mesma divisão dos retângulos. Em uma
+    chapa com poucas dezenas de retângulos livres, o custo fixo de cada
+    operação do NumPy domina; aqui a alocação sai várias vezes mais rápida.
+    Serve para comparar muitas ordens de alocação (veja recozimento.py).
+
+    Args:
+        pecas: Lista de Peca, na ordem de alocação
+        largura: Largura da chapa (um único tipo, sem limite de quantidade)
+        altura: Altura da chapa
+        criterio: Critério de escolha do espaço (veja CRITERIOS)
+        kerf: Espessura do corte da serra
+        refilo: Refilo das bordas (veja normalizar_refilo)
+
+    Returns:
+        Tupla (areas, faltantes): a área ocupada pelas peças em cada chapa
+        usada, em ordem, e o número de cópias que não cabem na chapa
+    """
+    if criterio not in CRITERIOS:
+        raise ValueError(f"Critério de encaixe desconhecido: {criterio}")
+    inicial = area_util(largura, altura, kerf, refilo)
+    util_l, util_a = inicial[2] - kerf, inicial[3] - kerf
+    # Cada chapa é [retângulos, maior largura livre, maior altura livre, área ocupada]
+    chapas = []
+    faltantes = 0
+    for peca in pecas:
+        largura_k, altura_k = peca.largura + kerf, peca.altura + kerf
+        # Menores dimensões livres em que a peça cabe, em cada orientação
+        minimo_l, minimo_a = largura_k - EPSILON, altura_k - EPSILON
+        rotacao = peca.pode_rotacionar
+        alocadas = 0
+        while alocadas < peca.quantidade:
+            encaixe = None
+            for chapa in chapas:
+                # Descarta pelas maiores dimensões livres antes de avaliar a chapa
+                if (chapa[1] >= minimo_l and chapa[2] >= minimo_a) or \
+                        (rotacao and chapa[1] >= minimo_a and chapa[2] >= minimo_l):
+                    encaixe = _simular_encaixe(chapa, largura_k, altura_k, rotacao, criterio)
+                    if encaixe is not None:
+                        break
+            if encaixe is None:
+                if not peca.cabe_em(util_l + EPSILON, util_a + EPSILON):
+                    faltantes += peca.quantidade - alocadas
+                    break
+                chapa = [[inicial], inicial[2], inicial[3], 0.0]
+                chapas.append(chapa)
+                encaixe = _simular_encaixe(chapa, largura_k, altura_k, rotacao, criterio)
+            x, y, rotacionada = encaixe
+            n = _simular_lote(chapa, x, y, peca.quantidade - alocadas,
+                              (peca.altura, peca.largura) if rotacionada else
+                              (peca.largura, peca.altura), kerf)
+            chapa[3] += n * peca.largura * peca.altura
+            alocadas += n
+    return [chapa[3] for chapa in chapas], faltantes
+
+
+def _simular_encaixe(chapa: list, largura: float, altura: float, permite_rotacao: bool,
+                     criterio: str):
+    """Equivalente a EspacosLivres.melhor_espaco, com as medidas já acrescidas do kerf."""
+    retangulos, maior_l, maior_a = chapa[0], chapa[1], chapa[2]
+    cabe_normal = largura <= maior_l + EPSILON and altura <= maior_a + EPSILON
+    cabe_rotacionada = (permite_rotacao and altura <= maior_l + EPSILON and
+                        largura <= maior_a + EPSILON)
+    if not (cabe_normal or cabe_rotacionada):
+        return None
+    area = largura * altura
+    # Candidatos na ordem de avaliar_encaixe: primeiro a orientação original
+    candidatos = []
+    orientacoes = ((largura, altura, False), (altura, largura, True)) \
+        if cabe_rotacionada else ((largura, altura, False),)
+    for w, h, rotacionada in orientacoes:
+        minimo_l, minimo_a = w - EPSILON, h - EPSILON
+        for r in retangulos:
+            if r[2] < minimo_l or r[3] < minimo_a:
+                continue
+            ex, ey, el, ea = r
+            sobra_l, sobra_a = el - w, ea - h
+            if criterio == 'baf':
+                pontuacao, desempate = el * ea - area, min(sobra_l, sobra_a)
+            elif criterio == 'bssf':
+                pontuacao, desempate = min(sobra_l, sobra_a), max(sobra_l, sobra_a)
+            elif criterio == 'blsf':
+                pontuacao, desempate = max(sobra_l, sobra_a), min(sobra_l, sobra_a)
+            else:
+                pontuacao, desempate = ey + h, ex
+            candidatos.append((pontuacao, desempate, ex, ey, rotacionada))
+    if not candidatos:
+        return None
+    limite = min(c[0] for c in candidatos) + EPSILON
+    melhor = None
+    for pontuacao, desempate, ex, ey, rotacionada in candidatos:
+        if pontuacao <= limite and (melhor is None or desempate < melhor[0]):
+            melhor = (desempate, ex, ey, rotacionada)
+    return melhor[1:]
+
+
+def _simular_lote(chapa: list, x: float, y: float, quantidade: int, medidas: tuple,
+                  kerf: float) -> int:
+    """Equivalente a Chapa.alocar_lote, com grade_no_espaco; retorna as cópias posicionadas."""
+    largura, altura = medidas
+    passo_x, passo_y = largura + kerf, altura + kerf
+    colunas = linhas = 1
+    maior = -1
+    for ex, ey, el, ea in chapa[0]:
+        if (abs(ex - x) <= EPSILON and abs(ey - y) <= EPSILON and
+                el >= passo_x - EPSILON and ea >= passo_y - EPSILON):
+            c = int((el + EPSILON) // passo_x)
+            l = int((ea + EPSILON) // passo_y)
+            if c * l > maior:
+                maior, colunas, linhas = c * l, c, l
+    colunas = min(colunas, quantidade)
+    n = min(quantidade, colunas * linhas)
+    linhas_cheias, resto = divmod(n, colunas)
+    if linhas_cheias:
+        _simular_ocupar(chapa, x, y, colunas * passo_x - kerf, linhas_cheias * passo_y - kerf,
+                        kerf)
+    if resto:
+        _simular_ocupar(chapa, x, y + linhas_cheias * passo_y, resto * passo_x - kerf, altura,
+                        kerf)
+    return n
+
+
+def _simular_ocupar(chapa: list, x: float, y: float, largura: float, altura: float,
+                    kerf: float):
+    """Equivalente a EspacosLivres.ocupar."""
+    x2 = x + largura + kerf
+    y2 = y + altura + kerf
+    mantidos = []
+    esquerda, direita, acima, abaixo = [], [], [], []
+    for r in chapa[0]:
+        ex, ey, el, ea = r
+        ex2, ey2 = ex + el, ey + ea
+        if ex < x2 - EPSILON and ex2 > x + EPSILON and ey < y2 - EPSILON and ey2 > y + EPSILON:
+            esquerda.append((ex, ey, x - ex, ea))
+            direita.append((x2, ey, ex2 - x2, ea))
+            acima.append((ex, ey, el, y - ey))
+            abaixo.append((ex, y2, el, ey2 - y2))
+        else:
+            mantidos.append(r)
+    if len(mantidos) == len(chapa[0]):
+        return
+
+    # Só os retângulos recém-criados podem estar contidos em outros
+    novos = [r for r in esquerda + direita + acima + abaixo if r[2] > EPSILON and r[3] > EPSILON]
+    finais = []
+    for i, (ax, ay, al, aa) in enumerate(novos):
+        ax2, ay2 = ax + al, ay + aa
+        if any(ax >= bx - EPSILON and ay >= by - EPSILON and
+               ax2 <= bx + bl + EPSILON and ay2 <= by + ba + EPSILON
+               for bx, by, bl, ba in mantidos):
+            continue
+        for j, (bx, by, bl, ba) in enumerate(novos):
+            if j != i and (ax >= bx - EPSILON and ay >= by - EPSILON and
+                           ax2 <= bx + bl + EPSILON and ay2 <= by + ba + EPSILON):
+                # Entre retângulos iguais, apenas o primeiro é mantido
+                if j < i or not (bx >= ax - EPSILON and by >= ay - EPSILON and
+                                 bx + bl <= ax2 + EPSILON and by + ba <= ay2 + EPSILON):
+                    break
+        else:
+            finais.append((ax, ay, al, aa))
+    chapa[0] = mantidos = mantidos + finais
+    chapa[1] = max((r[2] for r in mantidos), default=0.0)
+    chapa[2] = max((r[3] for r in mantidos), default=0.0)
@@ -0,0 +1,109 @@
+"""
+Estoque de chapas de vários tamanhos, com quantidades limitadas e custos.
+
+Os tipos de chapa ficam ordenados por preferência em arrays NumPy, e a
+escolha da chapa a abrir para uma peça é uma única avaliação vetorizada.
+Assim um estoque grande de retalhos não torna cada alocação mais lenta.
+"""
+import numpy as np
+
+from .espacos import EPSILON, normalizar_refilo
+from .modelo import TipoChapa
+
+
+class EstoqueChapas:
+    """
+    Índice dos tipos de chapa disponíveis e das quantidades restantes.
+
+    Os tipos são ordenados pelo custo por área útil e, em caso de empate,
+    pela maior área: uma chapa maior acomoda mais peças pelo mesmo custo
+    relativo. As sobras desse critério guloso são corrigidas depois por
+    reduzir_custo, que troca chapas por tipos mais baratos.
+    """
+    __slots__ = ('tipos', 'largura_util', 'altura_util', 'quantidades', 'restantes',
+                 'custo', '_posicao')
+
+    def __init__(self, tipos: list, refilo=0.0):
+        """
+        Args:
+            tipos: Lista de TipoChapa (ou dicionários, veja TipoChapa.de_dict)
+            refilo: Refilo das bordas, descontado da área útil de cada chapa
+        """
+        tipos = [t if isinstance(t, TipoChapa) else TipoChapa.de_dict(t) for t in tipos]
+        esquerda, superior, direita, inferior = normalizar_refilo(refilo)
+        tipos = [t for t in tipos
+                 if t.largura - esquerda - direita > EPSILON and
+                 t.altura - superior - inferior > EPSILON]
+        tipos.sort(key=lambda t: (t.custo / ((t.largura - esquerda - direita) *
+                                             (t.altura - superior - inferior)),
+                                  -t.largura * t.altura))
+        self.tipos = tipos
+        self.largura_util = np.array([t.largura - esquerda - direita for t in tipos], dtype=float)
+        self.altura_util = np.array([t.altura - superior - inferior for t in tipos], dtype=float)
+        self.quantidades = np.array(
+            [np.inf if t.quantidade is None else t.quantidade for t in tipos], dtype=float)
+        self.restantes = self.quantidades.copy()
+        self.custo = np.array([t.custo for t in tipos], dtype=float)
+        self._posicao = {id(t): k for k, t in enumerate(tipos)}
+
+    def escolher(self, largura: float, altura: float, permite_rotacao: bool = False,
+                 custo_maximo: float = None):
+        """
+        Tipo de chapa preferido, ainda disponível, em que a peça cabe.
+
+        Args:
+            largura: Largura da peça
+            altura: Altura da peça
+            permite_rotacao: Se True, também aceita a peça rotacionada
+            custo_maximo: Se informado, só considera tipos mais baratos
+
+        Returns:
+            TipoChapa escolhido ou None se nenhum servir
+        """
+        cabe = (self.largura_util >= largura - EPSILON) & (self.altura_util >= altura - EPSILON)
+        if permite_rotacao:
+            cabe |= (self.largura_util >= altura - EPSILON) & (self.altura_util >= largura - EPSILON)
+        cabe &= self.restantes > 0
+        if custo_maximo is not None:
+            cabe &= self.custo < custo_maximo - EPSILON
+        k = int(cabe.argmax()) if len(cabe) else 0
+        if not len(cabe) or not cabe[k]:
+            return None
+        return self.tipos[k]
+
+    def candidatos(self, area: float, largura: float, altura: float,
+                   custo_maximo: float) -> list:
+        """
+        Tipos disponíveis mais baratos que custo_maximo com área útil suficiente.
+
+        Args:
+            area: Área total das peças que a chapa precisa receber
+            largura: Menor largura útil aceitável
+            altura: Menor altura útil aceitável
+            custo_maximo: Custo da chapa a ser substituída
+
+        Returns:
+            Lista de TipoChapa, do mais barato para o mais caro
+        """
+        lu, au = self.largura_util, self.altura_util
+        cabe = (((lu >= largura - EPSILON) & (au >= altura - EPSILON)) |
+                ((lu >= altura - EPSILON) & (au >= largura - EPSILON)))
+        ok = np.flatnonzero(cabe & (self.restantes > 0) &
+                            (self.custo < custo_maximo - EPSILON) &
+                            (lu * au >= area - EPSILON))
+        ok = ok[np.argsort(self.custo[ok], kind='stable')]
+        return [self.tipos[k] for k in ok]
+
+    def retirar(self, tipo: TipoChapa):
+        """Registra que uma chapa do tipo foi aberta."""
+        self.restantes[self._posicao[id(tipo)]] -= 1
+
+    def devolver(self, tipo: TipoChapa):
+        """Registra que uma chapa do tipo deixou de ser usada."""
+        self.restantes[self._posicao[id(tipo)]] += 1
+
+    def recontar(self, chapas: list):
+        """Recalcula as quantidades restantes a partir das chapas em uso."""
+        self.restantes = self.quantidades.copy()
+        for chapa in chapas:
+            self.retirar(chapa.tipo)
@@ -0,0 +1,218 @@
+"""
+Heurísticas de posicionamento disponíveis para o algoritmo de corte.
+
+Cada heurística é uma estrutura de espaços livres de uma chapa com a mesma
+interface de EspacosLivres: o atributo retangulos (array NumPy com os
+retângulos onde uma peça pode ser posicionada) e os métodos melhor_espaco,
+ocupar e reconstruir. Assim o motor de corte trata todas da mesma forma.
+Todas recebem o kerf e o refilo da chapa e os aplicam do mesmo modo: cada
+peça ocupa suas medidas mais um kerf (veja espacos.area_util).
+"""
+import numpy as np
+
+from . import instrumentacao
+from .espacos import EPSILON, EspacosLivres, area_util, avaliar_encaixe, normalizar_refilo
+
+
+class EspacosGuilhotina:
+    """
+    Espaços livres disjuntos divididos por cortes de ponta a ponta (guilhotina).
+
+    Cada peça é posicionada no canto de um retângulo livre, que é dividido em
+    dois pelo eixo de menor sobra. O layout resultante pode ser cortado com
+    cortes retos de lado a lado, como em uma seccionadora.
+    """
+    __slots__ = ('largura', 'altura', 'kerf', 'refilo', 'retangulos')
+
+    def __init__(self, largura: float, altura: float, kerf: float = 0.0, refilo=0.0):
+        self.largura = largura
+        self.altura = altura
+        self.kerf = kerf
+        self.refilo = normalizar_refilo(refilo)
+        self.retangulos = np.array([area_util(largura, altura, kerf, self.refilo)], dtype=float)
+
+    def melhor_espaco(self, largura: float, altura: float, permite_rotacao: bool = False):
+        """Escolhe o retângulo livre de menor área residual."""
+        return avaliar_encaixe(self.retangulos, largura + self.kerf, altura + self.kerf,
+                               permite_rotacao, 'baf')
+
+    def ocupar(self, x: float, y: float, largura: float, altura: float):
+        """
+        Posiciona a região no canto do retângulo livre que começa em (x, y).
+
+        Args:
+            x: Posição horizontal da região
+            y: Posição vertical da região
+            largura: Largura da região
+            altura: Altura da região
+        """
+        ret = self.retangulos
+        largura += self.kerf
+        altura += self.kerf
+        candidatos = np.flatnonzero(
+            (np.abs(ret[:, 0] - x) <= EPSILON) & (np.abs(ret[:, 1] - y) <= EPSILON))
+        if not len(candidatos):
+            raise ValueError(f"Não há espaço livre de guilhotina em ({x}, {y}).")
+        idx = int(candidatos[0])
+        if instrumentacao.contadores is not None:
+            instrumentacao.contadores['ocupacoes'] += 1
+            instrumentacao.contadores['divisoes_retangulos'] += 1
+        ex, ey, el, ea = ret[idx]
+        sobra_l = el - largura
+        sobra_a = ea - altura
+
+        # Divide pelo eixo de menor sobra
+        if sobra_l <= sobra_a:
+            direita = (x + largura, ey, sobra_l, altura)
+            abaixo = (ex, y + altura, el, sobra_a)
+        else:
+            direita = (x + largura, ey, sobra_l, ea)
+            abaixo = (ex, y + altura, largura, sobra_a)
+
+        novos = [r for r in (direita, abaixo) if r[2] > EPSILON and r[3] > EPSILON]
+        self.retangulos = np.concatenate(
+            (ret[:idx], np.array(novos).reshape(-1, 4), ret[idx + 1:]))
+
+    def reconstruir(self, pecas_alocadas: list) -> 'EspacosGuilhotina':
+        """
+        Mantém os espaços atuais quando peças saem da chapa.
+
+        O espaço liberado não é reaproveitado, pois reocupá-lo poderia
+        quebrar a sequência de cortes de guilhotina da chapa.
+        """
+        return self
+
+
+class EspacosSkyline:
+    """
+    Linha do horizonte (skyline) das peças já posicionadas na chapa.
+
+    A chapa é preenchida de baixo para cima. Cada segmento do horizonte
+    guarda a altura ocupada naquela faixa, e cada peça é apoiada sobre o
+    horizonte na posição mais baixa e mais à esquerda possível.
+    """
+    __slots__ = ('largura', 'altura', 'kerf', 'refilo', 'segmentos', 'retangulos', '_limite')
+
+    def __init__(self, largura: float, altura: float, kerf: float = 0.0, refilo=0.0):
+        self.largura = largura
+        self.altura = altura
+        self.kerf = kerf
+        self.refilo = normalizar_refilo(refilo)
+        x0, y0, largura_util, altura_util = area_util(largura, altura, kerf, self.refilo)
+        # Cada segmento é uma lista [x, y, largura]
+        self.segmentos = [[x0, y0, largura_util]]
+        self.retangulos = np.array([[x0, y0, largura_util, altura_util]], dtype=float)
+        # Topo da área útil, acima do qual o horizonte não pode subir
+        self._limite = y0 + altura_util
+
+    def melhor_espaco(self, largura: float, altura: float, permite_rotacao: bool = False):
+        """Escolhe a posição mais baixa e, em seguida, mais à esquerda."""
+        return avaliar_encaixe(self.retangulos, largura + self.kerf, altura + self.kerf,
+                               permite_rotacao, 'bl')
+
+    def ocupar(self, x: float, y: float, largura: float, altura: float):
+        """
+        Eleva o horizonte na faixa ocupada pela região.
+
+        Args:
+            x: Posição horizontal da região
+            y: Posição vertical da região (apoiada sobre o horizonte)
+            largura: Largura da região
+            altura: Altura da região
+        """
+        if instrumentacao.contadores is not None:
+            instrumentacao.contadores['ocupacoes'] += 1
+        largura += self.kerf
+        altura += self.kerf
+        x2 = x + largura
+        novos = []
+        for sx, sy, sl in self.segmentos:
+            sx2 = sx + sl
+            if sx2 <= x + EPSILON or sx >= x2 - EPSILON:
+                novos.append([sx, sy, sl])
+                continue
+            if sx < x:
+                novos.append([sx, sy, x - sx])
+            if sx2 > x2:
+                novos.append([x2, sy, sx2 - x2])
+        novos.append([x, y + altura, largura])
+        novos.sort()
+
+        # Junta segmentos vizinhos de mesma altura
+        self.segmentos = [novos[0]]
+        for seg in novos[1:]:
+            ultimo = self.segmentos[-1]
+            if abs(ultimo[1] - seg[1]) <= EPSILON:
+                ultimo[2] += seg[2]
+            else:
+                self.segmentos.append(seg)
+        self.retangulos = self._retangulos_livres()
+
+    def _retangulos_livres(self) -> np.ndarray:
+        """
+        Retângulos livres acima do horizonte.
+
+        Para cada segmento inicial i e final j, a região que começa em x_i,
+        tem a largura somada dos segmentos i..j e fica acima do mais alto
+        deles está livre. Uma peça cabe apoiada em x_i se couber em algum
+        desses retângulos.
+        """
+        seg = np.array(self.segmentos)
+        sx, sy, sl = seg[:, 0], seg[:, 1], seg[:, 2]
+        n = len(seg)
+        i, j = np.triu_indices(n)
+        fim = sx[j] + sl[j]
+        # Altura máxima entre os segmentos i..j
+        topo = np.maximum.accumulate(
+            np.where(np.arange(n)[None, :] >= np.arange(n)[:, None], sy[None, :], -np.inf),
+            axis=1)[i, j]
+        ret = np.column_stack((sx[i], topo, fim - sx[i], self._limite - topo))
+        return ret[ret[:, 3] > EPSILON]
+
+    def reconstruir(self, pecas_alocadas: list) -> 'EspacosSkyline':
+        """
+        Mantém o horizonte atual quando peças saem da chapa.
+
+        O horizonte só sobe; a área liberada abaixo dele não é reaproveitada.
+        """
+        return self
+
+
+HEURISTICAS = {
+    'maxrects-baf': lambda largura, altura, **opcoes: EspacosLivres(largura, altura, 'baf', **opcoes),
+    'maxrects-bssf': lambda largura, altura, **opcoes: EspacosLivres(largura, altura, 'bssf', **opcoes),
+    'maxrects-blsf': lambda largura, altura, **opcoes: EspacosLivres(largura, altura, 'blsf', **opcoes),
+    'maxrects-bl': lambda largura, altura, **opcoes: EspacosLivres(largura, altura, 'bl', **opcoes),
+    'guilhotina': EspacosGuilhotina,
+    'skyline': EspacosSkyline,
+}
+
+HEURISTICA_PADRAO = 'maxrects-baf'
+
+
+def criar_espacos(heuristica: str, largura: float, altura: float,
+                  kerf: float = 0.0, refilo=0.0):
+    """
+    Cria a estrutura de espaços livres de uma chapa para a heurística escolhida.
+
+    Args:
+        heuristica: Nome da heurística (uma das chaves de HEURISTICAS)
+        largura: Largura da chapa
+        altura: Altura da chapa
+        kerf: Espessura do corte da serra
+        refilo: Refilo das bordas (veja espacos.normalizar_refilo)
+
+    Returns:
+        Estrutura de espaços livres da chapa
+    """
+    validar_heuristica(heuristica)
+    return HEURISTICAS[heuristica](largura, altura, kerf=kerf, refilo=refilo)
+
+
+def validar_heuristica(heuristica: str):
+    """Levanta ValueError se a heurística não estiver registrada."""
+    if heuristica not in HEURISTICAS:
+        raise ValueError(
+            f"Heurística desconhecida: {heuristica}. "
+            f"Opções: {', '.join(HEURISTICAS)}."
+        )
@@ -0,0 +1,203 @@
+"""
+Instrumentação opcional do motor de corte: contadores e tempos por etapa.
+
+Desligada por padrão. Os pontos instrumentados só testam se contadores é
+None antes de contar, ao lado de operações NumPy muito mais caras, então o
+custo com a instrumentação desligada é desprezível. Para ligar, use o
+gerenciador de contexto perfil:
+
+    with perfil() as relatorio:
+        cortar_chapas(275, 184, pecas)
+    # o relatório é escrito em sys.stderr ao sair do bloco
+
+O estado é global ao processo: otimizações em outras threads durante o
+bloco também são contadas. Cálculos auxiliares que reutilizam estruturas
+instrumentadas (por exemplo, as métricas do plano) ficam em um bloco
+sem_contagem, para não somar aos contadores do motor.
+"""
+import cProfile
+import io
+import pstats
+import sys
+import time
+from collections import Counter
+
+# Contadores e tempos (nome -> [segundos, chamadas]) ativos, ou None se desligada
+contadores = None
+tempos = None
+
+
+def somar(**valores):
+    """Soma valores aos contadores, se a instrumentação estiver ligada."""
+    if contadores is not None:
+        contadores.update(valores)
+
+
+def registrar_tempo(nome: str, segundos: float):
+    """Acumula a duração de uma etapa, se a instrumentação estiver ligada."""
+    if tempos is not None:
+        total = tempos.setdefault(nome, [0.0, 0])
+        total[0] += segundos
+        total[1] += 1
+
+
+def registrar_tempos(duracoes: dict):
+    """Acumula as durações de várias etapas (por exemplo, ResultadoCorte.tempos)."""
+    if tempos is not None:
+        for nome, segundos in duracoes.items():
+            registrar_tempo(nome, segundos)
+
+
+class _Etapa:
+    """Cronômetro de uma etapa, usado com with."""
+    __slots__ = ('nome', 'inicio')
+
+    def __init__(self, nome: str):
+        self.nome = nome
+
+    def __enter__(self):
+        self.inicio = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        registrar_tempo(self.nome, time.perf_counter() - self.inicio)
+        return False
+
+
+class _EtapaNula:
+    """Substituto sem custo de _Etapa com a instrumentação desligada."""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_ETAPA_NULA = _EtapaNula()
+
+
+def etapa(nome: str):
+    """
+    Mede a duração de um bloco with como uma etapa.
+
+    Com a instrumentação desligada, devolve um objeto que não faz nada.
+    """
+    return _ETAPA_NULA if tempos is None else _Etapa(nome)
+
+
+class RelatorioPerfil:
+    """Contadores, tempos por etapa e, opcionalmente, o cProfile de um bloco perfil."""
+
+    def __init__(self):
+        self.contadores = Counter()
+        self.tempos = {}
+        self.duracao = 0.0
+        self.funcoes = None
+
+    def para_dict(self) -> dict:
+        """Relatório em dicionário, para gravar em JSON."""
+        return {
+            'duracao': self.duracao,
+            'contadores': dict(self.contadores),
+            'tempos': {nome: {'total': total, 'chamadas': chamadas}
+                       for nome, (total, chamadas) in self.tempos.items()},
+        }
+
+    def formatar(self) -> str:
+        """Relatório em texto, com uma linha por contador e por etapa."""
+        linhas = [f"Perfil do motor de corte ({self.duracao:.3f} s)"]
+        if self.contadores:
+            linhas.append("Contadores:")
+            largura = max(len(nome) for nome in self.contadores)
+            for nome, valor in sorted(self.contadores.items()):
+                linhas.append(f"  {nome:<{largura}}  {valor:>12,}")
+        if self.tempos:
+            linhas.append("Etapas:")
+            largura = max(len(nome) for nome in self.tempos)
+            for nome, (total, chamadas) in sorted(self.tempos.items(),
+                                                  key=lambda item: -item[1][0]):
+                linhas.append(f"  {nome:<{largura}}  {total:>9.4f} s  {chamadas:>7} chamada(s)"
+                              f"  {total / chamadas * 1000:>9.3f} ms/chamada")
+        if self.funcoes:
+            linhas.append(self.funcoes)
+        return "\n".join(linhas)
+
+
+class perfil:
+    """
+    Liga a instrumentação durante um bloco with e escreve o relatório ao sair.
+
+    Args:
+        destino: Arquivo (caminho ou objeto com write) onde escrever o
+            relatório, ou None para não escrever (padrão: sys.stderr)
+        cprofile: Se True, também executa o cProfile e inclui no relatório
+            as funções com maior tempo acumulado
+        funcoes: Quantas funções do cProfile listar
+    """
+
+    def __init__(self, destino=sys.stderr, cprofile: bool = False, funcoes: int = 20):
+        self.destino = destino
+        self.funcoes = funcoes
+        self.relatorio = RelatorioPerfil()
+        self._perfilador = cProfile.Profile() if cprofile else None
+        self._anteriores = None
+
+    def __enter__(self) -> RelatorioPerfil:
+        global contadores, tempos
+        self._anteriores = (contadores, tempos)
+        contadores, tempos = self.relatorio.contadores, self.relatorio.tempos
+        self._inicio = time.perf_counter()
+        if self._perfilador is not None:
+            self._perfilador.enable()
+        return self.relatorio
+
+    def __exit__(self, *exc):
+        global contadores, tempos
+        if self._perfilador is not None:
+            self._perfilador.disable()
+        relatorio = self.relatorio
+        relatorio.duracao = time.perf_counter() - self._inicio
+        contadores, tempos = self._anteriores
+
+        # Em blocos aninhados, o bloco externo também recebe o que foi medido aqui
+        if contadores is not None:
+            contadores.update(relatorio.contadores)
+            for nome, (total, chamadas) in relatorio.tempos.items():
+                acumulado = tempos.setdefault(nome, [0.0, 0])
+                acumulado[0] += total
+                acumulado[1] += chamadas
+
+        if self._perfilador is not None:
+            texto = io.StringIO()
+            pstats.Stats(self._perfilador, stream=texto).sort_stats('cumulative') \
+                .print_stats(self.funcoes)
+            relatorio.funcoes = texto.getvalue().strip()
+        if self.destino is not None:
+            if isinstance(self.destino, str):
+                with open(self.destino, 'w', encoding='utf-8') as f:
+                    f.write(relatorio.formatar() + "\n")
+            else:
+                print(relatorio.formatar(), file=self.destino)
+        return False
+
+
+class sem_contagem:
+    """
+    Desliga a instrumentação durante um bloco with e a restaura ao sair.
+
+    Como o estado é global ao processo, otimizações em outras threads
+    durante o bloco também deixam de ser contadas.
+    """
+
+    def __enter__(self):
+        global contadores, tempos
+        self._anteriores = (contadores, tempos)
+        contadores = tempos = None
+        return self
+
+    def __exit__(self, *exc):
+        global contadores, tempos
+        contadores, tempos = self._anteriores
+        return False
@@ -0,0 +1,99 @@
+import time
+
+from . import instrumentacao
+from .espacos import IndiceEspacos
+
+
+def melhorar_layout(chapas: list, max_iteracoes: int = None, tempo_limite: float = None) -> dict:
+    """
+    Etapa de melhoria pós-otimização: move peças para chapas posteriores.
+
+    As chapas são percorridas em passadas. Em cada passada, cada peça tenta
+    ser movida (rotacionada, se permitido) para a primeira chapa posterior em que
+    couber. O índice de espaços é atualizado a cada movimento, sem recomeçar
+    a busca da primeira chapa. Chapas que ficam vazias são removidas ao fim
+    da passada, e novas passadas são feitas enquanto houver movimentos.
+
+    Args:
+        chapas: Lista de Chapa, alterada no próprio lugar
+        max_iteracoes: Número máximo de tentativas de movimento (None = sem limite)
+        tempo_limite: Tempo máximo em segundos (None = sem limite)
+
+    Returns:
+        Dicionário com:
+        - movimentos: quantidade de peças movidas
+        - iteracoes: quantidade de tentativas de movimento
+        - chapas_removidas: quantidade de chapas que ficaram vazias
+        - tempo: duração da etapa em segundos
+        - interrompida: True se algum limite foi atingido
+    """
+    inicio = time.perf_counter()
+    prazo = inicio + tempo_limite if tempo_limite is not None else None
+    movimentos = 0
+    iteracoes = 0
+    chapas_removidas = 0
+    interrompida = False
+    # Chapas que perderam peças e precisam ter seus espaços reconstruídos
+    alteradas = set()
+
+    movimentos_passada = 1
+    while movimentos_passada and not interrompida:
+        movimentos_passada = 0
+        with instrumentacao.etapa('reconstrucao_espacos'):
+            for i in alteradas:
+                chapas[i].espacos = chapas[i].espacos.reconstruir(chapas[i].pecas)
+        instrumentacao.somar(reconstrucoes=len(alteradas))
+        alteradas.clear()
+        indice = IndiceEspacos([chapa.espacos for chapa in chapas])
+
+        for i, chapa in enumerate(chapas):
+            for alocada in list(chapa.pecas):
+                if ((max_iteracoes is not None and iteracoes >= max_iteracoes) or
+                        (prazo is not None and time.perf_counter() >= prazo)):
+                    interrompida = True
+                    break
+                iteracoes += 1
+
+                encaixe = indice.primeiro_encaixe(
+                    alocada.largura, alocada.altura,
+                    permite_rotacao=alocada.peca.pode_rotacionar, a_partir_de=i + 1)
+                if not encaixe:
+                    continue
+
+                # Move a peça para a outra chapa
+                j, alocada.x, alocada.y, rotacionar = encaixe
+                if rotacionar:
+                    alocada.rotacionar()
+                outra_chapa = chapas[j]
+                outra_chapa.pecas.append(alocada)
+                outra_chapa.espacos.ocupar(
+                    alocada.x, alocada.y, alocada.largura, alocada.altura)
+                indice.atualizar(j, outra_chapa.espacos)
+                chapa.pecas.remove(alocada)
+                alteradas.add(i)
+                movimentos += 1
+                movimentos_passada += 1
+            if interrompida:
+                break
+
+        # Remove as chapas que ficaram vazias
+        vazias = [i for i in alteradas if not chapas[i].pecas]
+        for i in sorted(vazias, reverse=True):
+            del chapas[i]
+        chapas_removidas += len(vazias)
+        alteradas = {i - sum(1 for v in vazias if v < i) for i in alteradas if i not in vazias}
+
+    # Deixa os espaços coerentes com as peças que restaram
+    with instrumentacao.etapa('reconstrucao_espacos'):
+        for i in alteradas:
+            chapas[i].espacos = chapas[i].espacos.reconstruir(chapas[i].pecas)
+    instrumentacao.somar(reconstrucoes=len(alteradas), tentativas_realocacao=iteracoes,
+                         realocacoes=movimentos, chapas_esvaziadas=chapas_removidas)
+
+    return {
+        'movimentos': movimentos,
+        'iteracoes': iteracoes,
+        'chapas_removidas': chapas_removidas,
+        'tempo': time.perf_counter() - inicio,
+        'interrompida': interrompida
+    }
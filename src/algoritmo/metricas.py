@@ -0,0 +1,152 @@
+"""
+Métricas de qualidade de um plano de corte.
+
+As métricas são calculadas a partir dos dicionários de chapas devolvidos por
+cortar_chapas, de modo que valem igualmente para resultados novos, vindos
+do cache ou de uma reotimização incremental.
+"""
+from collections import defaultdict
+
+from . import instrumentacao
+from .espacos import EPSILON, EspacosLivres, normalizar_refilo
+
+# Menor lado (cm) para uma sobra ser considerada reaproveitável
+LADO_MINIMO_SOBRA = 10.0
+
+
+def calcular_metricas(chapas: list, largura_chapa: float, altura_chapa: float,
+                      kerf: float = 0.0, refilo=0.0,
+                      lado_minimo_sobra: float = LADO_MINIMO_SOBRA) -> dict:
+    """
+    Calcula o aproveitamento, o desperdício, a maior sobra e os cortes do plano.
+
+    Args:
+        chapas: Chapas com suas peças alocadas, como devolvidas por cortar_chapas
+        largura_chapa: Largura das chapas que não informam a própria largura
+        altura_chapa: Altura das chapas que não informam a própria altura
+        kerf: Espessura do corte da serra usada na otimização
+        refilo: Refilo das bordas usado na otimização
+        lado_minimo_sobra: Menor lado de uma sobra reaproveitável
+
+    Returns:
+        Dicionário com:
+        - chapas: por chapa, id_chapa, aproveitamento, area_pecas, desperdicio (área),
+          maior_sobra (x, y, largura, altura ou None), cortes e comprimento_corte
+        - aproveitamento: área das peças / área das chapas
+        - area_pecas, area_chapas e desperdicio: áreas totais
+        - maior_sobra: a maior sobra entre todas as chapas, com id_chapa, ou None
+        - cortes e comprimento_corte: totais de todas as chapas
+    """
+    refilo = normalizar_refilo(refilo)
+    por_chapa = []
+    maior_sobra = None
+    for chapa in chapas:
+        largura = chapa.get('largura', largura_chapa)
+        altura = chapa.get('altura', altura_chapa)
+        pecas = chapa['pecas_alocadas']
+        area_pecas = sum(p['largura'] * p['altura'] for p in pecas)
+        sobra = _maior_sobra(pecas, largura, altura, kerf, refilo, lado_minimo_sobra)
+        cortes, comprimento = _contar_cortes(pecas, largura, altura, kerf, refilo)
+        por_chapa.append({
+            'id_chapa': chapa['id_chapa'],
+            'aproveitamento': area_pecas / (largura * altura),
+            'area_pecas': area_pecas,
+            'desperdicio': largura * altura - area_pecas,
+            'maior_sobra': sobra,
+            'cortes': cortes,
+            'comprimento_corte': comprimento,
+        })
+        if sobra and (maior_sobra is None or
+                      sobra[2] * sobra[3] > maior_sobra['largura'] * maior_sobra['altura']):
+            maior_sobra = {'id_chapa': chapa['id_chapa'], 'x': sobra[0], 'y': sobra[1],
+                           'largura': sobra[2], 'altura': sobra[3]}
+
+    area_pecas = sum(m['area_pecas'] for m in por_chapa)
+    area_chapas = sum(chapa.get('largura', largura_chapa) * chapa.get('altura', altura_chapa)
+                      for chapa in chapas)
+    return {
+        'chapas': por_chapa,
+        'aproveitamento': area_pecas / area_chapas if area_chapas else 0.0,
+        'area_pecas': area_pecas,
+        'area_chapas': area_chapas,
+        'desperdicio': area_chapas - area_pecas,
+        'maior_sobra': maior_sobra,
+        'cortes': sum(m['cortes'] for m in por_chapa),
+        'comprimento_corte': sum(m['comprimento_corte'] for m in por_chapa),
+    }
+
+
+def _maior_sobra(pecas: list, largura: float, altura: float, kerf: float,
+                 refilo: tuple, lado_minimo: float):
+    """
+    Maior retângulo livre da chapa com os dois lados de pelo menos lado_minimo.
+
+    Returns:
+        Tupla (x, y, largura, altura) ou None se não houver sobra reaproveitável
+    """
+    # Reconstruir os espaços não é trabalho do motor: não entra no perfil
+    with instrumentacao.sem_contagem():
+        espacos = EspacosLivres(largura, altura, kerf=kerf, refilo=refilo)
+        for p in pecas:
+            espacos.ocupar(p['x'], p['y'], p['largura'], p['altura'])
+    # Os espaços livres incluem o kerf de folga à direita e abaixo
+    ret = espacos.retangulos
+    if not len(ret):
+        return None
+    larguras = ret[:, 2] - kerf
+    alturas = ret[:, 3] - kerf
+    areas = larguras * alturas
+    areas[(larguras < lado_minimo - EPSILON) | (alturas < lado_minimo - EPSILON)] = -1.0
+    i = int(areas.argmax())
+    if areas[i] < 0:
+        return None
+    return (float(ret[i, 0]), float(ret[i, 1]), float(larguras[i]), float(alturas[i]))
+
+
+def _contar_cortes(pecas: list, largura: float, altura: float, kerf: float,
+                   refilo: tuple) -> tuple:
+    """
+    Estima os cortes da serra necessários para separar as peças da chapa.
+
+    Cada lado de peça que não está na borda útil da chapa exige um corte.
+    Lados alinhados de peças vizinhas (separadas pelo kerf) e trechos
+    contínuos de uma mesma linha contam como um único corte.
+
+    Returns:
+        Tupla (quantidade de cortes, comprimento total dos cortes)
+    """
+    esquerda, superior, direita, inferior = refilo
+    limite_x = largura - direita
+    limite_y = altura - inferior
+    meio = kerf / 2
+    verticais = defaultdict(list)
+    horizontais = defaultdict(list)
+    for p in pecas:
+        x, y, w, h = p['x'], p['y'], p['largura'], p['altura']
+        # Cada linha de corte fica no meio do kerf entre as peças
+        if x > esquerda + EPSILON:
+            verticais[round(x - meio, 6)].append((y, y + h))
+        if x + w < limite_x - EPSILON:
+            verticais[round(x + w + meio, 6)].append((y, y + h))
+        if y > superior + EPSILON:
+            horizontais[round(y - meio, 6)].append((x, x + w))
+        if y + h < limite_y - EPSILON:
+            horizontais[round(y + h + meio, 6)].append((x, x + w))
+
+    cortes = 0
+    comprimento = 0.0
+    for linhas in (verticais, horizontais):
+        for trechos in linhas.values():
+            trechos.sort()
+            inicio, fim = trechos[0]
+            for a, b in trechos[1:]:
+                # Trechos separados apenas pelo kerf são o mesmo corte
+                if a <= fim + kerf + EPSILON:
+                    fim = max(fim, b)
+                else:
+                    cortes += 1
+                    comprimento += fim - inicio
+                    inicio, fim = a, b
+            cortes += 1
+            comprimento += fim - inicio
+    return cortes, comprimento
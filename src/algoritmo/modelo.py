@@ -0,0 +1,277 @@
+"""
+Representação compacta das peças, alocações e chapas usadas pelo algoritmo.
+
+As classes usam __slots__ para reduzir o consumo de memória e o custo de
+acesso aos atributos nos laços de encaixe. A conversão de e para os
+dicionários usados pela interface gráfica é feita por de_dict/para_dict.
+"""
+from . import instrumentacao
+from .espacos import grade_no_espaco
+from .metricas import calcular_metricas
+
+
+class Peca:
+    """
+    Peça a ser cortada, com a quantidade de cópias idênticas pedidas.
+
+    pode_rotacionar é False para peças que precisam manter a direção do
+    veio (por exemplo, chapas folheadas).
+    """
+    __slots__ = ('id', 'largura', 'altura', 'original_idx', 'quantidade', 'pode_rotacionar')
+
+    def __init__(self, id, largura: float, altura: float, original_idx: int,
+                 quantidade: int = 1, pode_rotacionar: bool = True):
+        self.id = id
+        self.largura = largura
+        self.altura = altura
+        self.original_idx = original_idx
+        self.quantidade = quantidade
+        self.pode_rotacionar = pode_rotacionar
+
+    @property
+    def area(self) -> float:
+        return self.largura * self.altura
+
+    def cabe_em(self, largura: float, altura: float) -> bool:
+        """Verifica se a peça cabe na área dada, em alguma orientação permitida."""
+        return ((self.largura <= largura and self.altura <= altura) or
+                (self.pode_rotacionar and self.altura <= largura and self.largura <= altura))
+
+    @classmethod
+    def de_dict(cls, dados: dict) -> 'Peca':
+        """
+        Cria uma peça a partir do dicionário usado pela interface.
+
+        Args:
+            dados: Dicionário com id, larg (ou largura), alt (ou altura),
+                original_idx e, opcionalmente, quant e pode_rotacionar
+
+        Returns:
+            Peca correspondente
+        """
+        return cls(
+            dados['id'],
+            dados['larg'] if 'larg' in dados else dados['largura'],
+            dados['alt'] if 'alt' in dados else dados['altura'],
+            dados['original_idx'],
+            dados.get('quant', 1),
+            dados.get('pode_rotacionar', True)
+        )
+
+    def para_dict(self) -> dict:
+        """Converte a peça para o dicionário usado pela interface."""
+        return {
+            'id': self.id,
+            'larg': self.largura,
+            'alt': self.altura,
+            'original_idx': self.original_idx,
+            'quant': self.quantidade,
+            'pode_rotacionar': self.pode_rotacionar
+        }
+
+    def com_quantidade(self, quantidade: int) -> 'Peca':
+        """Retorna uma cópia da peça com outra quantidade."""
+        return Peca(self.id, self.largura, self.altura, self.original_idx,
+                    quantidade, self.pode_rotacionar)
+
+    def __repr__(self):
+        return f"Peca({self.id!r}, {self.largura}x{self.altura}, quantidade={self.quantidade})"
+
+
+class PecaAlocada:
+    """Uma cópia de uma peça posicionada em uma chapa."""
+    __slots__ = ('peca', 'copia', 'x', 'y', 'largura', 'altura', 'rotacionada')
+
+    def __init__(self, peca: Peca, x: float, y: float, rotacionada: bool = False,
+                 copia: int = 0):
+        self.peca = peca
+        self.copia = copia
+        self.x = x
+        self.y = y
+        self.rotacionada = rotacionada
+        if rotacionada:
+            self.largura, self.altura = peca.altura, peca.largura
+        else:
+            self.largura, self.altura = peca.largura, peca.altura
+
+    def rotacionar(self):
+        """Troca largura e altura da peça alocada."""
+        self.largura, self.altura = self.altura, self.largura
+        self.rotacionada = not self.rotacionada
+
+    def para_dict(self) -> dict:
+        """Converte a alocação para o dicionário usado pela interface."""
+        dados = {
+            'id': self.peca.id,
+            'x': self.x,
+            'y': self.y,
+            'largura': self.largura,
+            'altura': self.altura,
+            'original_idx': self.peca.original_idx,
+            'copia': self.copia
+        }
+        if self.rotacionada:
+            dados['rotacionada'] = True
+        return dados
+
+
+class TipoChapa:
+    """
+    Tamanho de chapa disponível em estoque: chapa inteira ou retalho.
+
+    quantidade None indica estoque ilimitado. Sem custo informado, o custo
+    da chapa é a sua área, de modo que minimizar o custo equivale a
+    minimizar a área de chapa usada.
+    """
+    __slots__ = ('id', 'largura', 'altura', 'quantidade', 'custo')
+
+    def __init__(self, id, largura: float, altura: float, quantidade: int = None,
+                 custo: float = None):
+        self.id = id
+        self.largura = largura
+        self.altura = altura
+        self.quantidade = quantidade
+        self.custo = largura * altura if custo is None else custo
+
+    @classmethod
+    def de_dict(cls, dados: dict) -> 'TipoChapa':
+        """
+        Cria um tipo de chapa a partir de um dicionário.
+
+        Args:
+            dados: Dicionário com larg (ou largura), alt (ou altura) e,
+                opcionalmente, id, quant e custo
+
+        Returns:
+            TipoChapa correspondente
+        """
+        return cls(
+            dados.get('id'),
+            dados['larg'] if 'larg' in dados else dados['largura'],
+            dados['alt'] if 'alt' in dados else dados['altura'],
+            dados.get('quant'),
+            dados.get('custo')
+        )
+
+    def __repr__(self):
+        return f"TipoChapa({self.id!r}, {self.largura}x{self.altura}, quantidade={self.quantidade})"
+
+
+class Chapa:
+    """Chapa em uso com suas peças alocadas e seus espaços livres."""
+    __slots__ = ('largura', 'altura', 'pecas', 'espacos', 'tipo')
+
+    def __init__(self, largura: float, altura: float, espacos, tipo: TipoChapa = None):
+        self.largura = largura
+        self.altura = altura
+        self.pecas = []
+        self.espacos = espacos
+        self.tipo = tipo
+
+    def alocar(self, peca: Peca, x: float, y: float, rotacionada: bool = False,
+               copia: int = 0) -> PecaAlocada:
+        """Posiciona a peça na chapa e atualiza os espaços livres."""
+        alocada = PecaAlocada(peca, x, y, rotacionada, copia)
+        self.pecas.append(alocada)
+        self.espacos.ocupar(x, y, alocada.largura, alocada.altura)
+        return alocada
+
+    def alocar_lote(self, peca: Peca, x: float, y: float, quantidade: int,
+                    primeira_copia: int = 0, rotacionada: bool = False) -> int:
+        """
+        Posiciona várias cópias da peça em bloco (linhas de peças iguais).
+
+        O bloco começa em (x, y) e ocupa o maior retângulo livre com esse
+        canto. As linhas completas e a última linha parcial são marcadas
+        como ocupadas de uma só vez. As cópias ficam separadas pelo kerf
+        dos espaços livres da chapa.
+
+        Args:
+            peca: Peça a ser repetida
+            x: Posição horizontal do canto do bloco
+            y: Posição vertical do canto do bloco
+            quantidade: Número de cópias ainda a alocar
+            primeira_copia: Número da primeira cópia do bloco
+            rotacionada: Se True, as cópias são posicionadas rotacionadas
+
+        Returns:
+            Quantidade de cópias posicionadas (pelo menos 1)
+        """
+        if rotacionada:
+            largura, altura = peca.altura, peca.largura
+        else:
+            largura, altura = peca.largura, peca.altura
+        kerf = self.espacos.kerf
+        # Distância entre cópias vizinhas, incluindo o corte entre elas
+        passo_x, passo_y = largura + kerf, altura + kerf
+        colunas, linhas = grade_no_espaco(self.espacos.retangulos, x, y, passo_x, passo_y)
+        colunas = min(colunas, quantidade)
+        n = min(quantidade, colunas * linhas)
+        linhas_cheias, resto = divmod(n, colunas)
+
+        for i in range(n):
+            linha, coluna = divmod(i, colunas)
+            self.pecas.append(PecaAlocada(
+                peca, x + coluna * passo_x, y + linha * passo_y,
+                rotacionada, primeira_copia + i))
+
+        # ocupar acrescenta um kerf ao bloco; os cortes internos já estão no passo
+        if linhas_cheias:
+            self.espacos.ocupar(x, y, colunas * passo_x - kerf, linhas_cheias * passo_y - kerf)
+        if resto:
+            self.espacos.ocupar(x, y + linhas_cheias * passo_y, resto * passo_x - kerf, altura)
+        return n
+
+    def para_dict(self, id_chapa: int) -> dict:
+        """Converte a chapa para o dicionário usado pela interface."""
+        dados = {
+            'id_chapa': id_chapa,
+            'largura': self.largura,
+            'altura': self.altura,
+            'pecas_alocadas': [p.para_dict() for p in self.pecas]
+        }
+        if self.tipo is not None and self.tipo.id is not None:
+            dados['id_estoque'] = self.tipo.id
+        return dados
+
+
+class ResultadoCorte(tuple):
+    """
+    Resultado de uma otimização: a tupla (chapas, nao_alocadas) com métricas.
+
+    Continua podendo ser desempacotado como antes. As métricas do plano
+    (veja calcular_metricas) só são calculadas no primeiro acesso a
+    metricas; tempos traz a duração de cada etapa da otimização, em segundos.
+    """
+
+    def __new__(cls, chapas: list, nao_alocadas: list, largura_chapa: float,
+                altura_chapa: float, kerf: float = 0.0, refilo=0.0, tempos: dict = None):
+        resultado = super().__new__(cls, (chapas, nao_alocadas))
+        resultado._medidas = (largura_chapa, altura_chapa, kerf, refilo)
+        resultado.tempos = tempos if tempos is not None else {}
+        resultado._metricas = None
+        return resultado
+
+    @property
+    def chapas(self) -> list:
+        return self[0]
+
+    @property
+    def nao_alocadas(self) -> list:
+        return self[1]
+
+    @property
+    def metricas(self) -> dict:
+        """Aproveitamento, desperdício, maior sobra e cortes, por chapa e no total."""
+        if self._metricas is None:
+            largura, altura, kerf, refilo = self._medidas
+            with instrumentacao.etapa('metricas'):
+                self._metricas = calcular_metricas(self[0], largura, altura, kerf, refilo)
+        return self._metricas
+
+    def __reduce__(self):
+        return (ResultadoCorte, (self[0], self[1], *self._medidas, self.tempos))
+
+    def __repr__(self):
+        return (f"ResultadoCorte({len(self[0])} chapa(s), "
+                f"{sum(p.get('quant', 1) for p in self[1])} peça(s) não alocada(s))")
@@ -0,0 +1,180 @@
+"""
+Otimização em portfólio: várias heurísticas e ordenações em paralelo.
+
+Cada combinação (heurística, ordenação) é executada por cortar_chapas em um
+processo separado, e o melhor resultado é mantido: menos peças não alocadas,
+depois menos chapas e, por fim, menor desperdício. Com prazo, todas as
+execuções têm a mesma etapa de melhoria, limitada a ele, para que nenhuma
+perca na comparação por ter começado mais tarde, e as que começariam depois
+do prazo são puladas.
+"""
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from .corte import ORDENACOES, cortar_chapas
+from .heuristicas import HEURISTICAS
+from .modelo import Peca
+
+
+def cortar_chapas_portfolio(largura_chapa_cm: float, altura_chapa_cm: float, pecas: list,
+                            heuristicas: list = None, ordenacoes: list = None,
+                            max_processos: int = None, tempo_limite: float = None,
+                            estatisticas: dict = None, **opcoes) -> tuple:
+    """
+    Executa cortar_chapas com várias estratégias em paralelo e fica com a melhor.
+
+    Args:
+        largura_chapa_cm: Largura da chapa em centímetros
+        altura_chapa_cm: Altura da chapa em centímetros
+        pecas: Lista de peças (objetos Peca ou dicionários, como em cortar_chapas)
+        heuristicas: Nomes das heurísticas a testar (padrão: todas)
+        ordenacoes: Nomes das ordenações a testar (padrão: todas)
+        max_processos: Número de processos (padrão: número de CPUs)
+        tempo_limite: Tempo máximo em segundos. Ao ser atingido, retorna o
+            melhor resultado encontrado até então
+        estatisticas: Dicionário opcional preenchido com o relatório de
+            cortar_chapas da estratégia vencedora, a própria estratégia, o
+            número de execuções concluídas e puladas, o tempo total do
+            portfólio (em tempo; o da melhoria fica em tempos) e, em
+            estrategias, o relatório de cada execução concluída
+        **opcoes: Parâmetros repassados a cortar_chapas (por exemplo,
+            kerf e refilo)
+
+    Returns:
+        Tuple contendo:
+        - Lista de chapas com suas peças alocadas
+        - Lista de peças não alocadas
+    """
+    inicio = time.perf_counter()
+    heuristicas = list(heuristicas or HEURISTICAS)
+    ordenacoes = list(ordenacoes or ORDENACOES)
+    pecas = [p if isinstance(p, Peca) else Peca.de_dict(p) for p in pecas]
+    estrategias = [(h, o) for h in heuristicas for o in ordenacoes]
+    max_processos = min(max_processos or os.cpu_count() or 1, len(estrategias))
+
+    melhor = None
+    melhor_chave = None
+    melhor_estrategia = None
+    melhor_relatorio = {}
+    relatorios = []
+    concluidas = 0
+    puladas = 0
+    # Horário do relógio do sistema, o mesmo em todos os processos
+    prazo = time.time() + tempo_limite if tempo_limite is not None else None
+    if tempo_limite is not None:
+        limite = opcoes.get('tempo_limite_melhoria')
+        opcoes['tempo_limite_melhoria'] = (tempo_limite if limite is None
+                                           else min(limite, tempo_limite))
+
+    executor = ProcessPoolExecutor(max_workers=max_processos)
+    futuros = {}
+    try:
+        # A primeira estratégia roda mesmo após o prazo, para haver resultado
+        futuros = {
+            executor.submit(_executar_estrategia, prazo if i else None, largura_chapa_cm,
+                            altura_chapa_cm, pecas, heuristica=h, ordenacao=o,
+                            **opcoes): (h, o)
+            for i, (h, o) in enumerate(estrategias)
+        }
+        pendentes = set(futuros)
+        while pendentes:
+            # Sem nenhum resultado ainda, espera pelo primeiro mesmo após o prazo
+            restante = None
+            if tempo_limite is not None and melhor is not None:
+                restante = tempo_limite - (time.perf_counter() - inicio)
+                if restante <= 0:
+                    break
+
+            prontos, pendentes = wait(pendentes, timeout=restante,
+                                      return_when=FIRST_COMPLETED)
+            for futuro in prontos:
+                executada = futuro.result()
+                if executada is None:
+                    puladas += 1
+                    continue
+                resultado, relatorio = executada
+                concluidas += 1
+                heuristica, ordenacao = futuros[futuro]
+                relatorios.append(dict(relatorio, heuristica=heuristica,
+                                       ordenacao=ordenacao))
+                chave = avaliar_resultado(resultado, largura_chapa_cm, altura_chapa_cm)
+                if melhor_chave is None or chave < melhor_chave:
+                    melhor, melhor_chave = resultado, chave
+                    melhor_estrategia = futuros[futuro]
+                    melhor_relatorio = relatorio
+    finally:
+        # Descarta as execuções que ainda não começaram e não espera as que
+        # estão rodando (shutdown(cancel_futures=True) só existe a partir do
+        # Python 3.9)
+        for futuro in futuros:
+            futuro.cancel()
+        executor.shutdown(wait=False)
+
+    if estatisticas is not None:
+        estatisticas.update(melhor_relatorio)
+        estatisticas.update({
+            'heuristica': melhor_estrategia[0] if melhor_estrategia else None,
+            'ordenacao': melhor_estrategia[1] if melhor_estrategia else None,
+            'execucoes_concluidas': concluidas,
+            'execucoes_puladas': puladas,
+            'execucoes_total': len(estrategias),
+            'estrategias': relatorios,
+            'tempo': time.perf_counter() - inicio
+        })
+
+    if melhor is None:
+        return [], [p.para_dict() for p in pecas]
+    return melhor
+
+
+def _executar_estrategia(prazo: float, largura_chapa_cm: float, altura_chapa_cm: float,
+                        pecas: list, **opcoes) -> tuple:
+    """
+    Executa cortar_chapas em um processo do portfólio.
+
+    Args:
+        prazo: Horário (time.time()) a partir do qual a estratégia não é
+            mais executada, ou None para executá-la sempre
+        **opcoes: Parâmetros repassados a cortar_chapas
+
+    Returns:
+        Tupla (resultado de cortar_chapas, relatório preenchido por ele),
+        ou None se o prazo já passou
+    """
+    if prazo is not None and time.time() >= prazo:
+        return None
+    relatorio = {}
+    resultado = cortar_chapas(largura_chapa_cm, altura_chapa_cm, pecas,
+                              estatisticas=relatorio, **opcoes)
+    return resultado, relatorio
+
+
+def avaliar_resultado(resultado: tuple, largura_chapa: float, altura_chapa: float) -> tuple:
+    """
+    Chave de comparação de um resultado de cortar_chapas (menor é melhor).
+
+    Args:
+        resultado: Tupla (chapas, nao_alocadas) retornada por cortar_chapas
+        largura_chapa: Largura da chapa
+        altura_chapa: Altura da chapa
+
+    Returns:
+        Tupla (peças não alocadas, chapas usadas, desperdício, -concentração).
+        A concentração favorece, entre layouts equivalentes, os que enchem
+        mais as primeiras chapas e deixam sobras maiores nas últimas.
+    """
+    chapas, nao_alocadas = resultado
+    area_total = 0.0
+    area_usada = 0.0
+    concentracao = 0.0
+    for chapa in chapas:
+        area_chapa = (chapa.get('largura', largura_chapa) *
+                      chapa.get('altura', altura_chapa))
+        ocupada = sum(p['largura'] * p['altura'] for p in chapa['pecas_alocadas'])
+        area_total += area_chapa
+        area_usada += ocupada
+        concentracao += (ocupada / area_chapa) ** 2
+    desperdicio = area_total - area_usada
+    qtd_nao_alocadas = sum(p.get('quant', 1) for p in nao_alocadas)
+    return qtd_nao_alocadas, len(chapas), round(desperdicio, 6), -concentracao
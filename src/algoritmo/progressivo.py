@@ -0,0 +1,134 @@
+"""
+Otimização progressiva (anytime): sempre há um resultado, e ele só melhora.
+
+A primeira iteração usa a estratégia padrão e entrega logo um resultado
+completo. As seguintes testam as demais combinações de heurística e
+ordenação, mantendo o melhor resultado (veja portfolio.avaliar_resultado),
+até acabar o tempo, o número de iterações ou as estratégias. A cada
+iteração, ao_progredir recebe o melhor resultado até o momento e pode
+interromper a busca.
+"""
+import time
+
+from .corte import ORDENACAO_PADRAO, ORDENACOES, cortar_chapas
+from .heuristicas import HEURISTICA_PADRAO, HEURISTICAS
+from .modelo import Peca
+from .portfolio import avaliar_resultado
+
+
+def estrategias_progressivas(heuristicas: list = None, ordenacoes: list = None) -> list:
+    """
+    Ordem em que as estratégias são testadas: a padrão primeiro.
+
+    Returns:
+        Lista de tuplas (heuristica, ordenacao)
+    """
+    heuristicas = list(heuristicas or HEURISTICAS)
+    ordenacoes = list(ordenacoes or ORDENACOES)
+    estrategias = [(h, o) for h in heuristicas for o in ordenacoes]
+    if (HEURISTICA_PADRAO, ORDENACAO_PADRAO) in estrategias:
+        estrategias.remove((HEURISTICA_PADRAO, ORDENACAO_PADRAO))
+        estrategias.insert(0, (HEURISTICA_PADRAO, ORDENACAO_PADRAO))
+    return estrategias
+
+
+def aproveitamento(resultado: tuple, largura_chapa: float, altura_chapa: float) -> float:
+    """Área das peças alocadas / área das chapas usadas (0 sem chapas)."""
+    chapas, _ = resultado
+    area_chapas = sum(chapa.get('largura', largura_chapa) * chapa.get('altura', altura_chapa)
+                      for chapa in chapas)
+    area_pecas = sum(p['largura'] * p['altura']
+                     for chapa in chapas for p in chapa['pecas_alocadas'])
+    return area_pecas / area_chapas if area_chapas else 0.0
+
+
+def cortar_chapas_progressivo(largura_chapa_cm: float, altura_chapa_cm: float, pecas: list,
+                              tempo_limite: float = None, max_iteracoes: int = None,
+                              ao_progredir=None, heuristicas: list = None,
+                              ordenacoes: list = None, estatisticas: dict = None,
+                              **opcoes) -> tuple:
+    """
+    Otimiza com um orçamento de tempo, melhorando o resultado a cada iteração.
+
+    A primeira iteração sempre é concluída, mesmo após o prazo ou com
+    max_iteracoes menor que 1; a etapa de melhoria dela e das seguintes é
+    limitada ao tempo restante.
+
+    Args:
+        largura_chapa_cm: Largura da chapa em centímetros
+        altura_chapa_cm: Altura da chapa em centímetros
+        pecas: Lista de peças (objetos Peca ou dicionários, como em cortar_chapas)
+        tempo_limite: Tempo máximo em segundos (None = sem limite)
+        max_iteracoes: Número máximo de iterações (None = todas as estratégias)
+        ao_progredir: Função opcional chamada após cada iteração com um
+            dicionário com iteracao, heuristica e ordenacao testadas,
+            melhorou, chapas e aproveitamento do melhor resultado, tempo
+            decorrido e resultado (o melhor ResultadoCorte até o momento).
+            Se retornar False, a busca é interrompida
+        heuristicas: Nomes das heurísticas a testar (padrão: todas)
+        ordenacoes: Nomes das ordenações a testar (padrão: todas)
+        estatisticas: Dicionário opcional preenchido com a estratégia
+            vencedora, iteracoes, interrompida ('prazo', 'iteracoes',
+            'cancelada' ou None, se todas as estratégias foram testadas) e tempo
+        **opcoes: Parâmetros repassados a cortar_chapas (por exemplo,
+            kerf e refilo)
+
+    Returns:
+        O mesmo que cortar_chapas, para o melhor resultado encontrado
+    """
+    inicio = time.perf_counter()
+    prazo = inicio + tempo_limite if tempo_limite is not None else None
+    pecas = [p if isinstance(p, Peca) else Peca.de_dict(p) for p in pecas]
+
+    melhor = None
+    melhor_chave = None
+    melhor_estrategia = None
+    iteracoes = 0
+    interrompida = None
+    for heuristica, ordenacao in estrategias_progressivas(heuristicas, ordenacoes):
+        if max_iteracoes is not None and iteracoes >= max_iteracoes and melhor is not None:
+            interrompida = 'iteracoes'
+            break
+        restante = None
+        if prazo is not None:
+            restante = prazo - time.perf_counter()
+            if restante <= 0 and melhor is not None:
+                interrompida = 'prazo'
+                break
+
+        resultado = cortar_chapas(
+            largura_chapa_cm, altura_chapa_cm, pecas, heuristica=heuristica,
+            ordenacao=ordenacao,
+            tempo_limite_melhoria=max(restante, 0.0) if restante is not None else None,
+            **opcoes)
+        iteracoes += 1
+        chave = avaliar_resultado(resultado, largura_chapa_cm, altura_chapa_cm)
+        melhorou = melhor_chave is None or chave < melhor_chave
+        if melhorou:
+            melhor, melhor_chave = resultado, chave
+            melhor_estrategia = (heuristica, ordenacao)
+
+        if ao_progredir is not None:
+            continuar = ao_progredir({
+                'iteracao': iteracoes,
+                'heuristica': heuristica,
+                'ordenacao': ordenacao,
+                'melhorou': melhorou,
+                'chapas': len(melhor.chapas),
+                'aproveitamento': aproveitamento(melhor, largura_chapa_cm, altura_chapa_cm),
+                'tempo': time.perf_counter() - inicio,
+                'resultado': melhor,
+            })
+            if continuar is False:
+                interrompida = 'cancelada'
+                break
+
+    if estatisticas is not None:
+        estatisticas.update({
+            'heuristica': melhor_estrategia[0],
+            'ordenacao': melhor_estrategia[1],
+            'iteracoes': iteracoes,
+            'interrompida': interrompida,
+            'tempo': time.perf_counter() - inicio,
+        })
+    return melhor
@@ -0,0 +1,364 @@
+"""
+Busca por recozimento simulado sobre a ordem e a orientação das peças.
+
+A alocação gulosa de cortar_chapas segue uma ordem fixa (por exemplo, por
+área) e, com frequência, usa uma chapa a mais que o necessário. Aqui a
+ordem das peças e a orientação de cada uma (livre, normal ou rotacionada)
+são perturbadas, e cada candidato é avaliado só com a alocação, sem a
+etapa de melhoria nem a conversão para dicionários. Com as heurísticas
+MaxRects, a alocação dos candidatos é a de espacos.simular_maxrects, que
+toma as mesmas decisões de _alocar_pecas sem criar as chapas; só o melhor
+candidato é alocado de fato. A busca parte da
+ordem gulosa e aceita pioras pequenas com probabilidade decrescente; o
+melhor candidato passa pela etapa de melhoria no fim.
+
+Várias cadeias independentes, com sementes diferentes, podem rodar em
+processos separados. O resultado nunca é pior que o de cortar_chapas com
+a mesma heurística e ordenação (veja portfolio.avaliar_resultado).
+"""
+import math
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from .corte import ORDENACAO_PADRAO, ORDENACOES, _alocar_pecas, cortar_chapas
+from .espacos import EspacosLivres, normalizar_refilo, simular_maxrects
+from .estoque import EstoqueChapas
+from .heuristicas import HEURISTICA_PADRAO, criar_espacos, validar_heuristica
+from .melhoria import melhorar_layout
+from .modelo import Peca, ResultadoCorte, TipoChapa
+from .portfolio import avaliar_resultado
+from .progressivo import aproveitamento
+
+# Temperaturas no início e no fim da busca. Uma chapa a mais custa 1 na
+# energia, e a concentração das peças nas primeiras chapas, menos de 1
+TEMPERATURA_INICIAL = 0.05
+TEMPERATURA_FINAL = 0.001
+# Probabilidades de cada perturbação: troca de duas peças, mudança de
+# posição de uma peça e mudança de orientação (o restante)
+PROB_TROCA = 0.4
+PROB_INSERCAO = 0.3
+# Orientações de uma peça: livre (a heurística escolhe), normal ou rotacionada
+LIVRE, NORMAL, ROTACIONADA = 0, 1, 2
+
+
+def _variantes(peca: Peca, tipo: TipoChapa, refilo) -> tuple:
+    """
+    Versões da peça para cada orientação, ou None onde a orientação não cabe.
+
+    As versões com orientação fixa não podem ser rotacionadas; a rotacionada
+    tem largura e altura trocadas.
+    """
+    if not peca.pode_rotacionar or peca.largura == peca.altura:
+        return peca, None, None
+    esquerda, superior, direita, inferior = normalizar_refilo(refilo)
+    largura = tipo.largura - esquerda - direita
+    altura = tipo.altura - superior - inferior
+    normal = Peca(peca.id, peca.largura, peca.altura, peca.original_idx,
+                  peca.quantidade, False)
+    rotacionada = Peca(peca.id, peca.altura, peca.largura, peca.original_idx,
+                       peca.quantidade, False)
+    return (peca,
+            normal if normal.cabe_em(largura, altura) else None,
+            rotacionada if rotacionada.cabe_em(largura, altura) else None)
+
+
+def _alocar(variantes: list, ordem: list, orientacao: list, tipo: TipoChapa,
+            heuristica: str, kerf: float, refilo) -> tuple:
+    """Aloca as peças na ordem e orientação dadas, sem a etapa de melhoria."""
+    sequencia = [variantes[i][orientacao[i]] for i in ordem]
+    # O estoque de um só tipo, sem limite de quantidade, não muda ao alocar
+    return _alocar_pecas(EstoqueChapas([tipo], refilo), sequencia, heuristica, None,
+                         kerf, refilo)
+
+
+def _criterio_simulavel(tipo: TipoChapa, heuristica: str, kerf: float, refilo):
+    """Critério da heurística, se ela for MaxRects (veja simular_maxrects), ou None."""
+    espacos = criar_espacos(heuristica, tipo.largura, tipo.altura, kerf, refilo)
+    return espacos.criterio if type(espacos) is EspacosLivres else None
+
+
+def _avaliar(variantes: list, ordem: list, orientacao: list, tipo: TipoChapa,
+             heuristica: str, kerf: float, refilo, criterio: str = None) -> float:
+    """
+    Energia do candidato, sem criar as chapas quando a heurística permite.
+
+    Args:
+        criterio: Critério de _criterio_simulavel, ou None para alocar as
+            peças com _alocar
+    """
+    if criterio is None:
+        chapas, nao_alocadas = _alocar(variantes, ordem, orientacao, tipo, heuristica,
+                                       kerf, refilo)
+        return _energia(
+            [sum(a.largura * a.altura for a in chapa.pecas) / (chapa.largura * chapa.altura)
+             for chapa in chapas],
+            sum(p.quantidade for p in nao_alocadas))
+    areas, faltantes = simular_maxrects([variantes[i][orientacao[i]] for i in ordem],
+                                        tipo.largura, tipo.altura, criterio, kerf, refilo)
+    area_chapa = tipo.largura * tipo.altura
+    return _energia([area / area_chapa for area in areas], faltantes)
+
+
+def _energia(aproveitamentos: list, faltantes: int) -> float:
+    """
+    Valor a minimizar: peças não alocadas, depois chapas, depois concentração.
+
+    A concentração (soma dos quadrados do aproveitamento de cada chapa,
+    dividida pelo número de chapas) é maior quando a última chapa está mais
+    vazia, o que aproxima a busca de eliminá-la.
+
+    Args:
+        aproveitamentos: Fração da área de cada chapa ocupada por peças
+        faltantes: Número de cópias não alocadas
+    """
+    if not aproveitamentos:
+        return 1000.0 * faltantes
+    concentracao = sum(a ** 2 for a in aproveitamentos)
+    return 1000.0 * faltantes + len(aproveitamentos) - concentracao / len(aproveitamentos)
+
+
+def _perturbar(rng: random.Random, ordem: list, orientacao: list,
+               orientaveis: list, variantes: list) -> tuple:
+    """Retorna um vizinho (ordem, orientacao) com uma perturbação aleatória."""
+    ordem = list(ordem)
+    orientacao = list(orientacao)
+    sorteio = rng.random()
+    if len(ordem) > 1 and (sorteio < PROB_TROCA + PROB_INSERCAO or not orientaveis):
+        i, j = rng.sample(range(len(ordem)), 2)
+        if sorteio < PROB_TROCA:
+            ordem[i], ordem[j] = ordem[j], ordem[i]
+        else:
+            ordem.insert(j, ordem.pop(i))
+    elif orientaveis:
+        k = rng.choice(orientaveis)
+        opcoes = [o for o in (LIVRE, NORMAL, ROTACIONADA)
+                  if o != orientacao[k] and variantes[k][o] is not None]
+        orientacao[k] = rng.choice(opcoes)
+    return ordem, orientacao
+
+
+def _recozer(variantes: list, ordem: list, tipo: TipoChapa, heuristica: str,
+             kerf: float, refilo, tempo_limite: float, max_iteracoes: int,
+             semente, ao_melhorar=None) -> dict:
+    """
+    Uma cadeia de recozimento simulado a partir da ordem dada.
+
+    A temperatura cai geometricamente com a fração do tempo (ou das
+    iterações) já consumida. Os candidatos são avaliados por _avaliar.
+
+    Args:
+        ao_melhorar: Função opcional chamada com (energia, ordem, orientacao,
+            iteracoes) a cada novo melhor candidato. Se retornar False, a
+            cadeia é interrompida
+
+    Returns:
+        Dicionário com energia, ordem e orientacao do melhor candidato,
+        iteracoes, aceitas e cancelada
+    """
+    inicio = time.perf_counter()
+    rng = random.Random(semente)
+    orientacao = [LIVRE] * len(variantes)
+    orientaveis = [i for i, v in enumerate(variantes) if v[NORMAL] or v[ROTACIONADA]]
+    criterio = _criterio_simulavel(tipo, heuristica, kerf, refilo)
+    atual = _avaliar(variantes, ordem, orientacao, tipo, heuristica, kerf, refilo, criterio)
+    melhor = {'energia': atual, 'ordem': ordem, 'orientacao': orientacao,
+              'iteracoes': 0, 'aceitas': 0, 'cancelada': False}
+    if len(ordem) < 2 and not orientaveis:
+        return melhor
+
+    iteracoes = aceitas = 0
+    while True:
+        if max_iteracoes is not None:
+            fracao = iteracoes / max_iteracoes if max_iteracoes else 1.0
+        else:
+            fracao = (time.perf_counter() - inicio) / tempo_limite if tempo_limite else 1.0
+        if fracao >= 1.0:
+            break
+        temperatura = TEMPERATURA_INICIAL * (TEMPERATURA_FINAL / TEMPERATURA_INICIAL) ** fracao
+
+        nova_ordem, nova_orientacao = _perturbar(rng, ordem, orientacao, orientaveis, variantes)
+        energia = _avaliar(variantes, nova_ordem, nova_orientacao, tipo, heuristica, kerf,
+                           refilo, criterio)
+        iteracoes += 1
+        if energia <= atual or rng.random() < math.exp((atual - energia) / temperatura):
+            ordem, orientacao, atual = nova_ordem, nova_orientacao, energia
+            aceitas += 1
+            if energia < melhor['energia']:
+                melhor.update(energia=energia, ordem=ordem, orientacao=orientacao)
+                if ao_melhorar is not None and \
+                        ao_melhorar(energia, ordem, orientacao, iteracoes) is False:
+                    melhor['cancelada'] = True
+                    break
+
+    melhor.update(iteracoes=iteracoes, aceitas=aceitas)
+    return melhor
+
+
+def _finalizar(variantes: list, ordem: list, orientacao: list, tipo: TipoChapa,
+               heuristica: str, kerf: float, refilo, inicio: float = None) -> ResultadoCorte:
+    """
+    Aloca o candidato, volta às peças originais e aplica a etapa de melhoria.
+
+    As versões com orientação fixa são trocadas pelas peças originais, para
+    que a melhoria e a interface vejam a rotação relativa à peça pedida.
+    """
+    chapas, nao_alocadas = _alocar(variantes, ordem, orientacao, tipo, heuristica,
+                                   kerf, refilo)
+    originais = {}
+    for peca, normal, rotacionada in variantes:
+        if normal is not None:
+            originais[id(normal)] = (peca, False)
+        if rotacionada is not None:
+            originais[id(rotacionada)] = (peca, True)
+    por_idx = {v[LIVRE].original_idx: v[LIVRE] for v in variantes}
+    for chapa in chapas:
+        for alocada in chapa.pecas:
+            if id(alocada.peca) in originais:
+                alocada.peca, alocada.rotacionada = originais[id(alocada.peca)]
+    nao_alocadas = [por_idx[p.original_idx].com_quantidade(p.quantidade)
+                    for p in nao_alocadas]
+
+    relatorio = melhorar_layout(chapas)
+    tempos = {'melhoria': relatorio['tempo']}
+    if inicio is not None:
+        tempos['total'] = time.perf_counter() - inicio
+    return ResultadoCorte([chapa.para_dict(i + 1) for i, chapa in enumerate(chapas)],
+                          [peca.para_dict() for peca in nao_alocadas],
+                          tipo.largura, tipo.altura, kerf, refilo, tempos)
+
+
+def cortar_chapas_recozimento(largura_chapa_cm: float, altura_chapa_cm: float, pecas: list,
+                              tempo_limite: float = 5.0, max_iteracoes: int = None,
+                              max_processos: int = 1, semente: int = 0,
+                              heuristica: str = HEURISTICA_PADRAO,
+                              ordenacao: str = ORDENACAO_PADRAO, kerf: float = 0.0,
+                              refilo=0.0, ao_progredir=None,
+                              estatisticas: dict = None) -> tuple:
+    """
+    Procura uma ordem e orientação das peças que use menos chapas.
+
+    Com max_processos > 1, cada processo roda uma cadeia independente (com
+    semente, semente + 1, ...) pelo mesmo tempo, e fica o melhor resultado.
+
+    Args:
+        largura_chapa_cm: Largura da chapa em centímetros
+        altura_chapa_cm: Altura da chapa em centímetros
+        pecas: Lista de peças (objetos Peca ou dicionários, como em cortar_chapas)
+        tempo_limite: Tempo da busca em segundos, por cadeia
+        max_iteracoes: Número de candidatos avaliados por cadeia. Quando
+            informado, substitui tempo_limite e torna a busca reprodutível
+        max_processos: Número de cadeias, cada uma em um processo (1 = no
+            próprio processo, None = número de CPUs)
+        semente: Semente do gerador aleatório da primeira cadeia
+        heuristica: Nome da heurística de posicionamento
+        ordenacao: Ordenação da solução gulosa de partida (veja ORDENACOES)
+        kerf: Espessura do corte da serra
+        refilo: Refilo das bordas da chapa
+        ao_progredir: Função opcional chamada com um dicionário com
+            iteracao, melhorou, chapas e aproveitamento do melhor resultado,
+            tempo decorrido e resultado, a cada melhora (com uma cadeia) ou a
+            cada cadeia concluída (com várias). Se retornar False, a busca é
+            interrompida
+        estatisticas: Dicionário opcional preenchido com chapas_iniciais
+            (da solução gulosa), chapas, iteracoes, aceitas, cadeias,
+            interrompida ('cancelada' ou None) e tempo
+
+    Returns:
+        O mesmo que cortar_chapas, para o melhor resultado encontrado
+    """
+    validar_heuristica(heuristica)
+    if ordenacao not in ORDENACOES:
+        raise ValueError(
+            f"Ordenação desconhecida: {ordenacao}. "
+            f"Opções: {', '.join(ORDENACOES)}."
+        )
+    inicio = time.perf_counter()
+    tipo = TipoChapa(None, largura_chapa_cm, altura_chapa_cm)
+    pecas = [p if isinstance(p, Peca) else Peca.de_dict(p) for p in pecas]
+    variantes = [_variantes(peca, tipo, refilo) for peca in pecas]
+    # Mesma ordem da alocação gulosa (sorted é estável)
+    ordem = sorted(range(len(pecas)), key=lambda i: ORDENACOES[ordenacao](pecas[i]),
+                   reverse=True)
+
+    inicial = cortar_chapas(largura_chapa_cm, altura_chapa_cm, pecas, heuristica=heuristica,
+                            ordenacao=ordenacao, kerf=kerf, refilo=refilo)
+    melhor, melhor_chave = inicial, avaliar_resultado(inicial, largura_chapa_cm,
+                                                      altura_chapa_cm)
+    cadeia = {}
+    iteracoes = aceitas = 0
+    cancelada = False
+
+    def informar(resultado, iteracao) -> bool:
+        """Guarda o resultado se for melhor e o repassa a ao_progredir."""
+        nonlocal melhor, melhor_chave
+        chave = avaliar_resultado(resultado, largura_chapa_cm, altura_chapa_cm)
+        melhorou = chave < melhor_chave
+        if melhorou:
+            melhor, melhor_chave = resultado, chave
+        if ao_progredir is None:
+            return True
+        return ao_progredir({
+            'iteracao': iteracao,
+            'melhorou': melhorou,
+            'chapas': len(melhor.chapas),
+            'aproveitamento': aproveitamento(melhor, largura_chapa_cm, altura_chapa_cm),
+            'tempo': time.perf_counter() - inicio,
+            'resultado': melhor,
+        }) is not False
+
+    max_processos = max(1, max_processos or os.cpu_count() or 1)
+    if max_processos == 1:
+        def ao_melhorar(energia, ordem, orientacao, iteracao):
+            if ao_progredir is None:
+                return True
+            return informar(_finalizar(variantes, ordem, orientacao, tipo, heuristica,
+                                       kerf, refilo, inicio=inicio), iteracao)
+
+        cadeia = _recozer(variantes, ordem, tipo, heuristica, kerf, refilo, tempo_limite,
+                          max_iteracoes, semente, ao_melhorar)
+        iteracoes, aceitas, cancelada = (cadeia['iteracoes'], cadeia['aceitas'],
+                                         cadeia['cancelada'])
+        if not cancelada:
+            # Ao cancelar, o melhor candidato já foi finalizado por ao_melhorar
+            informar(_finalizar(variantes, cadeia['ordem'], cadeia['orientacao'], tipo,
+                                heuristica, kerf, refilo, inicio=inicio), iteracoes)
+    else:
+        executor = ProcessPoolExecutor(max_workers=max_processos)
+        futuros = []
+        try:
+            futuros = [
+                executor.submit(_recozer, variantes, ordem, tipo, heuristica, kerf, refilo,
+                                tempo_limite, max_iteracoes,
+                                None if semente is None else semente + k)
+                for k in range(max_processos)
+            ]
+            for futuro in as_completed(futuros):
+                cadeia = futuro.result()
+                iteracoes += cadeia['iteracoes']
+                aceitas += cadeia['aceitas']
+                resultado = _finalizar(variantes, cadeia['ordem'], cadeia['orientacao'],
+                                       tipo, heuristica, kerf, refilo, inicio=inicio)
+                if not informar(resultado, iteracoes):
+                    cancelada = True
+                    break
+        finally:
+            # Ao cancelar, descarta as cadeias que ainda não começaram e não
+            # espera as que estão rodando: cada uma para sozinha no seu prazo.
+            # (shutdown(cancel_futures=True) só existe a partir do Python 3.9)
+            for futuro in futuros:
+                futuro.cancel()
+            executor.shutdown(wait=not cancelada)
+
+    if estatisticas is not None:
+        estatisticas.update({
+            'chapas_iniciais': len(inicial.chapas),
+            'chapas': len(melhor.chapas),
+            'iteracoes': iteracoes,
+            'aceitas': aceitas,
+            'cadeias': max_processos,
+            'interrompida': 'cancelada' if cancelada else None,
+            'tempo': time.perf_counter() - inicio,
+        })
+    return melhor
@@ -0,0 +1,82 @@
+import os
+
+import pytest
+
+from algoritmo.cache import CacheResultados, chave_canonica, cortar_chapas_com_cache
+from benchmarks.geradores import ALTURA_CHAPA, LARGURA_CHAPA, gerar_pedido
+
+
+def _dados(n):
+    return {'chapas': [{'id_chapa': n, 'pecas_alocadas': []}], 'nao_alocadas': [],
+            'estatisticas': {}}
+
+
+def test_lru_descarta_o_menos_usado():
+    cache = CacheResultados(capacidade=2)
+    cache.guardar('a', _dados(1))
+    cache.guardar('b', _dados(2))
+    assert cache.obter('a')[1] == 'memoria'
+    cache.guardar('c', _dados(3))
+    assert len(cache) == 2
+    assert cache.obter('b') is None
+    assert cache.obter('a')[0] == _dados(1)
+    assert cache.obter('c')[0] == _dados(3)
+    assert (cache.acertos, cache.faltas) == (3, 1)
+
+
+def test_copia_ao_entrar_e_ao_sair():
+    cache = CacheResultados()
+    dados = _dados(1)
+    cache.guardar('a', dados)
+    dados['chapas'].clear()
+    obtido, _ = cache.obter('a')
+    obtido['chapas'][0]['id_chapa'] = 99
+    assert cache.obter('a')[0] == _dados(1)
+
+
+def test_disco_sobrevive_a_outra_instancia(tmp_path):
+    CacheResultados(pasta=str(tmp_path)).guardar('a', _dados(1))
+    cache = CacheResultados(pasta=str(tmp_path))
+    assert cache._ler_disco('a') == _dados(1)
+    assert cache.obter('a') == (_dados(1), 'disco')
+    # Lido do disco, passa a estar em memória
+    assert cache.obter('a')[1] == 'memoria'
+    assert not [f for f in os.listdir(tmp_path) if f.endswith('.tmp')]
+
+
+def test_arquivo_corrompido_e_ignorado(tmp_path):
+    cache = CacheResultados(pasta=str(tmp_path))
+    (tmp_path / 'a.json').write_text('{"chapas": [', encoding='utf-8')
+    assert cache._ler_disco('a') is None
+    assert cache.obter('a') is None
+    assert cache.faltas == 1
+
+
+def test_chave_muda_com_a_entrada():
+    pecas = gerar_pedido('estantes', 0, 3)
+    chave = chave_canonica(LARGURA_CHAPA, ALTURA_CHAPA, pecas, kerf=0.4)
+    assert chave == chave_canonica(LARGURA_CHAPA, ALTURA_CHAPA, pecas, kerf=0.4)
+    assert chave != chave_canonica(LARGURA_CHAPA, ALTURA_CHAPA, pecas, kerf=0.3)
+    assert chave != chave_canonica(LARGURA_CHAPA, ALTURA_CHAPA, pecas[::-1], kerf=0.4)
+
+
+@pytest.mark.parametrize('interrompida, guardado', [
+    (None, True), ('iteracoes', True), ('prazo', False), ('cancelada', False)])
+def test_so_guarda_resultado_definitivo(interrompida, guardado):
+    chamadas = []
+
+    def otimizador(largura, altura, pecas, estatisticas=None, **opcoes):
+        chamadas.append(opcoes)
+        estatisticas['interrompida'] = interrompida
+        return [], []
+
+    cache = CacheResultados()
+    pecas = gerar_pedido('estantes', 0, 3)
+    for _ in range(2):
+        estatisticas = {}
+        cortar_chapas_com_cache(LARGURA_CHAPA, ALTURA_CHAPA, pecas, cache,
+                                estatisticas=estatisticas, otimizador=otimizador)
+    assert len(cache) == (1 if guardado else 0)
+    assert len(chamadas) == (1 if guardado else 2)
+    assert estatisticas['cache'] == ('memoria' if guardado else None)
+    assert estatisticas['interrompida'] == interrompida
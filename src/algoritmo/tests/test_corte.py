@@ -0,0 +1,59 @@
+import pytest
+
+from algoritmo.corte import cortar_chapas, cortar_chapas_estoque, reotimizar_peca
+from algoritmo.heuristicas import HEURISTICAS
+from benchmarks.geradores import ALTURA_CHAPA, FAMILIAS, LARGURA_CHAPA, gerar_pedido
+from verificacao import conferir_layout, conferir_quantidades
+
+
+@pytest.mark.parametrize('familia', FAMILIAS)
+@pytest.mark.parametrize('heuristica', sorted(HEURISTICAS))
+def test_layout_valido(familia, heuristica):
+    pecas = gerar_pedido(familia, 0, 10)
+    resultado = cortar_chapas(LARGURA_CHAPA, ALTURA_CHAPA, pecas, heuristica=heuristica)
+    conferir_layout(resultado[0], LARGURA_CHAPA, ALTURA_CHAPA)
+    conferir_quantidades(resultado, pecas)
+
+
+@pytest.mark.parametrize('heuristica', sorted(HEURISTICAS))
+@pytest.mark.parametrize('kerf, refilo', [(0.4, 0.0), (0.3, 1.0), (0.4, (2.0, 1.0, 0.5, 3.0))])
+def test_kerf_e_refilo(heuristica, kerf, refilo):
+    pecas = gerar_pedido('armarios', 1, 10)
+    resultado = cortar_chapas(LARGURA_CHAPA, ALTURA_CHAPA, pecas, heuristica=heuristica,
+                              kerf=kerf, refilo=refilo)
+    conferir_layout(resultado[0], LARGURA_CHAPA, ALTURA_CHAPA, kerf, refilo)
+    conferir_quantidades(resultado, pecas)
+
+
+def test_peca_maior_que_a_chapa_fica_nao_alocada():
+    pecas = [{'id': 'A', 'larg': 50, 'alt': 40, 'original_idx': 0, 'quant': 3},
+             {'id': 'B', 'larg': 300, 'alt': 40, 'original_idx': 1, 'quant': 2,
+              'pode_rotacionar': False}]
+    resultado = cortar_chapas(LARGURA_CHAPA, ALTURA_CHAPA, pecas)
+    conferir_quantidades(resultado, pecas)
+    assert resultado[1] == [pecas[1]]
+
+
+def test_estoque_sem_area_util():
+    pecas = gerar_pedido('estantes', 0, 5)
+    with pytest.raises(ValueError):
+        cortar_chapas_estoque([], pecas)
+    with pytest.raises(ValueError):
+        cortar_chapas_estoque([{'larg': 10, 'alt': 10}], pecas, refilo=5)
+
+
+@pytest.mark.parametrize('kerf', [0.0, 0.4])
+def test_reotimizar_peca(kerf):
+    pecas = gerar_pedido('armarios', 0, 15)
+    chapas, nao_alocadas = cortar_chapas(LARGURA_CHAPA, ALTURA_CHAPA, pecas, kerf=kerf)
+    alterada = max(pecas, key=lambda p: p.get('quant', 1))
+    alterada['quant'] = alterada.get('quant', 1) + 3
+    alterada['larg'] = alterada['larg'] - 2
+
+    estatisticas = {}
+    resultado = reotimizar_peca(LARGURA_CHAPA, ALTURA_CHAPA, chapas, nao_alocadas, pecas,
+                                alterada['original_idx'], estatisticas=estatisticas,
+                                kerf=kerf)
+    assert estatisticas['incremental']
+    conferir_layout(resultado[0], LARGURA_CHAPA, ALTURA_CHAPA, kerf)
+    conferir_quantidades(resultado, pecas)
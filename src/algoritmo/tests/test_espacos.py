@@ -0,0 +1,27 @@
+import random
+
+import pytest
+
+from algoritmo.corte import _alocar_pecas
+from algoritmo.espacos import simular_maxrects
+from algoritmo.estoque import EstoqueChapas
+from algoritmo.modelo import Peca, TipoChapa
+from benchmarks.geradores import ALTURA_CHAPA, FAMILIAS, LARGURA_CHAPA, gerar_pedido
+
+
+@pytest.mark.parametrize('familia', FAMILIAS)
+@pytest.mark.parametrize('criterio', ['baf', 'bssf', 'blsf', 'bl'])
+@pytest.mark.parametrize('kerf, refilo', [(0.0, 0.0), (0.4, (2.0, 1.0, 0.5, 3.0))])
+def test_simular_maxrects_igual_a_alocacao(familia, criterio, kerf, refilo):
+    pecas = [Peca.de_dict(p) for p in gerar_pedido(familia, 0, 12)]
+    # Uma ordem qualquer, diferente da ordenação usada por cortar_chapas
+    random.Random(0).shuffle(pecas)
+    tipo = TipoChapa(None, LARGURA_CHAPA, ALTURA_CHAPA)
+    chapas, nao_alocadas = _alocar_pecas(EstoqueChapas([tipo], refilo), pecas,
+                                         f'maxrects-{criterio}', None, kerf, refilo)
+
+    areas, faltantes = simular_maxrects(pecas, LARGURA_CHAPA, ALTURA_CHAPA, criterio,
+                                        kerf, refilo)
+    assert areas == pytest.approx(
+        [sum(a.largura * a.altura for a in chapa.pecas) for chapa in chapas])
+    assert faltantes == sum(p.quantidade for p in nao_alocadas)
@@ -0,0 +1,24 @@
+from algoritmo import instrumentacao
+from algoritmo.corte import cortar_chapas
+from algoritmo.instrumentacao import perfil, sem_contagem
+from benchmarks.geradores import ALTURA_CHAPA, LARGURA_CHAPA, gerar_pedido
+
+
+def test_metricas_nao_entram_nos_contadores():
+    pecas = gerar_pedido('armarios', 0, 8)
+    with perfil(destino=None) as relatorio:
+        resultado = cortar_chapas(LARGURA_CHAPA, ALTURA_CHAPA, pecas, kerf=0.4)
+        antes = dict(relatorio.contadores)
+        assert antes['ocupacoes'] > 0
+        assert resultado.metricas['maior_sobra'] is not None
+    assert dict(relatorio.contadores) == antes
+
+
+def test_sem_contagem_restaura_a_instrumentacao():
+    with perfil(destino=None) as relatorio:
+        with sem_contagem():
+            assert instrumentacao.contadores is None
+            instrumentacao.somar(ocupacoes=1)
+        instrumentacao.somar(ocupacoes=2)
+    assert relatorio.contadores['ocupacoes'] == 2
+    assert instrumentacao.contadores is None
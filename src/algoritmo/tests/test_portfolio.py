@@ -0,0 +1,43 @@
+import time
+
+from algoritmo.portfolio import _executar_estrategia, cortar_chapas_portfolio
+from benchmarks.geradores import ALTURA_CHAPA, LARGURA_CHAPA, gerar_pedido
+from verificacao import conferir_layout, conferir_quantidades
+
+
+def test_relatorio_da_estrategia_vencedora():
+    pecas = gerar_pedido('armarios', 0, 8)
+    estatisticas = {}
+    resultado = cortar_chapas_portfolio(LARGURA_CHAPA, ALTURA_CHAPA, pecas,
+                                        heuristicas=['maxrects-baf', 'guilhotina'],
+                                        ordenacoes=['area'], max_processos=2,
+                                        kerf=0.4, estatisticas=estatisticas)
+    conferir_layout(resultado[0], LARGURA_CHAPA, ALTURA_CHAPA, 0.4)
+    conferir_quantidades(resultado, pecas)
+    # O relatório de cortar_chapas da vencedora chega a quem chamou
+    assert {'iteracoes', 'custo', 'tempos'} <= set(estatisticas)
+    assert estatisticas['execucoes_concluidas'] == 2
+    executadas = [(r['heuristica'], r['ordenacao']) for r in estatisticas['estrategias']]
+    assert sorted(executadas) == [('guilhotina', 'area'), ('maxrects-baf', 'area')]
+    assert (estatisticas['heuristica'], estatisticas['ordenacao']) in executadas
+    assert all('tempos' in r for r in estatisticas['estrategias'])
+
+
+def test_sem_tempo_executa_so_a_primeira_estrategia():
+    pecas = gerar_pedido('estantes', 0, 8)
+    estatisticas = {}
+    resultado = cortar_chapas_portfolio(LARGURA_CHAPA, ALTURA_CHAPA, pecas,
+                                        ordenacoes=['area', 'perimetro'], max_processos=1,
+                                        tempo_limite=0, estatisticas=estatisticas)
+    conferir_quantidades(resultado, pecas)
+    assert estatisticas['execucoes_concluidas'] == 1
+    assert len(estatisticas['estrategias']) == 1
+
+
+def test_estrategia_nao_comeca_apos_o_prazo():
+    pecas = gerar_pedido('estantes', 0, 8)
+    assert _executar_estrategia(time.time() - 1, LARGURA_CHAPA, ALTURA_CHAPA, pecas) is None
+    resultado, relatorio = _executar_estrategia(time.time() + 60, LARGURA_CHAPA,
+                                                ALTURA_CHAPA, pecas)
+    conferir_quantidades(resultado, pecas)
+    assert 'tempos' in relatorio
@@ -0,0 +1,29 @@
+import pytest
+
+from algoritmo.corte import cortar_chapas
+from algoritmo.recozimento import cortar_chapas_recozimento
+from benchmarks.geradores import ALTURA_CHAPA, LARGURA_CHAPA, gerar_pedido
+from verificacao import conferir_layout, conferir_quantidades
+
+
+@pytest.mark.parametrize('heuristica', ['maxrects-baf', 'guilhotina'])
+def test_resultado_valido_e_nao_pior(heuristica):
+    pecas = gerar_pedido('alta_quantidade', 0, 8)
+    inicial = cortar_chapas(LARGURA_CHAPA, ALTURA_CHAPA, pecas, heuristica=heuristica,
+                            kerf=0.4)
+    estatisticas = {}
+    resultado = cortar_chapas_recozimento(LARGURA_CHAPA, ALTURA_CHAPA, pecas,
+                                          max_iteracoes=50, heuristica=heuristica,
+                                          kerf=0.4, estatisticas=estatisticas)
+    conferir_layout(resultado[0], LARGURA_CHAPA, ALTURA_CHAPA, 0.4)
+    conferir_quantidades(resultado, pecas)
+    assert len(resultado[0]) <= len(inicial[0])
+    assert estatisticas['iteracoes'] == 50
+
+
+def test_reprodutivel_com_max_iteracoes():
+    pecas = gerar_pedido('armarios', 1, 8)
+    resultados = [cortar_chapas_recozimento(LARGURA_CHAPA, ALTURA_CHAPA, pecas,
+                                            max_iteracoes=30, semente=3)
+                  for _ in range(2)]
+    assert resultados[0] == resultados[1]
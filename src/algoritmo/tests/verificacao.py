@@ -0,0 +1,75 @@
+"""
+Verificações de um plano de corte usadas pelos testes do motor.
+"""
+from collections import Counter
+
+from algoritmo.espacos import EPSILON, normalizar_refilo
+from algoritmo.modelo import Peca
+
+
+def conferir_layout(chapas: list, largura_chapa: float, altura_chapa: float,
+                    kerf: float = 0.0, refilo=0.0):
+    """
+    Confere que as peças de cada chapa ficam na área útil e separadas pelo kerf.
+
+    Duas peças da mesma chapa não podem se sobrepor, e entre elas sempre
+    fica pelo menos um kerf, na horizontal ou na vertical.
+
+    Args:
+        chapas: Chapas retornadas por cortar_chapas
+        largura_chapa: Largura da chapa (usada se a chapa não trouxer a sua)
+        altura_chapa: Altura da chapa (usada se a chapa não trouxer a sua)
+        kerf: Espessura do corte da serra
+        refilo: Refilo das bordas (veja normalizar_refilo)
+    """
+    esquerda, superior, direita, inferior = normalizar_refilo(refilo)
+    for chapa in chapas:
+        largura = chapa.get('largura', largura_chapa)
+        altura = chapa.get('altura', altura_chapa)
+        pecas = chapa['pecas_alocadas']
+        for p in pecas:
+            assert p['x'] >= esquerda - EPSILON and p['y'] >= superior - EPSILON, p
+            assert p['x'] + p['largura'] <= largura - direita + EPSILON, p
+            assert p['y'] + p['altura'] <= altura - inferior + EPSILON, p
+        for i, a in enumerate(pecas):
+            for b in pecas[i + 1:]:
+                separadas = (a['x'] + a['largura'] + kerf <= b['x'] + EPSILON or
+                             b['x'] + b['largura'] + kerf <= a['x'] + EPSILON or
+                             a['y'] + a['altura'] + kerf <= b['y'] + EPSILON or
+                             b['y'] + b['altura'] + kerf <= a['y'] + EPSILON)
+                assert separadas, (chapa['id_chapa'], a, b)
+
+
+def conferir_quantidades(resultado: tuple, pecas: list):
+    """
+    Confere que cada cópia pedida aparece uma única vez no resultado.
+
+    Cada peça alocada tem as medidas da peça pedida (trocadas, se
+    rotacionada), os números de cópia de uma peça não se repetem, e as
+    cópias alocadas mais as não alocadas somam a quantidade pedida.
+
+    Args:
+        resultado: Tupla (chapas, nao_alocadas) de cortar_chapas
+        pecas: Peças pedidas (Peca ou dicionários)
+    """
+    chapas, nao_alocadas = resultado
+    por_idx = {}
+    for p in pecas:
+        p = p if isinstance(p, Peca) else Peca.de_dict(p)
+        por_idx[p.original_idx] = p
+    copias = {idx: [] for idx in por_idx}
+    for chapa in chapas:
+        for alocada in chapa['pecas_alocadas']:
+            peca = por_idx[alocada['original_idx']]
+            medidas = (peca.altura, peca.largura) if alocada.get('rotacionada') else \
+                (peca.largura, peca.altura)
+            assert (alocada['largura'], alocada['altura']) == medidas, alocada
+            assert peca.pode_rotacionar or not alocada.get('rotacionada'), alocada
+            copias[peca.original_idx].append(alocada['copia'])
+    faltantes = Counter()
+    for p in nao_alocadas:
+        faltantes[p['original_idx']] += p['quant']
+    for idx, peca in por_idx.items():
+        repetidas = [c for c, n in Counter(copias[idx]).items() if n > 1]
+        assert not repetidas, (peca, repetidas)
+        assert len(copias[idx]) + faltantes[idx] == peca.quantidade, peca
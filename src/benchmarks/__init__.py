@@ -0,0 +1,5 @@
+"""
+Benchmarks do motor de corte com pedidos sintéticos reproduzíveis.
+
+Execute a partir da pasta src com: python -m benchmarks
+"""
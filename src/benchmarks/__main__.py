@@ -0,0 +1,82 @@
+"""
+Ponto de entrada dos benchmarks: python -m benchmarks.
+
+Exemplo, comparando com uma execução anterior:
+
+    python -m benchmarks --saida atual.json --comparar anterior.json
+"""
+import argparse
+import contextlib
+import json
+import sys
+
+from algoritmo.corte import ORDENACAO_PADRAO, ORDENACOES
+from algoritmo.heuristicas import HEURISTICA_PADRAO, HEURISTICAS
+from algoritmo.instrumentacao import perfil
+from .executar import comparar, executar_suite, gravar_relatorio, ler_relatorio
+from .geradores import FAMILIAS
+
+TAMANHOS_PADRAO = (10, 40)
+SEMENTES_PADRAO = (1, 2)
+
+
+def criar_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmarks',
+        description="Mede tempo, memória, chapas e aproveitamento de cortar_chapas "
+                    "em pedidos sintéticos reproduzíveis.")
+    parser.add_argument('--familias', nargs='+', choices=list(FAMILIAS), default=list(FAMILIAS))
+    parser.add_argument('--tamanhos', nargs='+', type=int, default=list(TAMANHOS_PADRAO),
+                        help="tamanhos de pedido (móveis ou tipos de peça, conforme a família)")
+    parser.add_argument('--sementes', nargs='+', type=int, default=list(SEMENTES_PADRAO))
+    parser.add_argument('--repeticoes', type=int, default=3,
+                        help="execuções de cada caso para medir o tempo")
+    parser.add_argument('--heuristica', choices=list(HEURISTICAS), default=HEURISTICA_PADRAO)
+    parser.add_argument('--ordenacao', choices=list(ORDENACOES), default=ORDENACAO_PADRAO)
+    parser.add_argument('--kerf', type=float, default=0.0, help="espessura do corte da serra (cm)")
+    parser.add_argument('--saida', help="arquivo JSON do relatório (padrão: saída padrão)")
+    parser.add_argument('--comparar', metavar='RELATORIO',
+                        help="relatório JSON anterior para comparar caso a caso")
+    parser.add_argument('--perfil', action='store_true',
+                        help="liga a instrumentação do motor e mostra contadores e tempos "
+                             "por etapa (deixa a execução um pouco mais lenta)")
+    return parser
+
+
+def _imprimir_caso(resultado: dict):
+    print(f"{resultado['familia']:<16} tamanho={resultado['tamanho']:<4} "
+          f"semente={resultado['semente']:<3} pecas={resultado['pecas']:<5} "
+          f"chapas={resultado['chapas']:<4} aproveitamento={resultado['aproveitamento']:.1%} "
+          f"tempo={resultado['tempo_mediana'] * 1000:.1f}ms "
+          f"memoria={resultado['pico_memoria_kb']}KB", file=sys.stderr)
+
+
+def _imprimir_comparacao(diferencas: list):
+    for d in diferencas:
+        razao = f"{d['razao_tempo']:.2f}x" if d['razao_tempo'] is not None else "-"
+        print(f"{d['familia']:<16} tamanho={d['tamanho']:<4} semente={d['semente']:<3} "
+              f"tempo={razao:<7} chapas={d['delta_chapas']:+d} "
+              f"aproveitamento={d['delta_aproveitamento']:+.1%} "
+              f"memoria={d['delta_memoria_kb']:+d}KB", file=sys.stderr)
+
+
+def main(argv: list = None) -> int:
+    args = criar_parser().parse_args(argv)
+    with perfil() if args.perfil else contextlib.nullcontext():
+        relatorio = executar_suite(
+            args.familias, args.tamanhos, args.sementes, args.repeticoes,
+            ao_concluir=_imprimir_caso, heuristica=args.heuristica,
+            ordenacao=args.ordenacao, kerf=args.kerf)
+    if args.comparar:
+        relatorio['comparacao'] = comparar(ler_relatorio(args.comparar), relatorio)
+        _imprimir_comparacao(relatorio['comparacao'])
+    if args.saida:
+        gravar_relatorio(args.saida, relatorio)
+    else:
+        json.dump(relatorio, sys.stdout, ensure_ascii=False, indent=2)
+        print()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
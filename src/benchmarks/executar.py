@@ -0,0 +1,167 @@
+"""
+Execução dos casos de benchmark e comparação entre execuções.
+
+Cada caso (família, tamanho, semente) é otimizado várias vezes para medir o
+tempo, e uma vez a mais com tracemalloc para medir o pico de memória, já que
+o rastreamento deixa a execução mais lenta e distorceria o tempo.
+"""
+import datetime
+import json
+import platform
+import statistics
+import subprocess
+import time
+import tracemalloc
+
+import numpy as np
+
+from algoritmo.corte import cortar_chapas
+from .geradores import ALTURA_CHAPA, LARGURA_CHAPA, gerar_pedido
+
+
+def executar_caso(familia: str, tamanho: int, semente: int, repeticoes: int = 3,
+                  largura_chapa: float = LARGURA_CHAPA, altura_chapa: float = ALTURA_CHAPA,
+                  **opcoes) -> dict:
+    """
+    Mede um caso de benchmark.
+
+    Args:
+        familia: Família de pedido (veja geradores.FAMILIAS)
+        tamanho: Tamanho do pedido, repassado ao gerador
+        semente: Semente do gerador
+        repeticoes: Quantas vezes otimizar para medir o tempo
+        largura_chapa: Largura da chapa
+        altura_chapa: Altura da chapa
+        **opcoes: Parâmetros repassados a cortar_chapas
+
+    Returns:
+        Dicionário com familia, tamanho, semente, tipos (linhas do pedido),
+        pecas (total de cópias), tempo_min, tempo_mediana (s), pico_memoria_kb,
+        chapas, nao_alocadas, aproveitamento (área das peças / área das chapas)
+        e etapas (tempo de cada etapa da última execução, veja cortar_chapas)
+    """
+    pecas = gerar_pedido(familia, semente, tamanho)
+    tempos = []
+    for _ in range(max(1, repeticoes)):
+        inicio = time.perf_counter()
+        resultado = cortar_chapas(largura_chapa, altura_chapa, pecas, **opcoes)
+        tempos.append(time.perf_counter() - inicio)
+
+    tracemalloc.start()
+    try:
+        cortar_chapas(largura_chapa, altura_chapa, pecas, **opcoes)
+        _, pico = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    chapas, nao_alocadas = resultado
+    return {
+        'familia': familia,
+        'tamanho': tamanho,
+        'semente': semente,
+        'tipos': len(pecas),
+        'pecas': sum(p['quant'] for p in pecas),
+        'tempo_min': min(tempos),
+        'tempo_mediana': statistics.median(tempos),
+        'pico_memoria_kb': pico // 1024,
+        'chapas': len(chapas),
+        'nao_alocadas': sum(p.get('quant', 1) for p in nao_alocadas),
+        'aproveitamento': resultado.metricas['aproveitamento'],
+        'etapas': resultado.tempos,
+    }
+
+
+def _versao_codigo() -> str:
+    """Commit atual do repositório, ou None fora de um repositório git."""
+    try:
+        saida = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'],
+                               capture_output=True, text=True, timeout=5)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return saida.stdout.strip() or None
+
+
+def executar_suite(familias: list, tamanhos: list, sementes: list, repeticoes: int = 3,
+                   ao_concluir=None, **opcoes) -> dict:
+    """
+    Executa todas as combinações de família, tamanho e semente.
+
+    Args:
+        familias: Nomes das famílias
+        tamanhos: Tamanhos de pedido
+        sementes: Sementes dos geradores
+        repeticoes: Repetições de cada caso para medir o tempo
+        ao_concluir: Função opcional chamada com o resultado de cada caso
+        **opcoes: Parâmetros repassados a cortar_chapas
+
+    Returns:
+        Relatório com o ambiente (commit, python, numpy, plataforma, data),
+        as opções usadas e a lista de resultados (veja executar_caso)
+    """
+    resultados = []
+    for familia in familias:
+        for tamanho in tamanhos:
+            for semente in sementes:
+                resultado = executar_caso(familia, tamanho, semente, repeticoes, **opcoes)
+                resultados.append(resultado)
+                if ao_concluir is not None:
+                    ao_concluir(resultado)
+    return {
+        'commit': _versao_codigo(),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'plataforma': platform.platform(),
+        'data': datetime.datetime.now().isoformat(timespec='seconds'),
+        'chapa': {'largura': LARGURA_CHAPA, 'altura': ALTURA_CHAPA},
+        'repeticoes': repeticoes,
+        'opcoes': opcoes,
+        'resultados': resultados,
+    }
+
+
+def _chave_caso(resultado: dict) -> tuple:
+    return resultado['familia'], resultado['tamanho'], resultado['semente']
+
+
+def comparar(anterior: dict, atual: dict) -> list:
+    """
+    Compara dois relatórios, caso a caso.
+
+    Args:
+        anterior: Relatório de referência (por exemplo, de outro commit)
+        atual: Relatório novo
+
+    Returns:
+        Lista com, para cada caso presente nos dois relatórios: familia,
+        tamanho, semente, razao_tempo (atual / anterior, pela mediana),
+        delta_chapas, delta_aproveitamento e delta_memoria_kb
+    """
+    referencia = {_chave_caso(r): r for r in anterior['resultados']}
+    diferencas = []
+    for resultado in atual['resultados']:
+        antes = referencia.get(_chave_caso(resultado))
+        if antes is None:
+            continue
+        diferencas.append({
+            'familia': resultado['familia'],
+            'tamanho': resultado['tamanho'],
+            'semente': resultado['semente'],
+            'razao_tempo': (resultado['tempo_mediana'] / antes['tempo_mediana']
+                            if antes['tempo_mediana'] else None),
+            'delta_chapas': resultado['chapas'] - antes['chapas'],
+            'delta_aproveitamento': resultado['aproveitamento'] - antes['aproveitamento'],
+            'delta_memoria_kb': resultado['pico_memoria_kb'] - antes['pico_memoria_kb'],
+        })
+    return diferencas
+
+
+def gravar_relatorio(caminho: str, relatorio: dict):
+    """Grava o relatório em JSON (UTF-8, indentado)."""
+    with open(caminho, 'w', encoding='utf-8') as f:
+        json.dump(relatorio, f, ensure_ascii=False, indent=2)
+
+
+def ler_relatorio(caminho: str) -> dict:
+    """Lê um relatório gravado por gravar_relatorio."""
+    with open(caminho, encoding='utf-8') as f:
+        return json.load(f)
@@ -0,0 +1,121 @@
+"""
+Geradores de pedidos sintéticos para os benchmarks.
+
+Cada família imita um tipo de pedido real de marcenaria. Os geradores
+recebem uma semente e um tamanho (quantidade de móveis ou de tipos de peça,
+conforme a família) e devolvem sempre as mesmas peças para os mesmos
+parâmetros, no formato de dicionário aceito por cortar_chapas.
+"""
+import random
+
+# Chapa padrão de MDF (cm) usada pelos benchmarks
+LARGURA_CHAPA = 275
+ALTURA_CHAPA = 184
+# Espessura do MDF (cm), descontada nas peças internas dos móveis
+ESPESSURA = 1.8
+
+
+def _peca(pecas: list, id, largura: float, altura: float, quant: int = 1,
+          pode_rotacionar: bool = True):
+    """Acrescenta uma peça ao pedido, com original_idx sequencial."""
+    pecas.append({'id': id, 'larg': round(largura, 1), 'alt': round(altura, 1),
+                  'quant': quant, 'pode_rotacionar': pode_rotacionar,
+                  'original_idx': len(pecas)})
+
+
+def gerar_armarios(semente: int, tamanho: int) -> list:
+    """
+    Módulos de cozinha: laterais, base, tampo, prateleiras, fundo e portas.
+
+    As laterais e portas seguem o veio, no comprimento da chapa, e não podem
+    girar. Vários módulos repetem o mesmo modelo, o que gera peças com
+    quantidade maior que 1.
+    """
+    rng = random.Random(semente)
+    pecas = []
+    for i in range(tamanho):
+        largura = rng.choice((30, 40, 45, 50, 60, 80, 90))
+        altura = rng.choice((70, 72, 90, 200, 220))
+        profundidade = rng.choice((35, 55, 60))
+        repeticoes = rng.choice((1, 1, 1, 2, 3))
+        interna = largura - 2 * ESPESSURA
+        _peca(pecas, f'A{i}-lateral', altura, profundidade, 2 * repeticoes, False)
+        _peca(pecas, f'A{i}-base', interna, profundidade, 2 * repeticoes)
+        prateleiras = rng.randint(0, 4 if altura > 100 else 1)
+        if prateleiras:
+            _peca(pecas, f'A{i}-prateleira', interna, profundidade - 2,
+                  prateleiras * repeticoes)
+        _peca(pecas, f'A{i}-fundo', largura - 1, altura - 1, repeticoes)
+        portas = 1 if largura <= 50 else 2
+        _peca(pecas, f'A{i}-porta', altura - 0.4, largura / portas - 0.4,
+              portas * repeticoes, False)
+    return pecas
+
+
+def gerar_estantes(semente: int, tamanho: int) -> list:
+    """Estantes: duas laterais altas e várias prateleiras iguais por estante."""
+    rng = random.Random(semente)
+    pecas = []
+    for i in range(tamanho):
+        largura = rng.choice((60, 80, 90, 100, 120))
+        altura = rng.choice((120, 150, 180))
+        profundidade = rng.choice((25, 30, 35, 40))
+        prateleiras = rng.randint(3, 7)
+        _peca(pecas, f'E{i}-lateral', altura, profundidade, 2, False)
+        _peca(pecas, f'E{i}-prateleira', largura - 2 * ESPESSURA, profundidade,
+              prateleiras)
+    return pecas
+
+
+def gerar_pecas_pequenas(semente: int, tamanho: int) -> list:
+    """Muitas peças pequenas e diferentes (gavetas, reforços, tampas)."""
+    rng = random.Random(semente)
+    pecas = []
+    for i in range(tamanho * 10):
+        _peca(pecas, f'P{i}', rng.uniform(5, 35), rng.uniform(5, 30),
+              rng.choice((1, 1, 2, 4)))
+    return pecas
+
+
+def gerar_pecas_grandes(semente: int, tamanho: int) -> list:
+    """Poucas peças grandes, de meia chapa até quase a chapa inteira."""
+    rng = random.Random(semente)
+    pecas = []
+    for i in range(tamanho):
+        _peca(pecas, f'G{i}', rng.uniform(80, LARGURA_CHAPA - 5),
+              rng.uniform(50, ALTURA_CHAPA - 5))
+    return pecas
+
+
+def gerar_alta_quantidade(semente: int, tamanho: int) -> list:
+    """Poucos tipos de peça pedidos em centenas de cópias (produção em série)."""
+    rng = random.Random(semente)
+    pecas = []
+    for i in range(max(1, tamanho // 5)):
+        _peca(pecas, f'Q{i}', rng.uniform(15, 90), rng.uniform(10, 60),
+              rng.randint(50, 300), rng.random() < 0.7)
+    return pecas
+
+
+FAMILIAS = {
+    'armarios': gerar_armarios,
+    'estantes': gerar_estantes,
+    'pecas_pequenas': gerar_pecas_pequenas,
+    'pecas_grandes': gerar_pecas_grandes,
+    'alta_quantidade': gerar_alta_quantidade,
+}
+
+
+def gerar_pedido(familia: str, semente: int, tamanho: int) -> list:
+    """
+    Gera o pedido de uma família.
+
+    Raises:
+        ValueError: Se a família não existir
+    """
+    try:
+        gerador = FAMILIAS[familia]
+    except KeyError:
+        raise ValueError(f"Família desconhecida: {familia}. "
+                         f"Opções: {', '.join(FAMILIAS)}.") from None
+    return gerador(semente, tamanho)
@@ -0,0 +1,25 @@
+import json
+
+from benchmarks.__main__ import main
+
+
+def _executar(capsys, *argumentos):
+    main(['--familias', 'estantes', '--tamanhos', '3', '--sementes', '0',
+          '--repeticoes', '1', *argumentos])
+    return capsys.readouterr().out
+
+
+def test_comparacao_na_saida_padrao(tmp_path, capsys):
+    anterior = tmp_path / 'anterior.json'
+    _executar(capsys, '--saida', str(anterior))
+    relatorio = json.loads(_executar(capsys, '--comparar', str(anterior)))
+    assert len(relatorio['comparacao']) == 1
+    assert relatorio['comparacao'][0]['delta_chapas'] == 0
+
+
+def test_comparacao_no_arquivo(tmp_path, capsys):
+    anterior = tmp_path / 'anterior.json'
+    atual = tmp_path / 'atual.json'
+    _executar(capsys, '--saida', str(anterior))
+    assert _executar(capsys, '--saida', str(atual), '--comparar', str(anterior)) == ''
+    assert len(json.loads(atual.read_text(encoding='utf-8'))['comparacao']) == 1
@@ -0,0 +1,5 @@
+"""
+Interface de linha de comando do otimizador de corte.
+
+Uso: python -m corte lote pedidos/*.xlsx --largura 275 --altura 184
+"""
@@ -0,0 +1,92 @@
+"""
+Ponto de entrada da linha de comando: python -m corte lote <arquivos>.
+"""
+import argparse
+import sys
+
+from algoritmo.corte import ORDENACAO_PADRAO, ORDENACOES
+from algoritmo.heuristicas import HEURISTICA_PADRAO, HEURISTICAS
+from utils.exportacao import FORMATOS_PLANO
+from .lote import FORMATOS, listar_arquivos, otimizar_lote
+
+
+def _refilo(texto: str):
+    """Converte '1' ou '1,2,1,2' no refilo aceito por cortar_chapas."""
+    valores = [float(v) for v in texto.split(',')]
+    if len(valores) not in (1, 4):
+        raise argparse.ArgumentTypeError(
+            "use um valor ou quatro (esquerda,superior,direita,inferior)")
+    return valores[0] if len(valores) == 1 else tuple(valores)
+
+
+def criar_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='python -m corte',
+                                     description="Otimizador de corte de chapas.")
+    comandos = parser.add_subparsers(dest='comando', required=True)
+
+    lote = comandos.add_parser(
+        'lote', aliases=['batch'],
+        help="otimiza vários arquivos Excel de pedidos, sem interface gráfica")
+    lote.add_argument('arquivos', nargs='+',
+                      help="arquivos .xlsx, pastas ou padrões como 'pedidos/*.xlsx'")
+    lote.add_argument('--largura', type=float, required=True, help="largura da chapa (cm)")
+    lote.add_argument('--altura', type=float, required=True, help="altura da chapa (cm)")
+    lote.add_argument('--kerf', type=float, default=0.0, help="espessura do corte da serra (cm)")
+    lote.add_argument('--refilo', type=_refilo, default=0.0,
+                      help="refilo das bordas (cm): um valor ou esquerda,superior,direita,inferior")
+    lote.add_argument('--heuristica', choices=list(HEURISTICAS), default=HEURISTICA_PADRAO)
+    lote.add_argument('--ordenacao', choices=list(ORDENACOES), default=ORDENACAO_PADRAO)
+    lote.add_argument('--formato', choices=FORMATOS, default='json')
+    lote.add_argument('--saida', help="pasta dos resultados (padrão: a de cada arquivo)")
+    lote.add_argument('--processos', type=int, help="número de processos (padrão: CPUs)")
+    lote.add_argument('--cache', metavar='PASTA',
+                      help="pasta de cache dos resultados; pedidos repetidos não são recalculados")
+    lote.add_argument('--plano', choices=FORMATOS_PLANO,
+                      help="grava também o plano de corte, uma chapa por página")
+    lote.add_argument('--busca', type=float, metavar='SEGUNDOS',
+                      help="procura, por arquivo, uma ordem e orientação das peças "
+                           "que use menos chapas")
+    return parser
+
+
+def _imprimir_resumo(resumo: dict):
+    if resumo['erro']:
+        print(f"ERRO  {resumo['arquivo']}: {resumo['erro']}", file=sys.stderr)
+        return
+    for aviso in resumo['avisos']:
+        print(f"AVISO {resumo['arquivo']}: {aviso}", file=sys.stderr)
+    origem = f", cache em {resumo['cache']}" if resumo['cache'] else ""
+    plano = f" + {len(resumo['plano'])} arquivo(s) do plano" if resumo['plano'] else ""
+    print(f"OK    {resumo['arquivo']} -> {resumo['saida']}{plano} "
+          f"({resumo['chapas']} chapa(s), {resumo['aproveitamento']:.1%} de aproveitamento, "
+          f"{resumo['nao_alocadas']} peça(s) não alocada(s), "
+          f"{resumo['tempo']:.2f}s{origem})")
+
+
+def main(argv: list = None) -> int:
+    """
+    Executa a linha de comando.
+
+    Returns:
+        Código de saída: 0 se todos os arquivos foram otimizados, 1 caso contrário
+    """
+    args = criar_parser().parse_args(argv)
+    arquivos = listar_arquivos(args.arquivos)
+    if not arquivos:
+        print("Nenhum arquivo encontrado.", file=sys.stderr)
+        return 1
+
+    resumos = otimizar_lote(
+        arquivos, args.largura, args.altura, formato=args.formato,
+        pasta_saida=args.saida, max_processos=args.processos,
+        ao_concluir=_imprimir_resumo, pasta_cache=args.cache, plano=args.plano,
+        busca=args.busca,
+        heuristica=args.heuristica,
+        ordenacao=args.ordenacao, kerf=args.kerf, refilo=args.refilo)
+    falhas = sum(1 for r in resumos if r['erro'])
+    print(f"{len(resumos) - falhas}/{len(resumos)} arquivo(s) otimizado(s).")
+    return 1 if falhas else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
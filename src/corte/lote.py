@@ -0,0 +1,203 @@
+"""
+Otimização em lote de arquivos Excel, sem interface gráfica.
+
+Cada arquivo é lido com o mesmo mapeamento de colunas da importação da
+interface, otimizado com cortar_chapas (ou, com busca, por
+cortar_chapas_recozimento) em um processo separado, e o
+resultado é gravado em JSON ou CSV ao lado do arquivo (ou na pasta de saída),
+opcionalmente junto com o plano de corte em PDF ou SVG.
+"""
+import csv
+import glob
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from algoritmo.cache import CacheResultados, cortar_chapas_com_cache
+from algoritmo.corte import cortar_chapas
+from algoritmo.recozimento import cortar_chapas_recozimento
+from utils.exportacao import FORMATOS_PLANO, exportar_plano_corte
+from utils.importacao import ler_pecas_excel
+
+FORMATOS = ('json', 'csv')
+
+
+def listar_arquivos(entradas: list) -> list:
+    """
+    Expande padrões e pastas em uma lista ordenada de arquivos Excel.
+
+    Args:
+        entradas: Caminhos de arquivos, pastas ou padrões como 'pedidos/*.xlsx'
+
+    Returns:
+        Lista de caminhos sem repetições
+    """
+    arquivos = []
+    for entrada in entradas:
+        if os.path.isdir(entrada):
+            arquivos.extend(sorted(glob.glob(os.path.join(entrada, '*.xlsx'))))
+        elif glob.has_magic(entrada):
+            arquivos.extend(sorted(glob.glob(entrada)))
+        else:
+            arquivos.append(entrada)
+    return list(dict.fromkeys(arquivos))
+
+
+def caminho_saida(arquivo: str, formato: str, pasta_saida: str = None) -> str:
+    """Caminho do arquivo de resultado: <nome>.corte.<formato>."""
+    nome = os.path.splitext(os.path.basename(arquivo))[0] + f'.corte.{formato}'
+    return os.path.join(pasta_saida or os.path.dirname(arquivo), nome)
+
+
+def otimizar_arquivo(arquivo: str, largura_chapa: float, altura_chapa: float,
+                     formato: str = 'json', pasta_saida: str = None,
+                     pasta_cache: str = None, plano: str = None, busca: float = None,
+                     **opcoes) -> dict:
+    """
+    Lê, otimiza e grava o resultado de um arquivo de pedido.
+
+    Args:
+        arquivo: Caminho do arquivo Excel
+        largura_chapa: Largura da chapa
+        altura_chapa: Altura da chapa
+        formato: 'json' ou 'csv'
+        pasta_saida: Pasta onde gravar o resultado (padrão: a do arquivo)
+        pasta_cache: Pasta de um cache em disco compartilhado entre as
+            execuções (None: sem cache)
+        plano: 'pdf' ou 'svg' para gravar também o plano de corte (None: não grava)
+        busca: Segundos de busca por recozimento simulado após a solução
+            gulosa (None: só cortar_chapas)
+        **opcoes: Parâmetros repassados a cortar_chapas
+
+    Returns:
+        Resumo com arquivo, saida, plano (arquivos do plano de corte), chapas,
+        nao_alocadas, aproveitamento, avisos, tempo, cache (origem do resultado, se veio do
+        cache) e, em caso de falha, erro
+    """
+    inicio = time.perf_counter()
+    resumo = {'arquivo': arquivo, 'saida': None, 'plano': [], 'chapas': 0, 'nao_alocadas': 0,
+              'aproveitamento': 0.0,
+              'avisos': [], 'cache': None, 'erro': None}
+    try:
+        pecas, resumo['avisos'] = ler_pecas_excel(arquivo)
+        estatisticas = {}
+        otimizador = cortar_chapas
+        if busca:
+            # Os arquivos já rodam em paralelo: uma cadeia por arquivo
+            otimizador = cortar_chapas_recozimento
+            opcoes = dict(opcoes, tempo_limite=busca, max_processos=1)
+        if pasta_cache:
+            resultado = cortar_chapas_com_cache(
+                largura_chapa, altura_chapa, pecas, CacheResultados(pasta=pasta_cache),
+                estatisticas=estatisticas, otimizador=otimizador, **opcoes)
+            resumo['cache'] = estatisticas.pop('cache')
+        else:
+            resultado = otimizador(largura_chapa, altura_chapa, pecas,
+                                   estatisticas=estatisticas, **opcoes)
+        chapas, nao_alocadas = resultado
+        saida = caminho_saida(arquivo, formato, pasta_saida)
+        if formato == 'csv':
+            gravar_csv(saida, chapas, nao_alocadas)
+        else:
+            gravar_json(saida, {
+                'arquivo': arquivo,
+                'chapa': {'largura': largura_chapa, 'altura': altura_chapa},
+                'chapas': chapas,
+                'nao_alocadas': nao_alocadas,
+                'estatisticas': estatisticas,
+                'metricas': resultado.metricas,
+            })
+        if plano:
+            resumo['plano'] = exportar_plano_corte(
+                caminho_saida(arquivo, plano, pasta_saida), chapas,
+                largura_chapa, altura_chapa, formato=plano)
+        resumo.update(saida=saida, chapas=len(chapas),
+                      aproveitamento=resultado.metricas['aproveitamento'],
+                      nao_alocadas=sum(p.get('quant', 1) for p in nao_alocadas))
+    except Exception as e:
+        resumo['erro'] = f"{type(e).__name__}: {e}"
+    resumo['tempo'] = time.perf_counter() - inicio
+    return resumo
+
+
+def gravar_json(caminho: str, dados: dict):
+    """Grava o resultado em JSON (UTF-8, indentado)."""
+    with open(caminho, 'w', encoding='utf-8') as f:
+        json.dump(dados, f, ensure_ascii=False, indent=2)
+
+
+def gravar_csv(caminho: str, chapas: list, nao_alocadas: list):
+    """
+    Grava o resultado em CSV, com uma linha por peça posicionada.
+
+    As peças não alocadas aparecem no fim, sem chapa nem posição, com a
+    quantidade que ficou de fora.
+    """
+    campos = ['id_chapa', 'id', 'copia', 'x', 'y', 'largura', 'altura',
+              'rotacionada', 'quant']
+    with open(caminho, 'w', encoding='utf-8', newline='') as f:
+        escritor = csv.DictWriter(f, fieldnames=campos)
+        escritor.writeheader()
+        for chapa in chapas:
+            for p in chapa['pecas_alocadas']:
+                escritor.writerow({
+                    'id_chapa': chapa['id_chapa'], 'id': p['id'], 'copia': p['copia'],
+                    'x': p['x'], 'y': p['y'], 'largura': p['largura'],
+                    'altura': p['altura'], 'rotacionada': int(p.get('rotacionada', False)),
+                    'quant': 1
+                })
+        for p in nao_alocadas:
+            escritor.writerow({'id': p['id'], 'largura': p['larg'], 'altura': p['alt'],
+                               'quant': p.get('quant', 1)})
+
+
+def otimizar_lote(arquivos: list, largura_chapa: float, altura_chapa: float,
+                  formato: str = 'json', pasta_saida: str = None,
+                  max_processos: int = None, ao_concluir=None,
+                  pasta_cache: str = None, plano: str = None, busca: float = None,
+                  **opcoes) -> list:
+    """
+    Otimiza vários arquivos em paralelo, um processo por arquivo.
+
+    Args:
+        arquivos: Caminhos dos arquivos Excel
+        largura_chapa: Largura da chapa
+        altura_chapa: Altura da chapa
+        formato: 'json' ou 'csv'
+        pasta_saida: Pasta onde gravar os resultados (padrão: a de cada arquivo)
+        max_processos: Número de processos (padrão: número de CPUs)
+        ao_concluir: Função opcional chamada com o resumo de cada arquivo
+            assim que ele termina
+        pasta_cache: Pasta do cache de resultados em disco (None: sem cache)
+        plano: 'pdf' ou 'svg' para gravar também o plano de corte (None: não grava)
+        busca: Segundos de busca por recozimento simulado em cada arquivo
+            (None: só cortar_chapas)
+        **opcoes: Parâmetros repassados a cortar_chapas
+
+    Returns:
+        Lista de resumos (veja otimizar_arquivo), na ordem dos arquivos
+    """
+    if formato not in FORMATOS:
+        raise ValueError(f"Formato desconhecido: {formato}. Opções: {', '.join(FORMATOS)}.")
+    if plano is not None and plano not in FORMATOS_PLANO:
+        raise ValueError(f"Formato de plano desconhecido: {plano}. "
+                         f"Opções: {', '.join(FORMATOS_PLANO)}.")
+    if pasta_saida:
+        os.makedirs(pasta_saida, exist_ok=True)
+
+    resumos = {}
+    max_processos = max(1, min(max_processos or os.cpu_count() or 1, len(arquivos)))
+    with ProcessPoolExecutor(max_workers=max_processos) as executor:
+        futuros = {
+            executor.submit(otimizar_arquivo, arquivo, largura_chapa, altura_chapa,
+                            formato, pasta_saida, pasta_cache, plano=plano, busca=busca,
+                            **opcoes): arquivo
+            for arquivo in arquivos
+        }
+        for futuro in as_completed(futuros):
+            resumo = futuro.result()
+            resumos[futuros[futuro]] = resumo
+            if ao_concluir is not None:
+                ao_concluir(resumo)
+    return [resumos[arquivo] for arquivo in arquivos]
@@ -1,27 +1,52 @@
 import tkinter as tk
 from tkinter import ttk
-import math
+
+from .indice_espacial import GradePecas
 
 class CorteCanvasView(ttk.Frame):
+    # Nível de detalhe: abaixo destes tamanhos na tela (em pixels), a chapa é
+    # desenhada como um resumo, a peça é omitida e os textos são omitidos
+    LARGURA_MIN_DETALHE_CHAPA = 80
+    TAMANHO_MIN_PECA = 2
+    LARGURA_MIN_TEXTO = 40
+    ALTURA_MIN_TEXTO = 32
+    
     def __init__(self, parent, **kwargs):
         super().__init__(parent.frame_esquerdo, **kwargs)
         self.parent = parent
         
-        # Configuração do canvas
+        # Configuração do canvas, com barra de rolagem horizontal
         self.canvas = tk.Canvas(self, bg='white')
+        self.scroll_x = ttk.Scrollbar(self, orient=tk.HORIZONTAL, command=self._rolar_horizontal)
+        self.scroll_x.pack(side=tk.BOTTOM, fill=tk.X)
         self.canvas.pack(fill=tk.BOTH, expand=True)
         
         # Variáveis de controle
         self.chapas = []
         self.peca_selecionada = None
         self.peca_em_redimensionamento = None
+        # Índice da chapa da peça em redimensionamento
+        self.chapa_em_redimensionamento = None
         self.ponto_inicial = None
         self.escala = 1.0
+        # Zoom relativo à escala que faz todas as chapas caberem na janela
+        self.zoom = 1.0
+        # Deslocamento da vista (pan), em pixels
         self.offset_x = 0
         self.offset_y = 0
+        self.ponto_pan = None
         self.borda_redimensionamento = None  # 'left', 'right', 'top', 'bottom'
         self.dimensoes_iniciais = None
         
+        # Registro dos itens desenhados: índice da chapa -> [id, coordenadas,
+        # id do resumo] e (original_idx, copia) -> itens e estado da peça
+        # (veja _sincronizar_peca)
+        self._itens_chapas = {}
+        self._itens_pecas = {}
+        
+        # Índice espacial de cada chapa, para localizar a peça sob o mouse
+        self._grades = []
+        
         # Configuração dos cursores
         self.cursor_resize_h = "sb_h_double_arrow"
         self.cursor_resize_v = "sb_v_double_arrow"
@@ -33,6 +58,14 @@ class CorteCanvasView(ttk.Frame):
         self.canvas.bind('<B1-Motion>', self._on_drag)
         self.canvas.bind('<ButtonRelease-1>', self._on_release)
         self.canvas.bind('<MouseWheel>', self._on_zoom)
+        self.canvas.bind('<Button-4>', self._on_zoom)
+        self.canvas.bind('<Button-5>', self._on_zoom)
+        self.canvas.bind('<Shift-MouseWheel>', self._on_scroll)
+        self.canvas.bind('<Shift-Button-4>', self._on_scroll)
+        self.canvas.bind('<Shift-Button-5>', self._on_scroll)
+        self.canvas.bind('<ButtonPress-2>', self._on_pan_inicio)
+        self.canvas.bind('<B2-Motion>', self._on_pan)
+        self.canvas.bind('<Configure>', lambda event: self._redesenhar())
         
         # Bindings do teclado
         self.bind_all('<r>', self._rotacionar_peca_selecionada)
@@ -43,14 +76,32 @@ class CorteCanvasView(ttk.Frame):
         self.chapas = chapas
         self.largura_chapa = largura_chapa
         self.altura_chapa = altura_chapa
+        self._grades = [GradePecas(largura_chapa, altura_chapa, chapa['pecas_alocadas'])
+                        for chapa in chapas]
+        if self.peca_em_redimensionamento is not None:
+            # As chapas mudaram durante o arrasto: a peça pode ter saído delas
+            self.chapa_em_redimensionamento = self._indice_chapa_da_peca(
+                self.peca_em_redimensionamento)
         self._redesenhar()
         
     def _redesenhar(self):
-        """Redesenha todo o canvas."""
-        self.canvas.delete('all')
-        
+        """
+        Sincroniza os itens do canvas com as chapas atuais.
+
+        Os itens ficam registrados por chapa e por peça, com a chave
+        (original_idx, copia). Itens existentes só são movidos ou
+        reconfigurados quando algo mudou; apenas peças novas criam itens, e
+        os itens de peças que saíram são apagados.
+
+        Só o que está na área visível é desenhado. Chapas pequenas demais na
+        tela viram um resumo (um retângulo com a ocupação), peças de poucos
+        pixels são omitidas e os textos só aparecem em peças grandes o
+        bastante para eles.
+        """
         # Calcula a escala para caber todas as chapas
         if not self.chapas:
+            self._limpar_itens()
+            self.scroll_x.set(0, 1)
             return
             
         # Calcula dimensões totais
@@ -64,59 +115,255 @@ class CorteCanvasView(ttk.Frame):
         if canvas_width > 1 and canvas_height > 1:  # Evita divisão por zero
             scale_x = (canvas_width - 40) / total_width
             scale_y = (canvas_height - 40) / total_height
-            self.escala = min(scale_x, scale_y)
+            self.escala = min(scale_x, scale_y) * self.zoom
+        self._limitar_deslocamento()
             
-        # Desenha as chapas
-        for i, chapa in enumerate(self.chapas):
-            x = i * self.largura_chapa * self.escala + 20
-            y = 20
-            
-            # Desenha o contorno da chapa
-            self.canvas.create_rectangle(
-                x, y,
-                x + self.largura_chapa * self.escala,
-                y + self.altura_chapa * self.escala,
-                outline='black', width=2
-            )
-            
-            # Desenha as peças
+        # Desenha só as chapas que aparecem na janela
+        largura_tela = self.largura_chapa * self.escala
+        primeira = max(0, int((self.offset_x - 20) // largura_tela)) if largura_tela > 0 else 0
+        pecas_vistas = set()
+        chapas_vistas = set()
+        for i in range(primeira, len(self.chapas)):
+            x, y = self._origem_chapa(i)
+            if x > canvas_width:
+                break
+            chapas_vistas.add(i)
+            chapa = self.chapas[i]
+            detalhada = self._chapa_detalhada()
+            self._sincronizar_chapa(i, x, y, None if detalhada else chapa)
+            if not detalhada:
+                continue
+                
+            # Desenha as peças visíveis e com tamanho suficiente
             for peca in chapa['pecas_alocadas']:
-                # Verifica se a peça tem todas as propriedades necessárias
-                if not all(key in peca for key in ['x', 'y', 'largura', 'altura']):
-                    continue
-                    
                 px = x + peca['x'] * self.escala
                 py = y + peca['y'] * self.escala
                 pw = peca['largura'] * self.escala
                 ph = peca['altura'] * self.escala
+                if (not self._peca_desenhavel(peca) or
+                        px > canvas_width or py > canvas_height or px + pw < 0 or py + ph < 0):
+                    continue
+                chave = self._chave_peca(peca)
+                pecas_vistas.add(chave)
+                self._sincronizar_peca(chave, peca, x, y)
                 
-                # Define a cor e largura da borda baseado na seleção
-                is_selected = (self.peca_selecionada and 
-                             self.peca_selecionada['original_idx'] == peca['original_idx'])
-                outline_color = 'red' if is_selected else 'blue'
-                outline_width = 3 if is_selected else 1
-                
-                # Cria o retângulo da peça
-                rect_id = self.canvas.create_rectangle(
-                    px, py, px + pw, py + ph,
-                    fill='lightblue', outline=outline_color,
-                    width=outline_width,
-                    tags=('peca', f"peca_{peca['id']}")
-                )
-                
-                # Adiciona o ID/nome da peça
-                self.canvas.create_text(
-                    px + pw/2, py + ph/2 - 10,
-                    text=peca.get('id_display', peca['id']),
-                    tags=('texto', f"texto_id_{peca['id']}")
-                )
+        # Apaga os itens de chapas e peças que não existem mais ou saíram da vista
+        for i in [i for i in self._itens_chapas if i not in chapas_vistas]:
+            item = self._itens_chapas.pop(i)
+            self.canvas.delete(item[0])
+            if item[2] is not None:
+                self.canvas.delete(item[2])
+        for chave in [c for c in self._itens_pecas if c not in pecas_vistas]:
+            self.canvas.delete(*(i for i in self._itens_pecas.pop(chave)[:3] if i is not None))
+        self._atualizar_barra_rolagem()
+            
+    def _chapa_detalhada(self):
+        """Se as chapas, na escala atual, são desenhadas peça a peça (e não como resumo)."""
+        return self.largura_chapa * self.escala >= self.LARGURA_MIN_DETALHE_CHAPA
+        
+    def _peca_desenhavel(self, peca):
+        """Se a peça, na escala atual, é grande o bastante para ser desenhada."""
+        return (peca['largura'] * self.escala >= self.TAMANHO_MIN_PECA and
+                peca['altura'] * self.escala >= self.TAMANHO_MIN_PECA)
+        
+    def _origem_chapa(self, chapa_index):
+        """Posição no canvas do canto superior esquerdo da chapa."""
+        return (chapa_index * self.largura_chapa * self.escala + 20 - self.offset_x,
+                20 - self.offset_y)
+        
+    @staticmethod
+    def _chave_peca(peca):
+        """Chave da peça no registro de itens do canvas."""
+        return peca['original_idx'], peca.get('copia', 0)
+        
+    def _limpar_itens(self):
+        """Apaga todos os itens e esvazia o registro."""
+        self.canvas.delete('all')
+        self._itens_chapas.clear()
+        self._itens_pecas.clear()
+        
+    def _sincronizar_chapa(self, chapa_index, x, y, resumo=None):
+        """
+        Cria ou move o contorno de uma chapa.
+
+        Args:
+            chapa_index: Índice da chapa
+            x: Posição horizontal da chapa no canvas
+            y: Posição vertical da chapa no canvas
+            resumo: A chapa, quando ela deve ser desenhada como um resumo da
+                ocupação em vez de peça a peça
+        """
+        coords = (x, y, x + self.largura_chapa * self.escala,
+                  y + self.altura_chapa * self.escala)
+        item = self._itens_chapas.get(chapa_index)
+        if item is None:
+            # Desenha o contorno da chapa abaixo das peças
+            item_id = self.canvas.create_rectangle(
+                *coords, outline='black', width=2, tags=('chapa',))
+            self.canvas.tag_lower(item_id)
+            item = self._itens_chapas[chapa_index] = [item_id, coords, None]
+        elif item[1] != coords:
+            self.canvas.coords(item[0], *coords)
+            item[1] = coords
+            
+        if resumo is None:
+            if item[2] is not None:
+                self.canvas.delete(item[2])
+                item[2] = None
+            return
+            
+        # Resumo: a área ocupada vira uma faixa na base da chapa, com altura
+        # proporcional à ocupação
+        area = self.largura_chapa * self.altura_chapa
+        ocupada = sum(p['largura'] * p['altura'] for p in resumo['pecas_alocadas'])
+        topo = coords[3] - (coords[3] - coords[1]) * min(1.0, ocupada / area if area else 0)
+        coords_resumo = (coords[0], topo, coords[2], coords[3])
+        if item[2] is None:
+            item[2] = self.canvas.create_rectangle(
+                *coords_resumo, fill='lightblue', outline='', tags=('resumo',))
+        else:
+            self.canvas.coords(item[2], *coords_resumo)
+            
+    def _sincronizar_peca(self, chave, peca, x, y):
+        """
+        Cria os itens de uma peça ou atualiza apenas o que mudou neles.
+
+        Cada registro guarda [retângulo, texto do id, texto das dimensões,
+        coordenadas, estilo da borda, texto das dimensões, id, rótulo]. Os
+        textos são None enquanto a peça for pequena demais na tela para eles.
+        Como a chave usa a posição da peça na lista, um item reaproveitado
+        pode passar a mostrar outra peça (após remover ou renomear uma
+        linha); por isso o id e o rótulo também são comparados.
+        """
+        px = x + peca['x'] * self.escala
+        py = y + peca['y'] * self.escala
+        pw = peca['largura'] * self.escala
+        ph = peca['altura'] * self.escala
+        coords = (px, py, pw, ph)
+        com_texto = pw >= self.LARGURA_MIN_TEXTO and ph >= self.ALTURA_MIN_TEXTO
+        
+        # Define a cor e largura da borda baseado na seleção
+        is_selected = (self.peca_selecionada and 
+                       self.peca_selecionada['original_idx'] == peca['original_idx'])
+        estilo = ('red', 3) if is_selected else ('blue', 1)
+        
+        # Texto com as dimensões formatadas com 2 casas decimais
+        dimensoes = f"{peca['largura']:.2f}x{peca['altura']:.2f}"
+        rotulo = peca.get('id_display', peca['id'])
+        
+        item = self._itens_pecas.get(chave)
+        if item is None:
+            # Cria o retângulo da peça
+            rect_id = self.canvas.create_rectangle(
+                px, py, px + pw, py + ph,
+                fill='lightblue', outline=estilo[0], width=estilo[1],
+                tags=('peca', f"peca_{peca['id']}")
+            )
+            item = self._itens_pecas[chave] = [rect_id, None, None,
+                                               coords, estilo, dimensoes,
+                                               peca['id'], rotulo]
+        else:
+            if item[3] != coords:
+                self.canvas.coords(item[0], px, py, px + pw, py + ph)
+                if item[1] is not None:
+                    self.canvas.coords(item[1], px + pw/2, py + ph/2 - 10)
+                    self.canvas.coords(item[2], px + pw/2, py + ph/2 + 10)
+                item[3] = coords
+            if item[4] != estilo:
+                self.canvas.itemconfig(item[0], outline=estilo[0], width=estilo[1])
+                item[4] = estilo
+            if item[5] != dimensoes:
+                if item[2] is not None:
+                    self.canvas.itemconfig(item[2], text=dimensoes)
+                item[5] = dimensoes
+            if item[6] != peca['id']:
+                self._trocar_tag(item[0], f"peca_{item[6]}", f"peca_{peca['id']}")
+                if item[1] is not None:
+                    self._trocar_tag(item[1], f"texto_id_{item[6]}",
+                                     f"texto_id_{peca['id']}")
+                    self._trocar_tag(item[2], f"texto_dim_{item[6]}",
+                                     f"texto_dim_{peca['id']}")
+                item[6] = peca['id']
+            if item[7] != rotulo:
+                if item[1] is not None:
+                    self.canvas.itemconfig(item[1], text=rotulo)
+                item[7] = rotulo
                 
-                # Adiciona o texto com as dimensões formatadas com 2 casas decimais
-                self.canvas.create_text(
-                    px + pw/2, py + ph/2 + 10,
-                    text=f"{peca['largura']:.2f}x{peca['altura']:.2f}",
-                    tags=('texto', f"texto_dim_{peca['id']}")
-                )
+        if com_texto and item[1] is None:
+            # Adiciona o ID/nome da peça
+            item[1] = self.canvas.create_text(
+                px + pw/2, py + ph/2 - 10,
+                text=rotulo,
+                tags=('texto', f"texto_id_{peca['id']}")
+            )
+            
+            # Adiciona o texto com as dimensões
+            item[2] = self.canvas.create_text(
+                px + pw/2, py + ph/2 + 10,
+                text=dimensoes,
+                tags=('texto', f"texto_dim_{peca['id']}")
+            )
+        elif not com_texto and item[1] is not None:
+            self.canvas.delete(item[1], item[2])
+            item[1] = item[2] = None
+            
+    def _trocar_tag(self, item_id, antiga, nova):
+        """Substitui uma tag de um item do canvas."""
+        self.canvas.dtag(item_id, antiga)
+        self.canvas.addtag_withtag(nova, item_id)
+        
+    def _atualizar_peca(self, peca, chapa_index):
+        """Atualiza apenas os itens de uma peça (usado durante o arrasto)."""
+        x, y = self._origem_chapa(chapa_index)
+        self._sincronizar_peca(self._chave_peca(peca), peca, x, y)
+        
+    def _limitar_deslocamento(self):
+        """Mantém o deslocamento da vista dentro da área das chapas."""
+        largura_total = self.largura_chapa * len(self.chapas) * self.escala + 40
+        altura_total = self.altura_chapa * self.escala + 40
+        max_x = max(0, largura_total - self.canvas.winfo_width())
+        max_y = max(0, altura_total - self.canvas.winfo_height())
+        self.offset_x = min(max(self.offset_x, 0), max_x)
+        self.offset_y = min(max(self.offset_y, 0), max_y)
+        
+    def _atualizar_barra_rolagem(self):
+        """Ajusta a barra de rolagem à parte visível das chapas."""
+        largura_total = self.largura_chapa * len(self.chapas) * self.escala + 40
+        if largura_total <= 0:
+            self.scroll_x.set(0, 1)
+            return
+        inicio = self.offset_x / largura_total
+        self.scroll_x.set(inicio, inicio + self.canvas.winfo_width() / largura_total)
+        
+    def _rolar_horizontal(self, acao, valor, unidade=None):
+        """Comando da barra de rolagem ('moveto' ou 'scroll')."""
+        if not self.chapas:
+            return
+        largura_total = self.largura_chapa * len(self.chapas) * self.escala + 40
+        if acao == 'moveto':
+            self.offset_x = float(valor) * largura_total
+        elif acao == 'scroll':
+            passo = self.canvas.winfo_width() if unidade == 'pages' else 40
+            self.offset_x += int(valor) * passo
+        self._redesenhar()
+        
+    def _on_scroll(self, event):
+        """Rola a vista na horizontal (Shift + roda do mouse)."""
+        para_tras = getattr(event, 'delta', 0) > 0 or getattr(event, 'num', None) == 4
+        self._rolar_horizontal('scroll', -1 if para_tras else 1)
+        
+    def _on_pan_inicio(self, event):
+        """Inicia o arrasto da vista com o botão do meio."""
+        self.ponto_pan = (event.x, event.y)
+        
+    def _on_pan(self, event):
+        """Arrasta a vista com o botão do meio."""
+        if not self.ponto_pan:
+            return
+        self.offset_x -= event.x - self.ponto_pan[0]
+        self.offset_y -= event.y - self.ponto_pan[1]
+        self.ponto_pan = (event.x, event.y)
+        self._redesenhar()
                 
     def _encontrar_borda(self, x, y, peca, chapa_index=0, margem=10):
         """Encontra qual borda da peça está sendo tocada."""
@@ -126,8 +373,9 @@ class CorteCanvasView(ttk.Frame):
         ph = peca['altura']
         
         # Converte coordenadas do canvas para coordenadas reais
-        x_real = (x - (chapa_index * self.largura_chapa * self.escala + 20)) / self.escala
-        y_real = (y - 20) / self.escala
+        x0, y0 = self._origem_chapa(chapa_index)
+        x_real = (x - x0) / self.escala
+        y_real = (y - y0) / self.escala
         
         # Verifica se está próximo das bordas com margem maior
         if abs(x_real - px) < margem:
@@ -140,62 +388,61 @@ class CorteCanvasView(ttk.Frame):
             return 'bottom'
         return None
         
+    def _localizar(self, event):
+        """
+        Encontra a chapa e a peça sob o mouse, sem percorrer todas as chapas.
+
+        Só são encontradas as peças que estão desenhadas: em uma chapa
+        desenhada como resumo ou em uma peça pequena demais para aparecer,
+        o clique não seleciona nem redimensiona nada.
+
+        Returns:
+            Tupla (indice_chapa, peca, x, y), com x e y em coordenadas reais da
+            chapa e peca None se o ponto não estiver sobre nenhuma peça
+            desenhada, ou None se o ponto estiver fora das chapas
+        """
+        largura_tela = self.largura_chapa * self.escala if self.chapas else 0
+        if largura_tela <= 0:
+            return None
+        x0, y0 = self._origem_chapa(0)
+        chapa_index = int((event.x - x0) // largura_tela)
+        if not 0 <= chapa_index < len(self._grades):
+            return None
+            
+        # Converte coordenadas do canvas para coordenadas reais
+        x = (event.x - self._origem_chapa(chapa_index)[0]) / self.escala
+        y = (event.y - y0) / self.escala
+        if not self._chapa_detalhada():
+            return chapa_index, None, x, y
+        peca = self._grades[chapa_index].consultar(x, y)
+        if peca is not None and not self._peca_desenhavel(peca):
+            peca = None
+        return chapa_index, peca, x, y
+        
     def _on_motion(self, event):
         """Manipula o movimento do mouse."""
-        # Encontra a chapa atual baseado na posição do mouse
-        chapa_atual = None
-        chapa_index = 0
-        
-        for i, chapa in enumerate(self.chapas):
-            offset_x = i * self.largura_chapa * self.escala + 20
-            if offset_x <= event.x <= offset_x + self.largura_chapa * self.escala:
-                chapa_atual = chapa
-                chapa_index = i
-                break
-                
-        if not chapa_atual:
+        local = self._localizar(event)
+        peca = local[1] if local else None
+        if not peca:
             self.canvas.config(cursor=self.cursor_default)
             return
             
-        # Converte coordenadas do canvas para coordenadas reais
-        x = (event.x - (chapa_index * self.largura_chapa * self.escala + 20)) / self.escala
-        y = (event.y - 20) / self.escala
-        
-        # Verifica se está sobre alguma peça
-        for peca in chapa_atual['pecas_alocadas']:
-            # Verifica se a peça tem todas as propriedades necessárias
-            if not all(key in peca for key in ['x', 'y', 'largura', 'altura']):
-                continue
-                
-            if (peca['x'] <= x <= peca['x'] + peca['largura'] and
-                peca['y'] <= y <= peca['y'] + peca['altura']):
-                
-                # Verifica se está em alguma borda
-                borda = self._encontrar_borda(event.x, event.y, peca, chapa_index)
-                if borda in ['left', 'right']:
-                    self.canvas.config(cursor=self.cursor_resize_h)
-                elif borda in ['top', 'bottom']:
-                    self.canvas.config(cursor=self.cursor_resize_v)
-                else:
-                    self.canvas.config(cursor=self.cursor_default)
-                return
-                
-        self.canvas.config(cursor=self.cursor_default)
+        # Verifica se está em alguma borda
+        borda = self._encontrar_borda(event.x, event.y, peca, local[0])
+        if borda in ['left', 'right']:
+            self.canvas.config(cursor=self.cursor_resize_h)
+        elif borda in ['top', 'bottom']:
+            self.canvas.config(cursor=self.cursor_resize_v)
+        else:
+            self.canvas.config(cursor=self.cursor_default)
         
     def _on_click(self, event):
         """Manipula o clique do mouse."""
-        # Encontra a chapa atual baseado na posição do mouse
-        chapa_atual = None
-        chapa_index = 0
+        local = self._localizar(event)
+        peca = local[1] if local else None
         
-        for i, chapa in enumerate(self.chapas):
-            offset_x = i * self.largura_chapa * self.escala + 20
-            if offset_x <= event.x <= offset_x + self.largura_chapa * self.escala:
-                chapa_atual = chapa
-                chapa_index = i
-                break
-                
-        if not chapa_atual:
+        # Se clicou fora de qualquer peça, desmarca a seleção
+        if not peca:
             self.peca_selecionada = None
             self.peca_em_redimensionamento = None
             self.borda_redimensionamento = None
@@ -203,45 +450,25 @@ class CorteCanvasView(ttk.Frame):
             self._redesenhar()
             return
             
-        # Converte coordenadas do canvas para coordenadas reais
-        x = (event.x - (chapa_index * self.largura_chapa * self.escala + 20)) / self.escala
-        y = (event.y - 20) / self.escala
-        
-        # Encontra a peça clicada
-        for peca in chapa_atual['pecas_alocadas']:
-            # Verifica se a peça tem todas as propriedades necessárias
-            if not all(key in peca for key in ['x', 'y', 'largura', 'altura']):
-                continue
-                
-            if (peca['x'] <= x <= peca['x'] + peca['largura'] and
-                peca['y'] <= y <= peca['y'] + peca['altura']):
-                
-                # Verifica se clicou em alguma borda
-                borda = self._encontrar_borda(event.x, event.y, peca, chapa_index)
-                if borda:
-                    self.peca_em_redimensionamento = peca
-                    self.borda_redimensionamento = borda
-                    # Armazena as dimensões iniciais
-                    self.dimensoes_iniciais = {
-                        'x': peca['x'],
-                        'y': peca['y'],
-                        'largura': peca['largura'],
-                        'altura': peca['altura']
-                    }
-                else:
-                    self.peca_selecionada = peca
-                    # Notifica a janela principal sobre a seleção
-                    self.parent.selecionar_peca_canvas(peca)
-                    
-                self.ponto_inicial = (event.x, event.y)
-                self._redesenhar()
-                return
-                
-        # Se clicou fora de qualquer peça, desmarca a seleção
-        self.peca_selecionada = None
-        self.peca_em_redimensionamento = None
-        self.borda_redimensionamento = None
-        self.dimensoes_iniciais = None
+        # Verifica se clicou em alguma borda
+        borda = self._encontrar_borda(event.x, event.y, peca, local[0])
+        if borda:
+            self.peca_em_redimensionamento = peca
+            self.chapa_em_redimensionamento = local[0]
+            self.borda_redimensionamento = borda
+            # Armazena as dimensões iniciais
+            self.dimensoes_iniciais = {
+                'x': peca['x'],
+                'y': peca['y'],
+                'largura': peca['largura'],
+                'altura': peca['altura']
+            }
+        else:
+            self.peca_selecionada = peca
+            # Notifica a janela principal sobre a seleção
+            self.parent.selecionar_peca_canvas(peca)
+            
+        self.ponto_inicial = (event.x, event.y)
         self._redesenhar()
         
     def selecionar_peca(self, peca):
@@ -254,23 +481,17 @@ class CorteCanvasView(ttk.Frame):
         if not self.peca_em_redimensionamento or not self.ponto_inicial or not self.dimensoes_iniciais:
             return
             
-        # Encontra a chapa atual da peça
-        chapa_atual = None
-        for chapa in self.chapas:
-            if self.peca_em_redimensionamento in chapa['pecas_alocadas']:
-                chapa_atual = chapa
-                break
-                
-        if not chapa_atual:
+        # A chapa da peça foi encontrada pelo índice espacial no clique
+        chapa_index = self.chapa_em_redimensionamento
+        if chapa_index is None:
             return
             
-        # Calcula o offset da chapa atual
-        chapa_index = self.chapas.index(chapa_atual)
-        offset_x = chapa_index * self.largura_chapa * self.escala + 20
+        # Calcula a origem da chapa atual
+        offset_x, offset_y = self._origem_chapa(chapa_index)
         
         # Converte coordenadas do mouse para coordenadas reais
         x_real = (event.x - offset_x) / self.escala
-        y_real = (event.y - 20) / self.escala
+        y_real = (event.y - offset_y) / self.escala
         
         # Obtém as dimensões iniciais
         x_inicial = self.dimensoes_iniciais['x']
@@ -302,12 +523,15 @@ class CorteCanvasView(ttk.Frame):
             self.peca_em_redimensionamento['largura'] = nova_largura
             self.peca_em_redimensionamento['altura'] = nova_altura
             
-            # Atualiza a visualização
-            self._redesenhar()
+            # Atualiza só os itens da peça redimensionada
+            self._atualizar_peca(self.peca_em_redimensionamento, chapa_index)
             
     def _on_release(self, event):
         """Manipula o soltar do mouse."""
         if self.peca_em_redimensionamento:
+            # A peça mudou de tamanho: refaz o índice espacial da chapa dela
+            if self.chapa_em_redimensionamento is not None:
+                self._reindexar_chapa(self.chapa_em_redimensionamento)
             # Notifica a janela principal sobre a mudança
             self.parent.atualizar_peca_redimensionada(
                 self.peca_em_redimensionamento
@@ -315,16 +539,34 @@ class CorteCanvasView(ttk.Frame):
             # Mantém a seleção da peça após redimensionar
             self.peca_selecionada = self.peca_em_redimensionamento
         self.peca_em_redimensionamento = None
+        self.chapa_em_redimensionamento = None
         self.borda_redimensionamento = None
         self.dimensoes_iniciais = None
         self.ponto_inicial = None
         
+    def _indice_chapa_da_peca(self, peca):
+        """Índice da chapa que contém a peça (o próprio dicionário), ou None."""
+        for i, chapa in enumerate(self.chapas):
+            if any(p is peca for p in chapa['pecas_alocadas']):
+                return i
+        return None
+        
+    def _reindexar_chapa(self, chapa_index):
+        """Reconstrói o índice espacial da chapa."""
+        self._grades[chapa_index] = GradePecas(self.largura_chapa, self.altura_chapa,
+                                               self.chapas[chapa_index]['pecas_alocadas'])
+                
     def _on_zoom(self, event):
-        """Manipula o zoom do mouse."""
-        if event.delta > 0:
-            self.escala *= 1.1
-        else:
-            self.escala /= 1.1
+        """Manipula o zoom do mouse, mantendo fixo o ponto sob o cursor."""
+        fator = 1.1 if getattr(event, 'delta', 0) > 0 or getattr(event, 'num', None) == 4 else 1 / 1.1
+        novo_zoom = min(max(self.zoom * fator, 1.0), 50.0)
+        if novo_zoom == self.zoom:
+            return
+        fator = novo_zoom / self.zoom
+        self.zoom = novo_zoom
+        self.escala *= fator
+        self.offset_x = (event.x + self.offset_x - 20) * fator - event.x + 20
+        self.offset_y = (event.y + self.offset_y - 20) * fator - event.y + 20
         self._redesenhar()
         
     def _rotacionar_peca_selecionada(self, event):
@@ -339,6 +581,9 @@ class CorteCanvasView(ttk.Frame):
                 self.peca_selecionada['largura'] = altura
                 self.peca_selecionada['altura'] = largura
                 self.peca_selecionada['rotacionada'] = not self.peca_selecionada.get('rotacionada', False)
+                chapa_index = self._indice_chapa_da_peca(self.peca_selecionada)
+                if chapa_index is not None:
+                    self._reindexar_chapa(chapa_index)
                 self._redesenhar()
                 # Notifica a janela principal sobre a mudança
                 self.parent.atualizar_peca_redimensionada(self.peca_selecionada)
@@ -31,12 +31,19 @@ class PecaDialog(simpledialog.Dialog):
                                   validatecommand=(master.register(self._validar_numero), '%P'))
         self.quant_entry.grid(row=3, column=1, sticky="ew", padx=5, pady=5)
 
+        # Peças com veio (ex.: chapas folheadas) não podem ser rotacionadas
+        self.pode_rotacionar_var = tk.BooleanVar(value=True)
+        tk.Checkbutton(master, text="Permitir rotação (sem veio)",
+                       variable=self.pode_rotacionar_var).grid(
+            row=4, column=0, columnspan=2, sticky="w", padx=5, pady=5)
+
         # Preencher com dados iniciais se for edição
         if self.initial_data:
             self.id_entry.insert(0, self.initial_data.get('id', ''))
             self.larg_entry.insert(0, str(self.initial_data.get('larg', '')))
             self.alt_entry.insert(0, str(self.initial_data.get('alt', '')))
             self.quant_entry.insert(0, str(self.initial_data.get('quant', '')))
+            self.pode_rotacionar_var.set(self.initial_data.get('pode_rotacionar', True))
         else:
             self.quant_entry.insert(0, "1")
             
@@ -84,7 +91,8 @@ class PecaDialog(simpledialog.Dialog):
                 'id': id_p,
                 'larg': l,
                 'alt': a,
-                'quant': q
+                'quant': q,
+                'pode_rotacionar': self.pode_rotacionar_var.get()
             }
             
             if self.initial_data and 'original_idx' in self.initial_data:
@@ -0,0 +1,212 @@
+"""
+Execução da otimização fora da thread do Tk.
+
+O cálculo roda em uma thread de trabalho, e o resultado volta para a thread
+da interface por uma fila consultada com master.after. Nenhum widget é
+tocado fora da thread do Tk.
+
+Rajadas de edições (redimensionar, mover, colar várias vezes) são agrupadas
+por agendar em uma única otimização, feita após um curto período sem novas
+edições, e a otimização é dispensada se a entrada não mudou.
+
+Funções progressivas (veja algoritmo.progressivo) podem informar resultados
+parciais, que chegam à thread do Tk pela mesma fila, e são interrompidas
+assim que o pedido delas fica obsoleto.
+"""
+import queue
+import threading
+
+
+class OtimizacaoEmSegundoPlano:
+    """
+    Executa uma função de otimização em segundo plano, sempre com o pedido mais recente.
+
+    Cada chamada a solicitar recebe um número de geração. Se um novo pedido
+    chega enquanto outro está em andamento, o resultado do antigo é
+    descartado ao chegar, e apenas o último pedido pendente é executado em
+    seguida; os intermediários nunca chegam a rodar.
+    """
+    INTERVALO_CONSULTA_MS = 50
+    # Tempo sem novas edições antes de otimizar (veja agendar)
+    ATRASO_AGENDAMENTO_MS = 250
+
+    def __init__(self, master, funcao, ao_concluir, ao_falhar=None, ao_mudar_estado=None,
+                 ao_dispensar=None, ao_progredir=None):
+        """
+        Args:
+            master: Widget Tk usado para agendar a entrega dos resultados
+            funcao: Função executada na thread de trabalho
+            ao_concluir: Chamada na thread do Tk com (resultado, contexto)
+            ao_falhar: Chamada na thread do Tk com (exceção, contexto)
+            ao_mudar_estado: Chamada na thread do Tk com True quando uma
+                otimização começa e False quando não há mais nenhuma em andamento
+            ao_dispensar: Chamada na thread do Tk com o contexto quando um
+                pedido agendado é dispensado por ter a mesma entrada do anterior
+            ao_progredir: Chamada na thread do Tk com (progresso, contexto)
+                para cada progresso do pedido atual. Quando informada, funcao
+                recebe o argumento nomeado ao_progredir, que enfileira o
+                progresso e retorna False se o pedido ficou obsoleto
+        """
+        self.master = master
+        self.funcao = funcao
+        self.ao_concluir = ao_concluir
+        self.ao_falhar = ao_falhar
+        self.ao_mudar_estado = ao_mudar_estado
+        self.ao_dispensar = ao_dispensar
+        self.ao_progredir = ao_progredir
+        self.geracao = 0
+        self._pendente = None
+        self._em_andamento = False
+        self._resultados = queue.Queue()
+        # Pedido aguardando o fim da rajada de edições e o id do after dele
+        self._agendado = None
+        self._id_agendamento = None
+        # Chave da entrada do último pedido enviado para execução
+        self._ultima_chave = None
+
+    @property
+    def ocupado(self) -> bool:
+        """True enquanto houver uma otimização agendada, em andamento ou pendente."""
+        return (self._agendado is not None or self._em_andamento or
+                self._pendente is not None)
+
+    def solicitar(self, args: tuple, kwargs: dict = None, contexto=None, chave=None,
+                  funcao=None):
+        """
+        Pede uma nova otimização imediata, tornando obsoletas as anteriores.
+
+        Args:
+            args: Argumentos posicionais de funcao
+            kwargs: Argumentos nomeados de funcao
+            contexto: Valor repassado a ao_concluir junto com o resultado
+            chave: Valor comparável que identifica a entrada (veja agendar)
+            funcao: Função a executar no lugar de funcao só neste pedido (por
+                exemplo, uma reotimização incremental). Ela não recebe
+                ao_progredir
+        """
+        self._cancelar_agendamento()
+        self.geracao += 1
+        self._ultima_chave = chave
+        self._pendente = (self.geracao, funcao, args, kwargs or {}, contexto)
+        if not self._em_andamento:
+            self._iniciar_pendente()
+
+    def agendar(self, args: tuple, kwargs: dict = None, contexto=None, chave=None,
+                atraso_ms: int = None):
+        """
+        Agenda uma otimização para depois de um período sem novos pedidos.
+
+        Cada novo pedido substitui o agendado e reinicia a espera, de modo
+        que uma rajada de edições resulta em uma única otimização. Se a
+        chave for igual à do último pedido executado, a otimização é
+        dispensada e ao_dispensar é chamada no lugar.
+
+        Args:
+            args: Argumentos posicionais de funcao
+            kwargs: Argumentos nomeados de funcao
+            contexto: Valor repassado a ao_concluir junto com o resultado
+            chave: Valor comparável que identifica a entrada (None sempre executa)
+            atraso_ms: Período de espera (padrão: ATRASO_AGENDAMENTO_MS)
+        """
+        self._cancelar_agendamento()
+        self._agendado = (args, kwargs, contexto, chave)
+        self._id_agendamento = self.master.after(
+            self.ATRASO_AGENDAMENTO_MS if atraso_ms is None else atraso_ms,
+            self._executar_agendado)
+
+    def cancelar(self, chave_atual=None):
+        """
+        Descarta os pedidos agendados e pendentes e o resultado em andamento.
+
+        Args:
+            chave_atual: Chave da entrada cujo resultado já está em uso, obtido
+                por outro meio; pedidos agendados com ela serão dispensados
+        """
+        self._cancelar_agendamento()
+        self.geracao += 1
+        self._pendente = None
+        self._ultima_chave = chave_atual
+
+    def _cancelar_agendamento(self):
+        if self._id_agendamento is not None:
+            self.master.after_cancel(self._id_agendamento)
+        self._agendado = None
+        self._id_agendamento = None
+
+    def _executar_agendado(self):
+        args, kwargs, contexto, chave = self._agendado
+        self._agendado = None
+        self._id_agendamento = None
+        if chave is not None and chave == self._ultima_chave:
+            if self.ao_dispensar:
+                self.ao_dispensar(contexto)
+            return
+        self.solicitar(args, kwargs, contexto, chave)
+
+    def _iniciar_pendente(self):
+        geracao, funcao, args, kwargs, contexto = self._pendente
+        self._pendente = None
+        if not self._em_andamento:
+            self._em_andamento = True
+            if self.ao_mudar_estado:
+                self.ao_mudar_estado(True)
+            self.master.after(self.INTERVALO_CONSULTA_MS, self._consultar)
+        threading.Thread(target=self._trabalhar,
+                         args=(geracao, funcao, args, kwargs, contexto), daemon=True).start()
+
+    def _trabalhar(self, geracao, funcao, args, kwargs, contexto):
+        """Roda na thread de trabalho: só calcula e enfileira o resultado."""
+        if funcao is None:
+            funcao = self.funcao
+            if self.ao_progredir is not None:
+                kwargs = dict(kwargs, ao_progredir=lambda progresso: self._informar_progresso(
+                    geracao, progresso, contexto))
+        try:
+            self._resultados.put((geracao, True, funcao(*args, **kwargs), contexto))
+        except Exception as e:
+            self._resultados.put((geracao, False, e, contexto))
+
+    def _informar_progresso(self, geracao, progresso, contexto) -> bool:
+        """
+        Roda na thread de trabalho: enfileira um resultado parcial.
+
+        Returns:
+            False se já há um pedido mais novo, para que a função pare
+        """
+        if geracao != self.geracao or self._pendente is not None:
+            return False
+        self._resultados.put((geracao, None, progresso, contexto))
+        return True
+
+    def _consultar(self):
+        """Roda na thread do Tk: entrega o resultado, se já houver um."""
+        while True:
+            try:
+                geracao, sucesso, valor, contexto = self._resultados.get_nowait()
+            except queue.Empty:
+                self.master.after(self.INTERVALO_CONSULTA_MS, self._consultar)
+                return
+            if sucesso is not None:
+                break
+            # Resultado parcial: só o do pedido atual é mostrado
+            if geracao == self.geracao and self._pendente is None:
+                self.ao_progredir(valor, contexto)
+
+        if self._pendente is not None:
+            # Chegou um pedido mais novo: roda-o sem entregar o resultado antigo
+            self._iniciar_pendente()
+            self.master.after(self.INTERVALO_CONSULTA_MS, self._consultar)
+            return
+
+        self._em_andamento = False
+        if self.ao_mudar_estado:
+            self.ao_mudar_estado(False)
+        if geracao != self.geracao:
+            return
+        if sucesso:
+            self.ao_concluir(valor, contexto)
+        else:
+            # A mesma entrada deve ser tentada de novo no próximo pedido
+            self._ultima_chave = None
+            if self.ao_falhar:
+                self.ao_falhar(valor, contexto)
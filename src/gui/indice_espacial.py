@@ -0,0 +1,58 @@
+"""
+Índice espacial das peças de uma chapa, para localizar a peça sob o mouse.
+"""
+import math
+
+
+class GradePecas:
+    """
+    Grade uniforme sobre a chapa, em que cada célula lista as peças que a tocam.
+
+    A consulta de um ponto examina só as peças da célula que o contém. O
+    número de células cresce com o número de peças, de modo que cada
+    célula tenha, em média, poucas peças.
+    """
+    MAX_DIVISOES = 64
+
+    def __init__(self, largura, altura, pecas):
+        """
+        Args:
+            largura: Largura da chapa
+            altura: Altura da chapa
+            pecas: Peças alocadas na chapa (dicionários com x, y, largura e altura)
+        """
+        self.largura = largura
+        self.altura = altura
+        self.pecas = [p for p in pecas
+                      if all(key in p for key in ('x', 'y', 'largura', 'altura'))]
+        divisoes = max(1, min(self.MAX_DIVISOES, math.ceil(math.sqrt(len(self.pecas)))))
+        self.colunas = self.linhas = divisoes
+        self.celulas = {}
+        for i, peca in enumerate(self.pecas):
+            c0, l0 = self._celula(peca['x'], peca['y'])
+            c1, l1 = self._celula(peca['x'] + peca['largura'], peca['y'] + peca['altura'])
+            for c in range(c0, c1 + 1):
+                for l in range(l0, l1 + 1):
+                    self.celulas.setdefault((c, l), []).append(i)
+
+    def _celula(self, x, y):
+        """Coluna e linha da célula que contém o ponto (limitadas à grade)."""
+        c = int(x * self.colunas / self.largura) if self.largura > 0 else 0
+        l = int(y * self.linhas / self.altura) if self.altura > 0 else 0
+        return min(max(c, 0), self.colunas - 1), min(max(l, 0), self.linhas - 1)
+
+    def consultar(self, x, y):
+        """
+        Peça que contém o ponto (bordas incluídas).
+
+        Returns:
+            A primeira peça, na ordem da chapa, que contém o ponto, ou None
+        """
+        if not (0 <= x <= self.largura and 0 <= y <= self.altura):
+            return None
+        for i in self.celulas.get(self._celula(x, y), ()):
+            peca = self.pecas[i]
+            if (peca['x'] <= x <= peca['x'] + peca['largura'] and
+                    peca['y'] <= y <= peca['y'] + peca['altura']):
+                return peca
+        return None
@@ -5,11 +5,23 @@ from matplotlib.figure import Figure
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import pandas as pd
 import os
+from functools import partial
 
-from algoritmo.corte import cortar_chapas
+from algoritmo.cache import CacheResultados, cortar_chapas_com_cache
+from algoritmo.corte import reotimizar_peca
+from algoritmo.modelo import Peca, ResultadoCorte
+from algoritmo.progressivo import cortar_chapas_progressivo
+from utils.exportacao import exportar_plano_corte
+from utils.importacao import (COLUNA_ALTURA, COLUNA_ID, COLUNA_LARGURA,
+                               COLUNA_QUANTIDADE, ler_pecas_excel)
 from utils.visualizacao import plotar_chapas_na_figura
 from .canvas_view import CorteCanvasView
 from .dialog import PecaDialog
+from .execucao import OtimizacaoEmSegundoPlano
+
+# Tempo máximo (s) de cada otimização; o melhor resultado parcial é exibido
+# enquanto ela não termina
+TEMPO_LIMITE_OTIMIZACAO = 2.0
 
 class CorteGUI:
     """
@@ -33,6 +45,20 @@ class CorteGUI:
         # Variável para controlar a segunda chapa
         self.segunda_chapa_habilitada = True
         
+        # Resultados recentes, reaproveitados ao desfazer, importar de novo etc.
+        self.cache_resultados = CacheResultados(capacidade=32)
+        
+        # Otimização em segundo plano, para não travar a janela
+        self.otimizacao = OtimizacaoEmSegundoPlano(
+            self.master, partial(cortar_chapas_com_cache, cache=self.cache_resultados,
+                                 otimizador=cortar_chapas_progressivo,
+                                 tempo_limite=TEMPO_LIMITE_OTIMIZACAO),
+            ao_concluir=self._aplicar_resultado_otimizacao,
+            ao_falhar=self._mostrar_erro_otimizacao,
+            ao_mudar_estado=self._atualizar_indicador_otimizacao,
+            ao_dispensar=self._redesenhar_resultado_atual,
+            ao_progredir=self._mostrar_progresso_otimizacao)
+        
         self._setup_menu()
         self._setup_layout()
         self._setup_variables()
@@ -61,6 +87,8 @@ class CorteGUI:
         exportmenu = Menu(filemenu, tearoff=0)
         exportmenu.add_command(label="Lista de Peças para Excel...", 
                              command=self.exportar_lista_pecas_para_excel)
+        exportmenu.add_command(label="Plano de Corte (PDF/SVG)...", 
+                             command=self.exportar_plano_corte)
         filemenu.add_cascade(label="Exportar", menu=exportmenu)
         filemenu.add_separator()
         filemenu.add_command(label="Sair", command=self.master.quit)
@@ -249,16 +277,29 @@ class CorteGUI:
         self.executar_corte_btn = tk.Button(
             botoes_frame,
             text="Otimizar e Visualizar Cortes",
-            command=self.atualizar_visualizacao_e_otimizar,
+            command=lambda: self.atualizar_visualizacao_e_otimizar(imediato=True),
             bg="lightblue",
             font=('Arial', 10, 'bold')
         )
         self.executar_corte_btn.pack(fill=tk.X)
+        
+        # Resumo do último plano de corte
+        self.metricas_label = tk.Label(acoes_frame, text="", justify=tk.LEFT,
+                                       anchor='w', font=('Arial', 9))
+        self.metricas_label.pack(fill=tk.X, padx=2, pady=(0, 5))
+        
+        # Indicador exibido enquanto a otimização está em andamento
+        self.progresso_frame = ttk.Frame(acoes_frame)
+        self.progresso_label = tk.Label(self.progresso_frame, text="Otimizando...")
+        self.progresso_label.pack(side=tk.LEFT, padx=2)
+        self.progresso_bar = ttk.Progressbar(self.progresso_frame, mode='indeterminate')
+        self.progresso_bar.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=2)
 
     def _setup_variables(self):
         """Inicializa as variáveis da aplicação."""
         self.pecas_a_cortar = []
         self.resultado_cortes_otimizado = None
+        self.pecas_nao_alocadas = []
         self.proximo_id_original = 0
         self.ultima_peca_removida_info = None
 
@@ -290,8 +331,36 @@ class CorteGUI:
                     self.treeview_pecas.see(iid)
                 break
                 
-        # Atualiza a visualização e otimiza o layout
-        self.atualizar_visualizacao_e_otimizar()
+        # Refaz só a chapa da peça alterada; sem um resultado anterior,
+        # otimiza o layout inteiro
+        if not self._reotimizar_peca_alterada(peca['original_idx']):
+            self.atualizar_visualizacao_e_otimizar()
+
+    def _reotimizar_peca_alterada(self, original_idx):
+        """
+        Reotimiza de forma incremental após a alteração de uma peça.
+
+        Returns:
+            False se não há um resultado atual para partir dele
+        """
+        # Com outra otimização por vir, o resultado exibido já está desatualizado
+        if self.resultado_cortes_otimizado is None or self.otimizacao.ocupado:
+            return False
+        entrada = self._preparar_otimizacao()
+        if entrada is None:
+            return True
+        largura_chapa, altura_chapa, pecas_exp, chave = entrada
+        
+        # Roda em segundo plano: se o resultado atual não corresponde à
+        # entrada, reotimizar_peca refaz o layout inteiro. As chapas são
+        # copiadas porque o arrasto no canvas altera as peças exibidas
+        chapas = [dict(chapa, pecas_alocadas=[dict(p) for p in chapa['pecas_alocadas']])
+                  for chapa in self.resultado_cortes_otimizado]
+        self.otimizacao.solicitar(
+            (largura_chapa, altura_chapa, chapas, list(self.pecas_nao_alocadas), pecas_exp,
+             original_idx),
+            contexto=(largura_chapa, altura_chapa), chave=chave, funcao=reotimizar_peca)
+        return True
 
     def atualizar_treeview_pecas(self):
         """Atualiza a visualização da lista de peças."""
@@ -303,7 +372,7 @@ class CorteGUI:
         for p in self.pecas_a_cortar:
             id_d = p.get('id_display', f"P{p['original_idx']+1}")
             self.treeview_pecas.insert("", "end", text=str(p['original_idx']),
-                                     values=(id_d, f"{p['alt']:.2f}", f"{p['larg']:.2f}", "1"))
+                                     values=(id_d, f"{p['alt']:.2f}", f"{p['larg']:.2f}", p.get('quant', 1)))
 
     def remover_peca_selecionada(self, peca=None):
         """Remove a peça selecionada."""
@@ -340,6 +409,7 @@ class CorteGUI:
         # Limpa a seleção no canvas
         self.canvas_view.peca_selecionada = None
         self.canvas_view.peca_em_redimensionamento = None
+        self.canvas_view.chapa_em_redimensionamento = None
         self.canvas_view.borda_redimensionamento = None
         self.canvas_view.dimensoes_iniciais = None
         self.canvas_view._redesenhar()
@@ -350,39 +420,76 @@ class CorteGUI:
         # Atualiza o estado dos outros botões
         self.atualizar_menu()
 
-    def atualizar_visualizacao_e_otimizar(self):
-        """Atualiza a visualização e otimiza o layout das peças."""
+    def atualizar_visualizacao_e_otimizar(self, imediato=False):
+        """
+        Atualiza a visualização e otimiza o layout das peças.
+
+        Sem imediato, a otimização é agendada: edições em sequência rápida
+        geram uma única otimização, que é dispensada se as peças e a chapa
+        não mudaram desde a última.
+        """
+        entrada = self._preparar_otimizacao()
+        if entrada is None:
+            return
+        largura_chapa, altura_chapa, pecas_exp, chave = entrada
+            
+        # Executa o algoritmo de corte em segundo plano; o resultado é
+        # aplicado por _aplicar_resultado_otimizacao
+        args = (largura_chapa, altura_chapa, pecas_exp)
+        contexto = (largura_chapa, altura_chapa)
+        if imediato:
+            self.otimizacao.solicitar(args, contexto=contexto, chave=chave)
+        else:
+            self.otimizacao.agendar(args, contexto=contexto, chave=chave)
+
+    def _preparar_otimizacao(self):
+        """
+        Valida a chapa e monta a entrada do algoritmo a partir da lista de peças.
+
+        Returns:
+            Tupla (largura, altura, peças, chave) ou None se a chapa for inválida.
+            A chave identifica a entrada, para dispensar otimizações repetidas.
+        """
         # Obtém as dimensões da chapa
         largura_chapa = self._validar_dimensoes_chapa(mostrar_erro=True)
         altura_chapa = self._validar_dimensoes_chapa(mostrar_erro=True)
         
         if largura_chapa is None or altura_chapa is None:
-            return
+            return None
             
         # Prepara as peças para o algoritmo
-        pecas_exp = []
-        for i, peca in enumerate(self.pecas_a_cortar):
-            pecas_exp.append({
-                'id': peca['id'],
-                'larg': peca['larg'],
-                'alt': peca['alt'],
-                'original_idx': i
-            })
-            
-        # Executa o algoritmo de corte
-        self.resultado_cortes_otimizado, nao_alocadas = cortar_chapas(
-            largura_chapa, altura_chapa, pecas_exp)
+        pecas_exp = [
+            Peca(peca['id'], peca['larg'], peca['alt'], i,
+                 peca.get('quant', 1), peca.get('pode_rotacionar', True))
+            for i, peca in enumerate(self.pecas_a_cortar)
+        ]
+        chave = (largura_chapa, altura_chapa,
+                 tuple((p.id, p.largura, p.altura, p.quantidade, p.pode_rotacionar)
+                       for p in pecas_exp))
+        return largura_chapa, altura_chapa, pecas_exp, chave
+
+    def _redesenhar_resultado_atual(self, contexto):
+        """Redesenha o último resultado quando a otimização é dispensada."""
+        if self.resultado_cortes_otimizado is not None:
+            largura_chapa, altura_chapa = contexto
+            self.canvas_view.atualizar_visualizacao(
+                self.resultado_cortes_otimizado, largura_chapa, altura_chapa)
+
+    def _aplicar_resultado_otimizacao(self, resultado, contexto):
+        """Mostra o resultado de uma otimização concluída (thread do Tk)."""
+        largura_chapa, altura_chapa = contexto
+        self.resultado_cortes_otimizado, nao_alocadas = resultado
+        self.pecas_nao_alocadas = nao_alocadas
+        tempos = getattr(resultado, 'tempos', None)
             
         # Se não está habilitada a segunda chapa e há peças não alocadas
         if not self.segunda_chapa_habilitada and nao_alocadas:
             # Verifica se alguma peça excede o limite da chapa
             for peca in nao_alocadas:
                 if peca['larg'] > largura_chapa or peca['alt'] > altura_chapa:
-                    if self._mostrar_dialog_segunda_chapa(peca):
-                        # Reexecuta o algoritmo com segunda chapa habilitada
-                        self.resultado_cortes_otimizado, nao_alocadas = cortar_chapas(
-                            largura_chapa, altura_chapa, pecas_exp)
-                    else:
+                    # Se o usuário aceitar a segunda chapa, o resultado
+                    # completo já calculado é mantido
+                    if not self._mostrar_dialog_segunda_chapa(peca):
                         # Se o usuário não quer segunda chapa, mantém apenas a primeira
                         if self.resultado_cortes_otimizado and len(self.resultado_cortes_otimizado) > 1:
                             self.resultado_cortes_otimizado = [self.resultado_cortes_otimizado[0]]
@@ -395,6 +502,11 @@ class CorteGUI:
             altura_chapa
         )
         
+        # As métricas valem para as chapas exibidas, que podem ter sido reduzidas
+        self._mostrar_metricas(ResultadoCorte(
+            self.resultado_cortes_otimizado, nao_alocadas, largura_chapa, altura_chapa,
+            tempos=tempos))
+        
         # Mostra mensagem com peças não alocadas
         if nao_alocadas:
             self._mostrar_pecas_nao_alocadas(nao_alocadas)
@@ -402,6 +514,49 @@ class CorteGUI:
         # Atualiza o menu
         self.atualizar_menu()
 
+    def _mostrar_erro_otimizacao(self, erro, contexto):
+        """Mostra a falha de uma otimização em segundo plano."""
+        messagebox.showerror("Erro de Otimização",
+                             f"Não foi possível otimizar o corte:\n{erro}")
+
+    def _atualizar_indicador_otimizacao(self, em_andamento):
+        """Mostra ou esconde o indicador de otimização em andamento."""
+        if em_andamento:
+            self.progresso_label.config(text="Otimizando...")
+            self.progresso_frame.pack(fill=tk.X, padx=2, pady=(0, 5))
+            self.progresso_bar.start(10)
+        else:
+            self.progresso_bar.stop()
+            self.progresso_frame.pack_forget()
+
+    def _mostrar_metricas(self, resultado):
+        """Mostra o aproveitamento, o desperdício e a maior sobra do plano."""
+        if not resultado.chapas:
+            self.metricas_label.config(text="")
+            return
+        metricas = resultado.metricas
+        linhas = [
+            f"Chapas: {len(resultado.chapas)}  |  Aproveitamento: {metricas['aproveitamento']:.1%}",
+            f"Desperdício: {metricas['desperdicio'] / 10000:.2f} m²  |  Cortes: {metricas['cortes']}",
+        ]
+        sobra = metricas['maior_sobra']
+        if sobra:
+            linhas.append(f"Maior sobra: {sobra['largura']:.1f}x{sobra['altura']:.1f} "
+                          f"(chapa {sobra['id_chapa']})")
+        if 'total' in resultado.tempos:
+            linhas.append(f"Tempo: {resultado.tempos['total'] * 1000:.0f} ms")
+        self.metricas_label.config(text="\n".join(linhas))
+
+    def _mostrar_progresso_otimizacao(self, progresso, contexto):
+        """Mostra o melhor layout parcial enquanto a otimização continua."""
+        self.progresso_label.config(
+            text=f"Otimizando... {progresso['chapas']} chapa(s), "
+                 f"{progresso['aproveitamento']:.0%}")
+        if progresso['melhorou']:
+            largura_chapa, altura_chapa = contexto
+            self.canvas_view.atualizar_visualizacao(
+                progresso['resultado'].chapas, largura_chapa, altura_chapa)
+
     def _mostrar_pecas_nao_alocadas(self, nao_alocadas):
         """Mostra mensagem com as peças não alocadas."""
         msg = "Peças não alocadas:\n"
@@ -412,7 +567,7 @@ class CorteGUI:
                         if item["original_idx"] == p_na['original_idx']), None)
             if desc:
                 nome = f"{desc.get('id_display','P')} ({desc['larg']}x{desc['alt']})"
-                mapa[nome] = mapa.get(nome, 0) + 1
+                mapa[nome] = mapa.get(nome, 0) + p_na.get('quant', 1)
                 
         for nome, qtd in mapa.items():
             msg += f"- {nome}: {qtd} un.\n"
@@ -475,40 +630,32 @@ class CorteGUI:
         """Abre diálogo para adicionar nova peça."""
         d = PecaDialog(self.master, title="Adicionar Peça")
         if d.result:
-            npi = d.result
-            quantidade = npi.get('quant', 1)
-            
-            # Remove a quantidade do dicionário original
-            if 'quant' in npi:
-                del npi['quant']
-            
-            # Cria cópias independentes da peça
-            for i in range(quantidade):
-                nova_peca = npi.copy()
-                nova_peca['original_idx'] = self.proximo_id_original
-                
-                if not nova_peca.get('id'):
-                    nova_peca['id'] = f"P{self.proximo_id_original+1}"
-                    
-                nova_peca['id_display'] = nova_peca['id']
-                
-                # Valida se as dimensões cabem na chapa
-                largura_chapa = self._validar_dimensoes_chapa()
-                altura_chapa = self._validar_dimensoes_chapa()
-                if largura_chapa is None or altura_chapa is None:
-                    return
-                    
-                if nova_peca['larg'] > largura_chapa or nova_peca['alt'] > altura_chapa:
-                    messagebox.showerror(
-                        "Erro",
-                        f"As dimensões da peça ({nova_peca['larg']}x{nova_peca['alt']}) "
-                        f"excedem as dimensões da chapa ({largura_chapa}x{altura_chapa})."
-                    )
-                    return
-                    
-                self.pecas_a_cortar.append(nova_peca)
-                self.proximo_id_original += 1
-            
+            # A quantidade fica na própria peça e é tratada pelo otimizador
+            nova_peca = d.result
+            nova_peca['original_idx'] = self.proximo_id_original
+
+            if not nova_peca.get('id'):
+                nova_peca['id'] = f"P{self.proximo_id_original+1}"
+
+            nova_peca['id_display'] = nova_peca['id']
+
+            # Valida se as dimensões cabem na chapa
+            largura_chapa = self._validar_dimensoes_chapa()
+            altura_chapa = self._validar_dimensoes_chapa()
+            if largura_chapa is None or altura_chapa is None:
+                return
+
+            if nova_peca['larg'] > largura_chapa or nova_peca['alt'] > altura_chapa:
+                messagebox.showerror(
+                    "Erro",
+                    f"As dimensões da peça ({nova_peca['larg']}x{nova_peca['alt']}) "
+                    f"excedem as dimensões da chapa ({largura_chapa}x{altura_chapa})."
+                )
+                return
+
+            self.pecas_a_cortar.append(nova_peca)
+            self.proximo_id_original += 1
+
             self.atualizar_treeview_pecas()
             self.atualizar_visualizacao_e_otimizar()
             self.undo_remove_btn.config(state=tk.DISABLED)
@@ -527,7 +674,9 @@ class CorteGUI:
             'id': peca_atual.get('id', ''),
             'larg': peca_atual['larg'],
             'alt': peca_atual['alt'],
-            'quant': peca_atual.get('quant', 1)
+            'quant': peca_atual.get('quant', 1),
+            'pode_rotacionar': peca_atual.get('pode_rotacionar', True),
+            'original_idx': peca_atual['original_idx']
         }
             
         d = PecaDialog(self.master,
@@ -642,86 +791,18 @@ class CorteGUI:
             return
             
         try:
-            df = pd.read_excel(filepath)
-            col_map = {'id': None, 'largura': None, 'altura': None, 'quantidade': None}
-            
-            # Mapeamento de colunas
-            std_id_col = 'ID/Nome da Peça'
-            std_alt_col = 'Altura (cm)'
-            std_larg_col = 'Largura (cm)'
-            std_quant_col = 'Quantidade'
-            
-            possible_id_cols = [std_id_col.lower(), 'id', 'nome', 'id peça', 'id_peca', 'id/nome']
-            possible_larg_cols = [std_larg_col.lower(), 'largura', 'larg']
-            possible_alt_cols = [std_alt_col.lower(), 'altura', 'alt']
-            possible_quant_cols = [std_quant_col.lower(), 'qtd.', 'qtd', 'quant']
-            
-            # Identifica as colunas no arquivo
-            for col in df.columns:
-                col_lower = str(col).lower()
-                if not col_map['id'] and col_lower in possible_id_cols:
-                    col_map['id'] = col
-                elif not col_map['largura'] and col_lower in possible_larg_cols:
-                    col_map['largura'] = col
-                elif not col_map['altura'] and col_lower in possible_alt_cols:
-                    col_map['altura'] = col
-                elif not col_map['quantidade'] and col_lower in possible_quant_cols:
-                    col_map['quantidade'] = col
-                    
-            # Verifica se todas as colunas foram encontradas
-            if not all(col_map.values()):
-                missing = [k for k, v in col_map.items() if v is None]
-                messagebox.showerror(
-                    "Erro de Importação",
-                    f"Não foi possível encontrar as colunas: {', '.join(missing)}.\n"
-                    f"Verifique se o Excel contém colunas como '{std_id_col}', "
-                    f"'{std_alt_col}', '{std_larg_col}', '{std_quant_col}'."
-                )
+            try:
+                novas_pecas, avisos = ler_pecas_excel(filepath)
+            except ValueError as ve:
+                messagebox.showerror("Erro de Importação", str(ve))
                 return
-                
-            # Processa as peças
-            novas_pecas = []
-            temp_proximo_id_original = 0
-            
-            for index, row in df.iterrows():
-                try:
-                    peca_id = str(row[col_map['id']])
-                    largura = int(row[col_map['largura']])
-                    altura = int(row[col_map['altura']])
-                    quantidade = int(row[col_map['quantidade']])
-                    
-                    if largura <= 0 or altura <= 0 or quantidade <= 0:
-                        raise ValueError(
-                            f"Dados inválidos na linha {index+2}: "
-                            "Dimensões/quantidade devem ser positivas."
-                        )
-                        
-                    novas_pecas.append({
-                        'id': peca_id,
-                        'larg': largura,
-                        'alt': altura,
-                        'quant': quantidade,
-                        'original_idx': temp_proximo_id_original,
-                        'id_display': peca_id
-                    })
-                    temp_proximo_id_original += 1
-                    
-                except ValueError as ve:
-                    messagebox.showwarning(
-                        "Aviso de Importação",
-                        f"Ignorando linha {index+2} do Excel: {ve}"
-                    )
-                    continue
-                except KeyError as ke:
-                    messagebox.showwarning(
-                        "Aviso de Importação",
-                        f"Ignorando linha {index+2} do Excel: coluna {ke} não encontrada."
-                    )
-                    continue
+
+            for aviso in avisos:
+                messagebox.showwarning("Aviso de Importação", aviso)
                     
             if novas_pecas:
                 self.pecas_a_cortar = novas_pecas
-                self.proximo_id_original = temp_proximo_id_original
+                self.proximo_id_original = len(novas_pecas)
                 
                 self.atualizar_treeview_pecas()
                 self.atualizar_visualizacao_e_otimizar()
@@ -754,10 +835,10 @@ class CorteGUI:
                                  "Não há peças na lista para exportar.")
             return
             
-        col_id = 'ID/Nome da Peça'
-        col_alt = 'Altura (cm)'
-        col_larg = 'Largura (cm)'
-        col_quant = 'Quantidade'
+        col_id = COLUNA_ID
+        col_alt = COLUNA_ALTURA
+        col_larg = COLUNA_LARGURA
+        col_quant = COLUNA_QUANTIDADE
         
         dados_para_exportar = []
         for peca in self.pecas_a_cortar:
@@ -765,7 +846,7 @@ class CorteGUI:
                 col_id: peca.get('id_display', peca.get('id', '')),
                 col_alt: peca['alt'],
                 col_larg: peca['larg'],
-                col_quant: peca['quant']
+                col_quant: peca.get('quant', 1)
             })
             
         df = pd.DataFrame(dados_para_exportar,
@@ -788,6 +869,32 @@ class CorteGUI:
             messagebox.showerror("Erro ao Exportar",
                                f"Não foi possível exportar a lista de peças.\nErro: {e}")
 
+    def exportar_plano_corte(self):
+        """Exporta o plano de corte atual em PDF ou SVG, uma chapa por página."""
+        if not self.resultado_cortes_otimizado:
+            messagebox.showwarning("Exportar Plano de Corte",
+                                 "Não há plano de corte para exportar. Execute a otimização primeiro.")
+            return
+            
+        try:
+            filepath = filedialog.asksaveasfilename(
+                defaultextension=".pdf",
+                filetypes=[("PDF", "*.pdf"), ("SVG", "*.svg")],
+                title="Exportar Plano de Corte como...",
+                initialdir=os.getcwd()
+            )
+            
+            if filepath:
+                arquivos = exportar_plano_corte(
+                    filepath, self.resultado_cortes_otimizado,
+                    self.canvas_view.largura_chapa, self.canvas_view.altura_chapa)
+                messagebox.showinfo("Sucesso",
+                                  f"Plano de corte exportado em {len(arquivos)} arquivo(s):\n{arquivos[0]}")
+                                  
+        except Exception as e:
+            messagebox.showerror("Erro ao Exportar",
+                               f"Não foi possível exportar o plano de corte.\nErro: {e}")
+
     def selecionar_peca_canvas(self, peca):
         """Seleciona uma peça no canvas e destaca no menu."""
         # Encontra o índice da peça na lista
@@ -852,6 +959,7 @@ class CorteGUI:
         if not tem_pecas:
             self.canvas_view.peca_selecionada = None
             self.canvas_view.peca_em_redimensionamento = None
+            self.canvas_view.chapa_em_redimensionamento = None
             self.canvas_view.borda_redimensionamento = None
             self.canvas_view.dimensoes_iniciais = None
             self.canvas_view._redesenhar()
@@ -867,7 +975,8 @@ class CorteGUI:
                         'id': peca['id'],
                         'larg': peca['larg'],
                         'alt': peca['alt'],
-                        'quant': peca.get('quant', 1)
+                        'quant': peca.get('quant', 1),
+                        'pode_rotacionar': peca.get('pode_rotacionar', True)
                     }
                     messagebox.showinfo("Copiar", "Peça copiada com sucesso!")
                     break
@@ -0,0 +1,115 @@
+import threading
+import time
+
+from gui.execucao import OtimizacaoEmSegundoPlano
+
+
+class MasterFalso:
+    """Substituto do widget Tk: guarda os after e os executa sob demanda."""
+
+    def __init__(self):
+        self.agendados = {}
+        self._ultimo_id = 0
+
+    def after(self, ms, funcao):
+        self._ultimo_id += 1
+        id_after = f'after#{self._ultimo_id}'
+        self.agendados[id_after] = (ms, funcao)
+        return id_after
+
+    def after_cancel(self, id_after):
+        del self.agendados[id_after]
+
+    def executar(self):
+        """Executa os callbacks agendados até agora, como o laço do Tk."""
+        for id_after in list(self.agendados):
+            _, funcao = self.agendados.pop(id_after)
+            funcao()
+
+    def executar_ate(self, condicao, limite: float = 5.0):
+        fim = time.monotonic() + limite
+        while not condicao():
+            assert time.monotonic() < fim, "o resultado não chegou"
+            self.executar()
+            time.sleep(0.005)
+
+
+def criar(funcao):
+    master = MasterFalso()
+    eventos = {'concluidos': [], 'dispensados': [], 'estados': []}
+    execucao = OtimizacaoEmSegundoPlano(
+        master, funcao,
+        ao_concluir=lambda resultado, contexto: eventos['concluidos'].append((resultado, contexto)),
+        ao_dispensar=eventos['dispensados'].append,
+        ao_mudar_estado=eventos['estados'].append)
+    return master, execucao, eventos
+
+
+def test_chave_repetida_e_dispensada():
+    chamadas = []
+    master, execucao, eventos = criar(lambda x: chamadas.append(x) or x * 2)
+
+    # Uma rajada vira um único after, e só o último pedido dela é executado
+    execucao.agendar((1,), contexto='a', chave=1)
+    execucao.agendar((2,), contexto='b', chave=2)
+    assert len(master.agendados) == 1
+    assert next(iter(master.agendados.values()))[0] == execucao.ATRASO_AGENDAMENTO_MS
+    master.executar_ate(lambda: eventos['concluidos'])
+    assert eventos['concluidos'] == [(4, 'b')]
+
+    execucao.agendar((2,), contexto='c', chave=2)
+    master.executar()
+    assert eventos['dispensados'] == ['c']
+    assert chamadas == [2]
+    assert not execucao.ocupado
+
+
+def test_geracao_obsoleta_e_descartada():
+    liberar = threading.Event()
+    chamadas = []
+
+    def funcao(x):
+        chamadas.append(x)
+        if x == 1:
+            liberar.wait(5)
+        return x * 10
+
+    master, execucao, eventos = criar(funcao)
+    execucao.solicitar((1,), contexto='antigo')
+    execucao.solicitar((2,), contexto='intermediario')
+    execucao.solicitar((3,), contexto='ultimo')
+    liberar.set()
+    master.executar_ate(lambda: not execucao.ocupado)
+
+    # O resultado antigo não é entregue e o intermediário nunca roda
+    assert eventos['concluidos'] == [(30, 'ultimo')]
+    assert chamadas == [1, 3]
+    assert eventos['estados'] == [True, False]
+
+
+def test_cancelar_antes_da_entrega():
+    chamadas = []
+    master, execucao, eventos = criar(lambda x: chamadas.append(x) or x)
+
+    # Pedido agendado: o after é desfeito e a função não roda
+    execucao.agendar((1,), chave=1)
+    execucao.cancelar()
+    assert not master.agendados
+    assert not execucao.ocupado
+
+    # Resultado já calculado, mas ainda não consultado: é descartado
+    execucao.solicitar((2,), contexto='cancelado', chave=2)
+    fim = time.monotonic() + 5
+    while execucao._resultados.empty():
+        assert time.monotonic() < fim
+        time.sleep(0.005)
+    execucao.cancelar(chave_atual=3)
+    master.executar_ate(lambda: not execucao.ocupado)
+    assert chamadas == [2]
+    assert eventos['concluidos'] == []
+    assert eventos['estados'] == [True, False]
+
+    # A chave informada ao cancelar já está em uso: pedidos com ela são dispensados
+    execucao.agendar((3,), contexto='em uso', chave=3)
+    master.executar()
+    assert eventos['dispensados'] == ['em uso']
@@ -0,0 +1,78 @@
+"""
+Exportação do plano de corte em PDF ou SVG, uma chapa por página.
+
+As páginas são geradas uma a uma na mesma figura, que é limpa entre elas, e
+gravadas assim que ficam prontas: a memória usada não cresce com a
+quantidade de chapas.
+"""
+import os
+
+from matplotlib import rc_context
+from matplotlib.backends.backend_pdf import PdfPages
+from matplotlib.figure import Figure
+
+from .visualizacao import plotar_chapas_na_figura
+
+FORMATOS_PLANO = ('pdf', 'svg')
+# Sem isso o SVG desenha os textos como contornos, que não dão para
+# selecionar nem buscar
+OPCOES_SVG = {'svg.fonttype': 'none'}
+# Página A4 deitada, em polegadas
+TAMANHO_PAGINA = (11.69, 8.27)
+
+
+def exportar_plano_corte(caminho, chapas, largura_chapa, altura_chapa,
+                         formato=None, tamanho_pagina=TAMANHO_PAGINA):
+    """
+    Grava o plano de corte com uma chapa por página.
+
+    O PDF tem todas as páginas em um só arquivo. Como SVG não tem páginas,
+    cada chapa vira um arquivo <nome>_<n>.svg ao lado do caminho pedido
+    (ou o próprio caminho, se houver uma só chapa).
+
+    Args:
+        caminho (str): Arquivo de saída
+        chapas (iterable): Chapas com suas peças alocadas (pode ser um gerador)
+        largura_chapa (float): Largura da chapa
+        altura_chapa (float): Altura da chapa
+        formato (str): 'pdf' ou 'svg' (padrão: a extensão do caminho)
+        tamanho_pagina (tuple): Largura e altura da página em polegadas
+
+    Returns:
+        list: Caminhos dos arquivos gravados
+    """
+    if formato is None:
+        formato = os.path.splitext(caminho)[1].lstrip('.').lower()
+    if formato not in FORMATOS_PLANO:
+        raise ValueError(f"Formato desconhecido: {formato}. Opções: {', '.join(FORMATOS_PLANO)}.")
+
+    # Figura fora do pyplot: não fica registrada nem é desenhada na tela
+    figura = Figure(figsize=tamanho_pagina)
+    if formato == 'pdf':
+        with PdfPages(caminho) as pdf:
+            paginas = 0
+            for chapa in chapas:
+                plotar_chapas_na_figura(figura, [chapa], largura_chapa, altura_chapa)
+                pdf.savefig(figura)
+                paginas += 1
+            if not paginas:
+                plotar_chapas_na_figura(figura, [], largura_chapa, altura_chapa)
+                pdf.savefig(figura)
+        return [caminho]
+
+    base, extensao = os.path.splitext(caminho)
+    gravados = []
+    with rc_context(OPCOES_SVG):
+        for i, chapa in enumerate(chapas, 1):
+            plotar_chapas_na_figura(figura, [chapa], largura_chapa, altura_chapa)
+            saida = f"{base}_{i}{extensao or '.svg'}"
+            figura.savefig(saida, format='svg')
+            gravados.append(saida)
+        if len(gravados) == 1:
+            os.replace(gravados[0], caminho)
+            gravados = [caminho]
+        elif not gravados:
+            plotar_chapas_na_figura(figura, [], largura_chapa, altura_chapa)
+            figura.savefig(caminho, format='svg')
+            gravados = [caminho]
+    return gravados
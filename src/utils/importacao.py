@@ -0,0 +1,103 @@
+"""
+Leitura de listas de peças em planilhas Excel.
+
+Usada tanto pela interface gráfica quanto pelo processamento em lote, para
+que as duas aceitem os mesmos nomes de colunas.
+"""
+import pandas as pd
+
+# Nomes de coluna padrão, usados também na exportação da lista de peças
+COLUNA_ID = 'ID/Nome da Peça'
+COLUNA_ALTURA = 'Altura (cm)'
+COLUNA_LARGURA = 'Largura (cm)'
+COLUNA_QUANTIDADE = 'Quantidade'
+
+# Nomes aceitos para cada coluna (comparados em minúsculas)
+NOMES_COLUNAS = {
+    'id': [COLUNA_ID.lower(), 'id', 'nome', 'id peça', 'id_peca', 'id/nome'],
+    'largura': [COLUNA_LARGURA.lower(), 'largura', 'larg'],
+    'altura': [COLUNA_ALTURA.lower(), 'altura', 'alt'],
+    'quantidade': [COLUNA_QUANTIDADE.lower(), 'qtd.', 'qtd', 'quant'],
+}
+
+
+def mapear_colunas(colunas) -> dict:
+    """
+    Identifica as colunas de id, largura, altura e quantidade da planilha.
+
+    Args:
+        colunas: Nomes das colunas da planilha
+
+    Returns:
+        Dicionário de cada campo para o nome da coluna correspondente
+
+    Raises:
+        ValueError: Se alguma das colunas não for encontrada
+    """
+    col_map = {campo: None for campo in NOMES_COLUNAS}
+    for col in colunas:
+        col_lower = str(col).lower()
+        for campo, nomes in NOMES_COLUNAS.items():
+            if not col_map[campo] and col_lower in nomes:
+                col_map[campo] = col
+                break
+
+    if not all(col_map.values()):
+        missing = [k for k, v in col_map.items() if v is None]
+        raise ValueError(
+            f"Não foi possível encontrar as colunas: {', '.join(missing)}.\n"
+            f"Verifique se o Excel contém colunas como '{COLUNA_ID}', "
+            f"'{COLUNA_ALTURA}', '{COLUNA_LARGURA}', '{COLUNA_QUANTIDADE}'."
+        )
+    return col_map
+
+
+def ler_pecas_excel(caminho: str) -> tuple:
+    """
+    Lê a lista de peças de um arquivo Excel.
+
+    Linhas com dados inválidos são ignoradas e descritas nos avisos.
+
+    Args:
+        caminho: Caminho do arquivo Excel
+
+    Returns:
+        Tuple contendo:
+        - Lista de peças (dicionários com id, larg, alt, quant, original_idx
+          e id_display)
+        - Lista de avisos sobre as linhas ignoradas
+
+    Raises:
+        ValueError: Se as colunas necessárias não forem encontradas
+    """
+    df = pd.read_excel(caminho)
+    col_map = mapear_colunas(df.columns)
+
+    pecas = []
+    avisos = []
+    for index, row in df.iterrows():
+        try:
+            peca_id = str(row[col_map['id']])
+            largura = int(row[col_map['largura']])
+            altura = int(row[col_map['altura']])
+            quantidade = int(row[col_map['quantidade']])
+
+            if largura <= 0 or altura <= 0 or quantidade <= 0:
+                raise ValueError(
+                    f"Dados inválidos na linha {index+2}: "
+                    "Dimensões/quantidade devem ser positivas."
+                )
+
+            pecas.append({
+                'id': peca_id,
+                'larg': largura,
+                'alt': altura,
+                'quant': quantidade,
+                'original_idx': len(pecas),
+                'id_display': peca_id
+            })
+        except ValueError as ve:
+            avisos.append(f"Ignorando linha {index+2} do Excel: {ve}")
+        except KeyError as ke:
+            avisos.append(f"Ignorando linha {index+2} do Excel: coluna {ke} não encontrada.")
+    return pecas, avisos
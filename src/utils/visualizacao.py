@@ -1,21 +1,83 @@
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
+from functools import lru_cache
 
-def plotar_chapas_na_figura(figura, chapas_utilizadas, largura_chapa, altura_chapa):
+import numpy as np
+from matplotlib.collections import PolyCollection
+from matplotlib.font_manager import FontProperties
+from matplotlib.textpath import text_to_path
+
+# Acima desta quantidade de peças em uma chapa, os rótulos são omitidos
+MAX_ROTULOS_POR_CHAPA = 300
+# Peças menores que esta fração da chapa (em cada direção) ficam sem rótulo
+FRACAO_MIN_ROTULO = 0.04
+# Espaço entre as chapas na figura, em fração da maior chapa
+ESPACAMENTO_CHAPAS = 0.08
+# Tamanho máximo dos rótulos das peças, em pontos
+TAMANHO_ROTULO = 8
+# Rótulos que só caberiam na peça com menos que isto (em pontos) são omitidos
+TAMANHO_MIN_ROTULO = 4
+
+
+def _retangulos(x, y, w, h):
+    """Vértices (n, 4, 2) dos retângulos, para uma PolyCollection."""
+    return np.stack([
+        np.column_stack((x, y)),
+        np.column_stack((x + w, y)),
+        np.column_stack((x + w, y + h)),
+        np.column_stack((x, y + h)),
+    ], axis=1)
+
+
+@lru_cache(maxsize=512)
+def _avanco(caractere):
+    """Largura de um caractere no tamanho 1, em pontos."""
+    return text_to_path.get_text_width_height_descent(
+        caractere, FontProperties(size=1), ismath=False)[0]
+
+
+def _tamanho_rotulo(texto, largura, altura, pontos_por_unidade):
+    """
+    Tamanho da fonte (em pontos) para o texto caber em 90% da peça.
+
+    A largura do texto é estimada pela soma das larguras dos caracteres,
+    que ficam em cache; medir cada texto com o renderizador custaria mais
+    que desenhá-lo.
+
+    Returns:
+        O tamanho, limitado a TAMANHO_ROTULO, ou None se ficar abaixo de
+        TAMANHO_MIN_ROTULO
+    """
+    largura_texto = sum(_avanco(c) for c in texto)
+    if not largura_texto:
+        return None
+    tamanho = min(TAMANHO_ROTULO,
+                  0.9 * largura * pontos_por_unidade / largura_texto,
+                  0.9 * altura * pontos_por_unidade)
+    return tamanho if tamanho >= TAMANHO_MIN_ROTULO else None
+
+
+def plotar_chapas_na_figura(figura, chapas_utilizadas, largura_chapa, altura_chapa,
+                            rotulos=True):
     """
     Plota as chapas e peças na figura matplotlib.
+
+    Todas as chapas ficam lado a lado em um único eixo, e as peças de cada
+    chapa são desenhadas como uma única coleção de polígonos. Criar um eixo
+    por chapa e um retângulo por peça tornava o desenho lento demais para
+    trabalhos grandes. Os rótulos continuam sendo textos (selecionáveis no
+    PDF e no SVG), mas só nas peças em que cabem com um tamanho legível.
     
     Args:
         figura (matplotlib.figure.Figure): Figura onde será feito o plot
         chapas_utilizadas (list): Lista de chapas com suas peças alocadas
         largura_chapa (int): Largura da chapa em centímetros
         altura_chapa (int): Altura da chapa em centímetros
+        rotulos (bool): Se False, não escreve o ID das peças
     """
     figura.clear()
     n_chapas = len(chapas_utilizadas)
+    ax = figura.add_subplot(111)
     
     if n_chapas == 0:
-        ax = figura.add_subplot(111)
         ax.text(0.5, 0.5, "Nenhuma peça foi alocada.",
                 horizontalalignment='center', verticalalignment='center',
                 transform=ax.transAxes)
@@ -25,43 +87,61 @@ def plotar_chapas_na_figura(figura, chapas_utilizadas, largura_chapa, altura_cha
 
     n_cols = min(3, n_chapas)
     n_rows = (n_chapas + n_cols - 1) // n_cols
+    
+    # Cada chapa ocupa uma célula da grade, com espaço para o título
+    medidas_chapas = [(chapa.get('largura', largura_chapa), chapa.get('altura', altura_chapa))
+                      for chapa in chapas_utilizadas]
+    maior_largura = max(l for l, _ in medidas_chapas)
+    maior_altura = max(a for _, a in medidas_chapas)
+    espaco = ESPACAMENTO_CHAPAS * max(maior_largura, maior_altura)
+    celula_x = maior_largura + espaco
+    celula_y = maior_altura + 2 * espaco
+    origens = [((idx % n_cols) * celula_x, (n_rows - 1 - idx // n_cols) * celula_y)
+               for idx in range(n_chapas)]
+    
+    # Desenha o contorno das chapas
+    cx, cy = np.array(origens, dtype=float).T
+    cw, ch = np.array(medidas_chapas, dtype=float).T
+    ax.add_collection(PolyCollection(
+        _retangulos(cx, cy, cw, ch), linewidths=1, edgecolors='black', facecolors='none'))
 
-    for idx, chapa in enumerate(chapas_utilizadas):
-        ax = figura.add_subplot(n_rows, n_cols, idx + 1)
-        
-        # Desenha a chapa
-        rect = patches.Rectangle((0, 0), largura_chapa, altura_chapa,
-                                linewidth=1, edgecolor='black', facecolor='none')
-        ax.add_patch(rect)
+    # Escala do eixo na figura, para medir os rótulos em pontos
+    largura_fig, altura_fig = figura.get_size_inches()
+    pontos_por_unidade = 72 * min(0.98 * largura_fig / (n_cols * celula_x),
+                                  0.98 * altura_fig / (n_rows * celula_y))
+
+    for chapa, (ox, oy), (largura, altura) in zip(chapas_utilizadas, origens, medidas_chapas):
+        ax.text(ox + largura/2, oy + altura + espaco/2, f'Chapa {chapa["id_chapa"]}',
+                horizontalalignment='center', verticalalignment='center')
         
-        # Desenha as peças
-        for peca in chapa['pecas_alocadas']:
-            rect = patches.Rectangle(
-                (peca['x'], peca['y']),
-                peca['largura'],
-                peca['altura'],
-                linewidth=1,
-                edgecolor='black',
-                facecolor='lightblue',
-                alpha=0.5
-            )
-            ax.add_patch(rect)
-            
-            # Adiciona o ID da peça
-            ax.text(
-                peca['x'] + peca['largura']/2,
-                peca['y'] + peca['altura']/2,
-                peca['id'],
-                horizontalalignment='center',
-                verticalalignment='center',
-                fontsize=8
-            )
+        # Desenha as peças de uma vez, como uma coleção de retângulos
+        pecas = chapa['pecas_alocadas']
+        if not pecas:
+            continue
+        x, y, w, h = np.array([(p['x'], p['y'], p['largura'], p['altura']) for p in pecas],
+                              dtype=float).T
+        x += ox
+        y += oy
+        ax.add_collection(PolyCollection(
+            _retangulos(x, y, w, h), linewidths=1, edgecolors='black',
+            facecolors='lightblue', alpha=0.5))
         
-        ax.set_title(f'Chapa {chapa["id_chapa"]}')
-        ax.set_xlim(0, largura_chapa)
-        ax.set_ylim(0, altura_chapa)
-        ax.set_aspect('equal')
-        ax.grid(True)
+        # Adiciona o ID das peças grandes o bastante para o texto
+        if rotulos and len(pecas) <= MAX_ROTULOS_POR_CHAPA:
+            visiveis = np.flatnonzero((w >= largura * FRACAO_MIN_ROTULO) &
+                                      (h >= altura * FRACAO_MIN_ROTULO))
+            for i in visiveis:
+                texto = str(pecas[i]['id'])
+                tamanho = _tamanho_rotulo(texto, w[i], h[i], pontos_por_unidade)
+                if tamanho is None:
+                    continue
+                ax.text(x[i] + w[i]/2, y[i] + h[i]/2, texto,
+                        horizontalalignment='center', verticalalignment='center',
+                        fontsize=tamanho)
         
-    figura.tight_layout()
-    figura.canvas.draw_idle() 
\ No newline at end of file
+    ax.set_xlim(-espaco/2, n_cols * celula_x - espaco/2)
+    ax.set_ylim(-espaco/2, n_rows * celula_y - espaco/2)
+    ax.set_aspect('equal')
+    ax.set_axis_off()
+    figura.subplots_adjust(left=0.01, right=0.99, bottom=0.01, top=0.99)
+    figura.canvas.draw_idle()